@@ -5,14 +5,16 @@ FitGirl Downloader - Web Application
 Flask server for the web application
 """
 
-from flask import Flask, render_template, jsonify, request, send_from_directory
-from flask_socketio import SocketIO, emit
+from flask import Flask, render_template, jsonify, request, send_from_directory, send_file, g
+from flask_socketio import SocketIO, emit, join_room, leave_room, rooms
 import sys
 import os
 import logging
 from datetime import datetime
 import json
+import hmac
 import threading
+import time
 import traceback
 
 # Add the backend directory to the path
@@ -22,21 +24,56 @@ from backend.json_database_manager import JsonDatabaseManager
 from backend.settings_manager import SettingsManager
 from backend.x1337_scraper import X1337Scraper
 from backend.game_release import ReleaseStatus
+from backend.response_serializer import ResponseSerializer, FastJSONProvider
+from backend.compression import ResponseCompressor
+from backend.server_runner import resolve_async_mode
+from backend.job_manager import JobManager
+from backend.bulk_resync import BulkResyncRunner
+from backend.image_backfill import ImageBackfillWorker
+from backend.progress_aggregator import ProgressAggregator
+from backend.event_batcher import EventBatcher
+from backend.event_log import EventLog
+from backend import event_channels
+from backend.metrics import REGISTRY, LONG_BUCKETS, start_server_timing, stop_server_timing
+from backend.profiler import Profiler, ARTIFACT_FORMATS
+from backend.log_pipeline import configure_logging, get_category_logger
+from backend.memory_inspector import MemoryInspector, resident_memory_bytes
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# Sync progress messages are sampled (log_sample_rates)
+progress_logger = get_category_logger(__name__, 'progress')
 
-app = Flask(__name__)
+# Static files are served by static_files() so precompressed variants can be used
+app = Flask(__name__, static_folder=None)
 app.config['SECRET_KEY'] = 'fitgirl-downloader-secret-key-2025'
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Bound to the app in initialize_components() once the async mode is known
+socketio = SocketIO()
+
+STATIC_DIR = os.path.join(app.root_path, 'static')
 
 # Global variables
 db_manager = None
 settings_manager = None
 scraper = None
+response_serializer = None
+response_compressor = None
+job_manager = None
+release_batcher = None
+profiler = None
+image_backfill = None
+# Set once initialize_components() succeeded; later calls keep the existing components
+components_initialized = False
+# Recent broadcast events, replayed to Server-Sent Events clients
+event_log = EventLog()
+# tracemalloc snapshots taken through /api/memory
+memory_inspector = MemoryInspector()
 sync_in_progress = False
-sync_progress = {
+# Report of the most recent synchronization run (see /api/sync/last_run)
+last_sync_run = None
+# Latest synchronization progress, broadcast at a bounded rate
+sync_progress = ProgressAggregator({
     'status': 'idle',
     'current_page': 0,
     'total_pages': 0,
@@ -45,25 +82,119 @@ sync_progress = {
     'new_releases': 0,
     'updated_releases': 0,
     'message': ''
-}
+})
+
+# Metrics exposed on /metrics
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    'fitgirl_http_request_duration_seconds', 'HTTP request latency by route',
+    ['method', 'route', 'status'])
+API_FILTER_SECONDS = REGISTRY.histogram(
+    'fitgirl_api_filter_duration_seconds', 'Time spent filtering and paginating releases in API handlers',
+    ['route'], server_timing='filter')
+WEBSOCKET_EVENTS = REGISTRY.counter(
+    'fitgirl_websocket_events_emitted_total', 'Events published to WebSocket channels', ['event'])
+SYNC_RUN_SECONDS = REGISTRY.histogram(
+    'fitgirl_sync_run_duration_seconds', 'Duration of complete synchronization runs', ['outcome'],
+    buckets=LONG_BUCKETS)
+REGISTRY.counter('fitgirl_fragment_cache_hits_total', 'Release fragment cache hits',
+                 callback=lambda: response_serializer.hits if response_serializer else None)
+REGISTRY.counter('fitgirl_fragment_cache_misses_total', 'Release fragment cache misses',
+                 callback=lambda: response_serializer.misses if response_serializer else None)
+REGISTRY.gauge('fitgirl_fragment_cache_hit_ratio', 'Release fragment cache hit ratio',
+               callback=lambda: fragment_cache_hit_ratio())
+REGISTRY.counter('fitgirl_sync_progress_updates_total', 'Synchronization progress updates received',
+                 callback=lambda: sync_progress.updates)
+REGISTRY.counter('fitgirl_sync_progress_emits_total', 'Synchronization progress snapshots broadcast',
+                 callback=lambda: sync_progress.emits)
+REGISTRY.gauge('fitgirl_sync_in_progress', 'Whether a synchronization is running',
+               callback=lambda: int(sync_in_progress))
+REGISTRY.gauge('fitgirl_background_jobs_active', 'Queued or running background jobs',
+               callback=lambda: len(job_manager.list_jobs(active_only=True)) if job_manager else None)
+REGISTRY.gauge('fitgirl_releases', 'Releases in the database by status', ['status'],
+               callback=lambda: db_manager.get_status_counts() if db_manager else None)
+REGISTRY.gauge('fitgirl_process_resident_memory_bytes', 'Resident memory of the process',
+               callback=resident_memory_bytes)
+
+def fragment_cache_hit_ratio():
+    """Fragment cache hit ratio, or None before the first lookup"""
+    if not response_serializer:
+        return None
+    lookups = response_serializer.hits + response_serializer.misses
+    return response_serializer.hits / lookups if lookups else None
 
 def initialize_components():
     """Initialize system components"""
-    global db_manager, settings_manager, scraper
+    global db_manager, settings_manager, scraper, response_serializer, response_compressor, job_manager, release_batcher, event_log, profiler, image_backfill
+    global components_initialized
+    
+    # Importing the module already initializes; a second set of managers and
+    # background workers would write a stale copy of the database
+    if components_initialized:
+        return True
     
     try:
         # Initialize managers
         settings_manager = SettingsManager()
         settings_manager.load_settings()
         
+        # Log through a background queue, sampling high-volume categories
+        configure_logging(
+            level=settings_manager.get_log_level(),
+            log_to_file=settings_manager.settings.log_to_file,
+            max_log_files=settings_manager.settings.max_log_files,
+            sample_rates=settings_manager.settings.log_sample_rates,
+            verbose=settings_manager.settings.log_verbose
+        )
+        
+        socketio.init_app(app, cors_allowed_origins="*",
+                          async_mode=resolve_async_mode(settings_manager.settings))
+        event_log = EventLog(settings_manager.settings.event_log_size)
+        sync_progress.set_max_rate(settings_manager.settings.progress_emit_hz)
+        sync_progress.set_emit_callback(emit_sync_progress)
+        
+        # New releases found during a sync reach clients as one event per window
+        release_batcher = EventBatcher(emit_new_releases, window=settings_manager.settings.release_event_window)
+        
+        # Route every JSON response through the fast serializer
+        response_serializer = ResponseSerializer(settings_manager.settings.json_backend)
+        app.json = FastJSONProvider(app, response_serializer)
+        
+        # Compress JSON and text assets, precompressing static files once
+        if settings_manager.settings.compression_enabled:
+            response_compressor = ResponseCompressor(
+                min_size=settings_manager.settings.compression_min_size,
+                level=settings_manager.settings.compression_level
+            )
+            response_compressor.precompress_directory(STATIC_DIR)
+        
         db_manager = JsonDatabaseManager()
         if not db_manager.initialize():
             logger.error("❌ Error initializing JSON database")
             return False
         
+        # Keep pre-serialized release fragments consistent with the database
+        db_manager.add_change_listener(response_serializer.on_release_changed)
+        
         scraper = X1337Scraper()
         scraper.initialize(settings_manager)
         
+        # Opt-in profiling of single requests (?profile=1) and sync runs
+        profiler = Profiler(settings_manager.settings.profile_dir, keep=settings_manager.settings.profile_keep)
+        
+        # Long-running operations (e.g. single release resync) run off the request thread
+        job_manager = JobManager(max_workers=settings_manager.settings.max_background_jobs)
+        job_manager.set_update_callback(emit_job_update)
+        
+        # Releases whose images need a browser are saved right away and imaged here
+        if settings_manager.settings.image_backfill_enabled:
+            image_backfill = ImageBackfillWorker(
+                db_manager, scraper, on_update=emit_release_updated,
+                interval=settings_manager.settings.image_backfill_interval,
+                delay=settings_manager.settings.image_backfill_delay
+            )
+            image_backfill.start()
+        
+        components_initialized = True
         logger.info("✅ Components initialized successfully")
         return True
         
@@ -71,15 +202,54 @@ def initialize_components():
         logger.error(f"❌ Error initializing components: {e}")
         return False
 
-# Initialize components when importing the module
-initialize_components()
-
 # WebSocket Events
+def apply_subscription(channels, status):
+    """Replace the channel rooms of the current client"""
+    for room in rooms():
+        if room != request.sid and event_channels.is_channel_room(room):
+            leave_room(room)
+    for room in event_channels.subscription_rooms(channels, status):
+        join_room(room)
+
 @socketio.on('connect')
-def handle_connect():
-    """Handle WebSocket connection"""
-    logger.info("🔌 WebSocket client connected")
-    emit('sync_progress', sync_progress)
+def handle_connect(auth=None):
+    """Handle WebSocket connection, subscribing to the channels in auth (default: all)"""
+    try:
+        channels, status = event_channels.parse_subscription(auth)
+    except ValueError as e:
+        logger.warning(f"⚠️ Invalid subscription on connect: {e}")
+        channels, status = list(event_channels.DEFAULT_CHANNELS), None
+    
+    apply_subscription(channels, status)
+    logger.info(f"🔌 WebSocket client connected ({', '.join(channels) or 'no channels'})")
+    if event_channels.SYNC_PROGRESS in channels:
+        emit('sync_progress', sync_progress.snapshot())
+
+@socketio.on('subscribe')
+def handle_subscribe(data):
+    """Replace the client's channel subscription"""
+    try:
+        channels, status = event_channels.parse_subscription(data)
+    except ValueError as e:
+        return {'success': False, 'error': str(e)}
+    
+    apply_subscription(channels, status)
+    logger.info(f"📻 Client subscribed to {', '.join(channels) or 'no channels'}"
+                f"{f' (status {status})' if status else ''}")
+    return {'success': True, 'channels': channels, 'status': status}
+
+@socketio.on('unsubscribe')
+def handle_unsubscribe(data):
+    """Leave some channels, or all of them if none are given"""
+    try:
+        channels, _ = event_channels.parse_subscription(data)
+    except ValueError as e:
+        return {'success': False, 'error': str(e)}
+    
+    for room in rooms():
+        if room != request.sid and room.split(':', 1)[0] in channels:
+            leave_room(room)
+    return {'success': True, 'channels': channels}
 
 @socketio.on('disconnect')
 def handle_disconnect():
@@ -89,29 +259,124 @@ def handle_disconnect():
 @socketio.on('get_sync_status')
 def handle_get_sync_status():
     """Send current synchronization status"""
-    emit('sync_progress', sync_progress)
+    emit('sync_progress', sync_progress.snapshot())
 
-def update_sync_progress(status, message, **kwargs):
-    """Update synchronization progress and emit to all clients"""
-    global sync_progress
+def publish_event(event, data, to):
+    """Send an event to WebSocket channel rooms and record it for SSE clients"""
+    socketio.emit(event, data, to=to)
+    event_log.append(event, data, [to] if isinstance(to, str) else to)
+    WEBSOCKET_EVENTS.inc(event=event)
+
+def emit_sync_progress(snapshot):
+    """Broadcast a coalesced progress snapshot to sync_progress subscribers"""
+    publish_event('sync_progress', snapshot, event_channels.SYNC_PROGRESS)
+
+def emit_new_releases(releases):
+    """Send a batch of newly inserted releases to new_releases subscribers"""
+    total_releases = db_manager.count_releases()
     
-    sync_progress.update({
-        'status': status,
-        'message': message,
-        **kwargs
-    })
+    # Unfiltered subscribers get the whole batch, status filtered ones their share
+    publish_event('new_release_added', {
+        'success': True,
+        'releases': releases,
+        'total_releases': total_releases
+    }, event_channels.NEW_RELEASES)
+    
+    by_status = {}
+    for release_data in releases:
+        by_status.setdefault(release_data['status'], []).append(release_data)
+    for status, status_releases in by_status.items():
+        publish_event('new_release_added', {
+            'success': True,
+            'releases': status_releases,
+            'total_releases': total_releases
+        }, event_channels.channel_room(event_channels.NEW_RELEASES, status))
+    
+    logger.info(f"📡 WebSocket event emitted for {len(releases)} new releases")
+
+def emit_release_status_changed(release, previous_status):
+    """Notify release_status subscribers interested in the old or the new status"""
+    publish_event('release_status_changed', {
+        'release_id': release.id,
+        'status': release.status.name,
+        'previous_status': previous_status.name,
+        'status_text': release.status_text,
+        'status_color': release.status_color
+    }, event_channels.status_rooms(event_channels.RELEASE_STATUS,
+                                   previous_status.name, release.status.name))
+
+def emit_release_updated(release):
+    """Send a release whose data changed in place (e.g. backfilled images) to release_updates subscribers"""
+    publish_event('release_updated', {
+        'release': release.to_dict()
+    }, event_channels.status_rooms(event_channels.RELEASE_UPDATES, release.status.name))
+
+def change_release_status(release_id, status):
+    """
+    Update the status of a release and notify subscribers
+    
+    Returns:
+        bool: True if the release was updated
+    """
+    release = db_manager.get_release_by_id(release_id)
+    if not release:
+        return False
     
-    socketio.emit('sync_progress', sync_progress)
-    logger.info(f"📊 Progress: {status} - {message}")
+    previous_status = release.status
+    if not db_manager.update_release_status(release_id, status):
+        return False
+    
+    release.status = status
+    try:
+        emit_release_status_changed(release, previous_status)
+    except Exception as e:
+        logger.warning(f"⚠️ Error emitting status change: {e}")
+    return True
 
-def sync_releases_worker():
-    """Worker for background synchronization"""
-    global sync_in_progress, sync_progress
+def update_sync_progress(status, message, **kwargs):
+    """Update synchronization progress; clients receive it at most progress_emit_hz times per second"""
+    sync_progress.update(status, message, **kwargs)
+    progress_logger.info("📊 Progress: %s - %s", status, message)
+
+def sync_stage_summary():
+    """Per-stage timing percentiles of the scraper's last run"""
+    timings = scraper.last_run_timings if scraper else None
+    return timings.summary() if timings else {}
+
+def build_sync_run_report(started_at, duration, outcome):
+    """Summary of a synchronization run for /api/sync/last_run"""
+    progress = sync_progress.snapshot()
+    return {
+        'started_at': started_at.isoformat(),
+        'finished_at': datetime.now().isoformat(),
+        'duration_seconds': round(duration, 2),
+        'outcome': outcome,
+        'message': progress.get('message', ''),
+        'new_releases': progress.get('new_releases', 0),
+        'updated_releases': progress.get('updated_releases', 0),
+        'skipped_releases': progress.get('skipped_releases', 0),
+        'stages': sync_stage_summary()
+    }
+
+def sync_releases_worker(profile=False):
+    """Worker for background synchronization, optionally under the profiler"""
+    global sync_in_progress, last_sync_run
     
+    run_started = time.perf_counter()
+    run_started_at = datetime.now()
+    outcome = 'completed'
+    profile_session = None
+    profile_info = None
     try:
+        if profile:
+            try:
+                profile_session = profiler.start('sync', thread_prefix='scrape')
+            except RuntimeError as e:
+                logger.warning(f"⚠️ Sync will run without profiling: {e}")
+        
         logger.info("🚀 Starting synchronization worker")
         sync_in_progress = True
-        update_sync_progress('starting', 'Starting synchronization...')
+        update_sync_progress('starting', 'Starting synchronization...', stage_timings={})
         
         logger.info("🔍 Getting existing releases...")
         # Get existing releases for comparison
@@ -141,7 +406,7 @@ def sync_releases_worker():
             """Check if URL already exists in database (fast lookup)"""
             exists = url in existing_urls
             if exists:
-                logger.info(f"⚡ Fast check: URL already exists: {url}")
+                logger.debug("⚡ Fast check: URL already exists: %s", url)
             return exists
         
         # Callback to verify and process releases
@@ -193,37 +458,23 @@ def sync_releases_worker():
                 existing_release_keys[release_key] = release
                 existing_urls.add(release.url)  # Add URL to quick lookup set
                 
-                # Emit WebSocket event to update the view in real time
-                try:
-                    # Get the newly inserted release with its ID
-                    inserted_release = db_manager.get_release_by_id(result)
-                    if inserted_release:
-                        # Convert to JSON format for the frontend
-                        release_data = {
-                            'id': inserted_release.id,
-                            'title': inserted_release.title,
-                            'description': inserted_release.short_description,
-                            'publish_date': inserted_release.formatted_date,
-                            'game_release_date': inserted_release.formatted_game_release_date,
-                            'status': inserted_release.status.name,
-                            'status_text': inserted_release.status_text,
-                            'status_color': inserted_release.status_color,
-                            'has_download_links': inserted_release.has_download_links,
-                            'image_count': inserted_release.image_count,
-                            'magnet_link': inserted_release.magnet_link,
-                            'cover_image_url': inserted_release.cover_image_url,
-                            'screenshot_urls': inserted_release.screenshot_urls
-                        }
-                        
-                        # Emit event to all connected clients
-                        socketio.emit('new_release_added', {
-                            'success': True,
-                            'release': release_data,
-                            'total_releases': len(db_manager.get_all_releases())
-                        })
-                        logger.info(f"📡 WebSocket event emitted for new release: {inserted_release.title}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Error emitting WebSocket event: {e}")
+                # Queue the release for the next batched WebSocket event
+                # (insert_release assigned its ID, so no re-read is needed)
+                release_batcher.add({
+                    'id': release.id,
+                    'title': release.title,
+                    'description': release.short_description,
+                    'publish_date': release.formatted_date,
+                    'game_release_date': release.formatted_game_release_date,
+                    'status': release.status.name,
+                    'status_text': release.status_text,
+                    'status_color': release.status_color,
+                    'has_download_links': release.has_download_links,
+                    'image_count': release.image_count,
+                    'magnet_link': release.magnet_link,
+                    'cover_image_url': release.cover_image_url,
+                    'screenshot_urls': release.screenshot_urls
+                })
                 
                 update_sync_progress('processing', f'New release added: {release.title}', 
                                    new_releases=new_releases, updated_releases=updated_releases,
@@ -244,19 +495,39 @@ def sync_releases_worker():
         is_first_sync = len(existing_releases) == 0 or settings_manager.settings.last_sync_check is None
         logger.info(f"🆕 First synchronization: {is_first_sync}")
         
-        if is_first_sync:
-            logger.info("📥 Starting first synchronization (100 pages)...")
-            update_sync_progress('scraping', 'First synchronization - downloading 100 pages (1337x maximum)...', total_pages=100)
-            # For first synchronization, download 100 pages (1337x maximum)
+        if is_first_sync and settings_manager.settings.full_sync_completed:
+            # The database was emptied: the full walk has to succeed again
+            settings_manager.settings.full_sync_completed = False
+            settings_manager.save_settings()
+        
+        # The early stop only skips releases that an earlier complete walk already saw
+        full_walk = is_first_sync or not settings_manager.settings.full_sync_completed
+        if full_walk:
+            logger.info("📥 Starting full synchronization (100 pages)...")
+            message = 'First synchronization' if is_first_sync else 'Resuming the interrupted first synchronization'
+            update_sync_progress('scraping', f'{message} - downloading 100 pages (1337x maximum)...', total_pages=100)
+            # Until one walk reads all 100 pages (1337x maximum), read every page
             releases = scraper.get_releases_from_pages(1, 100)
+            if scraper.last_listing_complete:
+                settings_manager.settings.full_sync_completed = True
+                settings_manager.save_settings()
+                logger.info("✅ Full listing walk completed, later syncs stop at known pages")
+            else:
+                logger.warning("⚠️ Listing walk ended early, the next sync reads every page again")
         else:
-            logger.info("🔄 Starting incremental synchronization (100 pages)...")
-            update_sync_progress('scraping', 'Incremental synchronization - downloading first 100 pages...', total_pages=2)
-            # For incremental synchronization, download only 100 pages
-            releases = scraper.get_releases_from_pages(1, 100)
+            stop_pages = settings_manager.settings.incremental_stop_pages
+            logger.info(f"🔄 Starting incremental synchronization (stops after {stop_pages} known pages)...")
+            update_sync_progress('scraping', 'Incremental synchronization - downloading newest pages...', total_pages=100)
+            # New uploads are on the first pages: stop once whole listing pages are already known
+            releases = scraper.get_releases_from_pages(1, 100, stop_after_known_pages=stop_pages,
+                                                       rejected_urls=db_manager.get_rejected_urls())
+        
+        # Entries that could not be stored don't hold back the next incremental early stop
+        db_manager.update_rejected_urls(scraper.last_rejected_urls, [release.url for release in releases])
         
         # Verify what was obtained from the scraper
         logger.info(f"🔍 Scraper returned {len(releases)} releases")
+        release_batcher.flush()
         if not releases:
             logger.warning("⚠️ No releases were obtained from the scraper")
             update_sync_progress('completed', 'No new releases found')
@@ -266,35 +537,102 @@ def sync_releases_worker():
         settings_manager.settings.last_sync_check = datetime.now()
         settings_manager.save_settings()
         
-        # Complete synchronization
+        # Complete synchronization, including where the scrape time went
+        stage_timings = sync_stage_summary()
+        if scraper.last_run_timings:
+            logger.info(f"⏱️ Scrape stage timings (seconds):\n{scraper.last_run_timings.format_table()}")
         update_sync_progress('completed', f'Synchronization completed: {new_releases} new, {updated_releases} updated, {skipped_releases} skipped', 
-                           new_releases=new_releases, updated_releases=updated_releases, skipped_releases=skipped_releases)
-        
-        # Close Selenium
-        try:
-            scraper.close()
-        except Exception as e:
-            logger.warning(f"⚠️ Error closing Selenium: {e}")
+                           new_releases=new_releases, updated_releases=updated_releases, skipped_releases=skipped_releases,
+                           stage_timings=stage_timings)
         
+        # Selenium drivers stay pooled for the backfill and the next sync; idle ones are reaped
         logger.info(f"✅ Synchronization completed: {new_releases} new, {updated_releases} updated, {skipped_releases} skipped")
         
     except Exception as e:
         logger.error(f"❌ Synchronization error: {e}")
         logger.error(f"❌ Full traceback: {traceback.format_exc()}")
+        if release_batcher:
+            release_batcher.flush()
         update_sync_progress('error', f'Synchronization error: {str(e)}')
-        
-        # Close Selenium in case of error too
-        try:
-            if 'scraper' in locals():
-                logger.info("🔒 Closing Selenium after error...")
-                scraper.close()
-        except Exception as selenium_error:
-            logger.warning(f"⚠️ Error closing Selenium after error: {selenium_error}")
+        outcome = 'error'
         
     finally:
         sync_in_progress = False
+        # Releases saved without their lazily loaded images are imaged now
+        if image_backfill:
+            image_backfill.notify()
+        run_duration = time.perf_counter() - run_started
+        SYNC_RUN_SECONDS.observe(run_duration, outcome=outcome)
+        if profile_session:
+            profile_info = profile_session.stop()
+        last_sync_run = build_sync_run_report(run_started_at, run_duration, outcome)
+        last_sync_run['profile'] = profile_info
         logger.info("🏁 Synchronization worker finished")
 
+def is_admin_request():
+    """
+    Check if the request may use administrative features
+    
+    With admin_token configured the request must send it in the X-Admin-Token
+    header; otherwise only requests from this machine are accepted.
+    """
+    admin_token = settings_manager.settings.admin_token if settings_manager else ""
+    if admin_token:
+        return hmac.compare_digest(request.headers.get('X-Admin-Token', '').encode(), admin_token.encode())
+    return request.remote_addr in ('127.0.0.1', '::1')
+
+def release_list_item(release):
+    """Build the /api/releases representation of a release"""
+    return {
+        'id': release.id,
+        'url': release.url,
+        'title': release.title,
+        'description': release.description,  # Use full description instead of short
+        'short_description': release.short_description,  # Keep short for backwards compatibility
+        'publish_date': release.formatted_date,
+        'game_release_date': release.formatted_game_release_date,
+        'size': release.size,
+        'status': release.status.name,
+        'status_text': release.status_text,
+        'status_color': release.status_color,
+        'has_download_links': release.has_download_links,
+        'image_count': release.image_count,
+        'magnet_link': release.magnet_link,
+        'cover_image_url': release.cover_image_url,
+        'screenshot_urls': release.screenshot_urls
+    }
+
+def release_search_item(release):
+    """Build the /api/search representation of a release"""
+    return {
+        'id': release.id,
+        'url': release.url,
+        'title': release.title,
+        'description': release.description,  # Use full description instead of short
+        'short_description': release.short_description,  # Keep short for backwards compatibility
+        'publish_date': release.formatted_date,
+        'size': release.size,
+        'status': release.status.name,
+        'status_text': release.status_text,
+        'status_color': release.status_color,
+        'has_download_links': release.has_download_links
+    }
+
+def releases_response(payload, view, releases, builder, generation=None):
+    """
+    Build a JSON response whose 'releases' list comes from cached fragments
+    
+    Args:
+        payload: Response envelope without the releases
+        view: Fragment cache namespace
+        releases: Releases to include
+        builder: Function that converts a release to a dictionary
+        generation: Fragment cache generation taken before the releases were read
+    """
+    fragments = response_serializer.fragments(view, releases, builder, generation)
+    body = response_serializer.encode_with_fragments(payload, 'releases', fragments)
+    return app.response_class(body, mimetype='application/json')
+
 @app.route('/')
 def index():
     """Main page"""
@@ -322,8 +660,11 @@ def get_releases():
         offset = (page - 1) * limit
         
         # Get ALL releases first (without pagination)
+        generation = response_serializer.generation()
         all_releases = db_manager.get_all_releases(sort_by=sort_by)
         
+        filter_started = time.perf_counter()
+        
         # Apply filters BEFORE pagination
         filtered_releases = all_releases
         
@@ -341,42 +682,21 @@ def get_releases():
         start_index = offset
         end_index = start_index + limit
         releases = filtered_releases[start_index:end_index]
-        
-        # Convert to JSON
-        releases_data = []
-        for release in releases:
-            releases_data.append({
-                'id': release.id,
-                'url': release.url,
-                'title': release.title,
-                'description': release.description,  # Use full description instead of short
-                'short_description': release.short_description,  # Keep short for backwards compatibility
-                'publish_date': release.formatted_date,
-                'game_release_date': release.formatted_game_release_date,
-                'size': release.size,
-                'status': release.status.name,
-                'status_text': release.status_text,
-                'status_color': release.status_color,
-                'has_download_links': release.has_download_links,
-                'image_count': release.image_count,
-                'magnet_link': release.magnet_link,
-                'cover_image_url': release.cover_image_url,
-                'screenshot_urls': release.screenshot_urls
-            })
+        API_FILTER_SECONDS.observe(time.perf_counter() - filter_started, route='/api/releases')
         
         # Get statistics
         total_filtered_releases = len(filtered_releases)
         total_all_releases = len(all_releases)
         
-        return jsonify({
+        # Convert to JSON (unchanged releases reuse their cached encoding)
+        return releases_response({
             'success': True,
-            'releases': releases_data,
             'total': total_all_releases,
             'filtered_total': total_filtered_releases,
             'page': page,
             'limit': limit,
             'has_more': len(filtered_releases) > end_index
-        })
+        }, 'list', releases, release_list_item, generation)
         
     except Exception as e:
         logger.error(f"❌ Error getting releases: {e}")
@@ -398,11 +718,8 @@ def get_statistics():
         
         stats = db_manager.get_statistics()
         
-        # Get releases by status
-        all_releases = db_manager.get_all_releases()
-        status_counts = {}
-        for status in ReleaseStatus:
-            status_counts[status.name] = len([r for r in all_releases if r.status == status])
+        # Releases by status, from the counters the database maintains
+        status_counts = db_manager.get_status_counts()
         
         return jsonify({
             'success': True,
@@ -495,11 +812,20 @@ def sync_releases():
                 'error': 'Synchronization already in progress'
             }), 400
         
+        # Profiling the run is restricted to administrators
+        data = request.get_json(silent=True) or {}
+        profile = bool(data.get('profile'))
+        if profile and not is_admin_request():
+            return jsonify({
+                'success': False,
+                'error': 'Profiling requires administrator access'
+            }), 403
+        
         # Start background synchronization
         logger.info("🔄 Starting release synchronization in background")
         
         # Create thread for synchronization
-        sync_thread = threading.Thread(target=sync_releases_worker)
+        sync_thread = threading.Thread(target=sync_releases_worker, args=(profile,))
         sync_thread.daemon = True
         sync_thread.start()
         
@@ -508,6 +834,7 @@ def sync_releases():
         return jsonify({
             'success': True,
             'message': 'Synchronization started in background',
+            'profile': profile,
             'timestamp': datetime.now().isoformat()
         })
         
@@ -519,6 +846,90 @@ def sync_releases():
             'error': str(e)
         }), 500
 
+def format_sse(event, data, event_id=None):
+    """Encode one Server-Sent Events message"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {response_serializer.dumps(data).decode('utf-8')}")
+    return '\n'.join(lines) + '\n\n'
+
+@app.route('/api/events')
+def stream_events():
+    """Server-Sent Events stream of the WebSocket channels, resumable with Last-Event-ID"""
+    channels = request.args.get('channels')
+    try:
+        channels, status = event_channels.parse_subscription({
+            'channels': [c for c in channels.split(',') if c] if channels is not None else None,
+            'status': request.args.get('status')
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    subscribed_rooms = set(event_channels.subscription_rooms(channels, status))
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        cursor = int(last_event_id) if last_event_id else None
+    except ValueError:
+        cursor = None
+    keepalive = settings_manager.settings.sse_keepalive if settings_manager else 15.0
+    log = event_log
+    
+    def generate():
+        nonlocal cursor
+        yield f"retry: {int(keepalive * 1000)}\n\n"
+        last_write = time.monotonic()
+        
+        if cursor is None:
+            # New client: start from the current state instead of replaying history
+            cursor = log.last_id
+            if event_channels.SYNC_PROGRESS in channels:
+                yield format_sse('sync_progress', sync_progress.snapshot(), cursor)
+        
+        while True:
+            events, missed = log.wait(cursor, timeout=keepalive)
+            if missed:
+                # Events were dropped from the log; the client should reload its state
+                yield format_sse('resync', {'reason': 'events_missed'})
+                if event_channels.SYNC_PROGRESS in channels:
+                    yield format_sse('sync_progress', sync_progress.snapshot())
+                last_write = time.monotonic()
+            
+            for logged in events:
+                cursor = logged.id
+                if subscribed_rooms.intersection(logged.rooms):
+                    yield format_sse(logged.event, logged.data, logged.id)
+                    last_write = time.monotonic()
+            if missed and not events:
+                cursor = log.last_id
+            if time.monotonic() - last_write >= keepalive:
+                # Comment line keeps proxies from closing an idle stream
+                yield ": keepalive\n\n"
+                last_write = time.monotonic()
+    
+    return app.response_class(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@app.route('/api/sync/last_run')
+def get_last_sync_run():
+    """API to get the report of the most recent synchronization run"""
+    if last_sync_run is None:
+        return jsonify({
+            'success': False,
+            'error': 'No synchronization has run since the server started'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'last_run': last_sync_run
+    })
+
 @app.route('/api/sync/status')
 def get_sync_status():
     """API to get synchronization status"""
@@ -526,7 +937,7 @@ def get_sync_status():
         return jsonify({
             'success': True,
             'sync_in_progress': sync_in_progress,
-            'progress': sync_progress
+            'progress': sync_progress.snapshot()
         })
         
     except Exception as e:
@@ -566,7 +977,7 @@ def update_release_status_simple():
             }), 400
         
         # Update status
-        success = db_manager.update_release_status(release_id, status)
+        success = change_release_status(release_id, status)
         
         if success:
             return jsonify({
@@ -615,7 +1026,7 @@ def update_release_status(release_id):
             }), 400
         
         # Update status
-        success = db_manager.update_release_status(release_id, status)
+        success = change_release_status(release_id, status)
         
         if success:
             return jsonify({
@@ -656,30 +1067,14 @@ def search_releases():
             }), 400
         
         # Search releases
+        generation = response_serializer.generation()
         releases = db_manager.search_releases(query, limit=limit)
         
-        # Convert to JSON
-        releases_data = []
-        for release in releases:
-            releases_data.append({
-                'id': release.id,
-                'url': release.url,
-                'title': release.title,
-                'description': release.description,  # Use full description instead of short
-                'short_description': release.short_description,  # Keep short for backwards compatibility
-                'publish_date': release.formatted_date,
-                'size': release.size,
-                'status': release.status.name,
-                'status_text': release.status_text,
-                'status_color': release.status_color,
-                'has_download_links': release.has_download_links
-            })
-        
-        return jsonify({
+        # Convert to JSON (unchanged releases reuse their cached encoding)
+        return releases_response({
             'success': True,
-            'releases': releases_data,
-            'total': len(releases_data)
-        })
+            'total': len(releases)
+        }, 'search', releases, release_search_item, generation)
         
     except Exception as e:
         logger.error(f"❌ Error in search: {e}")
@@ -764,87 +1159,536 @@ def clear_all_releases():
             'error': str(e)
         }), 500
 
+def resync_release_job(report, release_id):
+    """
+    Background job that re-scrapes a single release
+    
+    Args:
+        report: Progress reporter provided by the job manager
+        release_id: ID of the release to re-scrape
+        
+    Returns:
+        dict: Updated release data
+    """
+    existing_release = db_manager.get_release_by_id(release_id)
+    if not existing_release:
+        raise LookupError('Release not found')
+    
+    logger.info(f"🔄 Syncing single release: {existing_release.title} (ID: {release_id})")
+    logger.info(f"🔗 URL to scrape: {existing_release.url}")
+    report(f'Re-scraping {existing_release.title}...', release_id=release_id)
+    
+    # Re-scrape the release URL
+    updated_release = scraper._extract_release_details(existing_release.url, revalidate=True)
+    if not updated_release:
+        raise RuntimeError('Failed to re-scrape release data')
+    
+    logger.info(f"✅ Re-scraping successful: {updated_release.title}")
+    report(f'Saving {updated_release.title}...', release_id=release_id)
+    
+    # Update the release with new data while preserving the ID (the stored status is kept)
+    updated_release.id = release_id
+    
+    if not db_manager.update_release_by_id(release_id, updated_release):
+        raise RuntimeError('Failed to update release in database')
+    if updated_release.images_pending and image_backfill:
+        image_backfill.notify()
+    
+    final_release = db_manager.get_release_by_id(release_id)
+    if not final_release:
+        raise RuntimeError('Release not found after update')
+    
+    logger.info(f"✅ Successfully synced release: {final_release.title}")
+    return {
+        'message': f'Release synced successfully: {final_release.title}',
+        'release': final_release.to_dict()
+    }
+
+def bulk_resync_job(report, release_ids):
+    """
+    Background job that re-scrapes many releases
+    
+    Args:
+        report: Progress reporter provided by the job manager
+        release_ids: IDs of the releases to re-scrape
+        
+    Returns:
+        dict: Aggregate counts, duration and throughput
+    """
+    runner = BulkResyncRunner(
+        db_manager, scraper,
+        max_workers=settings_manager.settings.max_concurrent_requests,
+        batch_size=settings_manager.settings.bulk_resync_batch_size,
+        max_report_hz=settings_manager.settings.progress_emit_hz
+    )
+    try:
+        return runner.run(release_ids, report)
+    finally:
+        if image_backfill:
+            image_backfill.notify()
+
+def emit_job_update(job):
+    """Push background job state changes to jobs subscribers"""
+    publish_event('job_update', job.to_dict(), event_channels.JOBS)
+
 @app.route('/api/releases/<int:release_id>/sync', methods=['POST'])
 def sync_single_release(release_id):
-    """Sync a single release by re-scraping its URL"""
-    global db_manager, scraper
-    
+    """Queue a background job that re-scrapes a single release"""
     try:
         logger.info(f"🔄 Sync request received for release ID: {release_id}")
-        logger.info(f"🔍 Release ID type: {type(release_id)}")
         
-        if not db_manager or not scraper:
+        if not db_manager or not scraper or not job_manager:
             logger.error("❌ Database manager or scraper not initialized")
             return jsonify({'success': False, 'error': 'Database manager or scraper not initialized'}), 500
         
-        # Get the existing release
-        existing_release = db_manager.get_release_by_id(release_id)
-        if not existing_release:
+        if not db_manager.get_release_by_id(release_id):
             logger.error(f"❌ Release not found for ID: {release_id}")
             return jsonify({'success': False, 'error': 'Release not found'}), 404
         
-        logger.info(f"🔄 Syncing single release: {existing_release.title} (ID: {release_id})")
-        logger.info(f"🔗 URL to scrape: {existing_release.url}")
-        
-        # Re-scrape the release URL
-        logger.info("🌐 Starting re-scraping process...")
-        updated_release = scraper._extract_release_details(existing_release.url)
-        
-        if not updated_release:
-            logger.error("❌ Failed to re-scrape release data")
-            return jsonify({'success': False, 'error': 'Failed to re-scrape release data'}), 500
-        
-        logger.info(f"✅ Re-scraping successful: {updated_release.title}")
+        # Requests for a release that is already being re-scraped share its job
+        job, created = job_manager.submit('release_resync', f'release:{release_id}',
+                                          resync_release_job, release_id)
         
-        # Update the release with new data while preserving the ID and status
-        updated_release.id = release_id
-        updated_release.status = existing_release.status  # Preserve current status
+        return jsonify({
+            'success': True,
+            'message': 'Release sync queued' if created else 'Release sync already in progress',
+            'job_id': job.id,
+            'duplicate': not created,
+            'job': job.to_dict()
+        }), 202
         
-        logger.info(f"📝 Updating release in database...")
-        # Update in database using ID
-        success = db_manager.update_release_by_id(release_id, updated_release)
+    except Exception as e:
+        logger.error(f"❌ Error queuing release sync: {e}")
+        logger.error(f"❌ Traceback: {traceback.format_exc()}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/releases/resync', methods=['POST'])
+def bulk_resync_releases():
+    """Queue a background job that re-scrapes a list of releases or a selection"""
+    try:
+        if not db_manager or not scraper or not job_manager:
+            return jsonify({
+                'success': False,
+                'error': 'Database manager or scraper not initialized'
+            }), 500
         
-        if success:
-            logger.info(f"✅ Successfully synced release: {updated_release.title}")
-            
-            # Get the updated release with all fields
-            final_release = db_manager.get_release_by_id(release_id)
-            logger.info(f"🔍 Final release retrieved: {final_release is not None}")
-            
-            if final_release:
+        data = request.get_json() or {}
+        ids = data.get('ids')
+        selector = data.get('selector')
+        
+        if ids is not None:
+            if not isinstance(ids, list) or not all(
+                    isinstance(i, int) and not isinstance(i, bool) for i in ids):
+                return jsonify({
+                    'success': False,
+                    'error': 'ids must be a list of release IDs'
+                }), 400
+            release_ids = list(dict.fromkeys(ids))
+        elif isinstance(selector, dict):
+            status_filter = None
+            if selector.get('status'):
+                if not isinstance(selector['status'], str):
+                    return jsonify({
+                        'success': False,
+                        'error': 'Invalid status'
+                    }), 400
                 try:
-                    release_dict = final_release.to_dict()
-                    logger.info(f"✅ Release converted to dict successfully")
-                    logger.info(f"📋 Dict keys: {list(release_dict.keys())}")
-                    
+                    status_filter = ReleaseStatus[selector['status'].upper()]
+                except KeyError:
                     return jsonify({
-                        'success': True,
-                        'message': f'Release synced successfully: {updated_release.title}',
-                        'release': release_dict
-                    })
-                except Exception as dict_error:
-                    logger.error(f"❌ Error converting release to dict: {dict_error}")
-                    return jsonify({'success': False, 'error': f'Error serializing release: {str(dict_error)}'}), 500
-            else:
-                logger.error("❌ Final release is None after update")
-                return jsonify({'success': False, 'error': 'Release not found after update'}), 500
+                        'success': False,
+                        'error': 'Invalid status'
+                    }), 400
+            
+            stale_days = selector.get('stale_days')
+            if stale_days is not None and (
+                    not isinstance(stale_days, int) or isinstance(stale_days, bool) or stale_days < 0):
+                return jsonify({
+                    'success': False,
+                    'error': 'stale_days must be a non-negative integer'
+                }), 400
+            
+            release_ids = db_manager.select_release_ids(
+                status=status_filter,
+                missing_cover=bool(selector.get('missing_cover')),
+                missing_screenshots=bool(selector.get('missing_screenshots')),
+                stale_days=stale_days
+            )
         else:
-            logger.error("❌ Failed to update release in database")
-            return jsonify({'success': False, 'error': 'Failed to update release in database'}), 500
+            return jsonify({
+                'success': False,
+                'error': 'Release ids or selector required'
+            }), 400
+        
+        if not release_ids:
+            return jsonify({
+                'success': True,
+                'message': 'No releases match the selection',
+                'total': 0
+            })
+        
+        # Only one bulk resync runs at a time to stay within the politeness budget
+        job, created = job_manager.submit('bulk_resync', 'bulk_resync', bulk_resync_job, release_ids)
+        
+        return jsonify({
+            'success': True,
+            'message': f'Bulk resync of {len(release_ids)} releases queued' if created else 'Bulk resync already in progress',
+            'job_id': job.id,
+            'duplicate': not created,
+            'total': len(release_ids),
+            'job': job.to_dict()
+        }), 202
         
     except Exception as e:
-        logger.error(f"❌ Error syncing single release: {e}")
-        logger.error(f"❌ Error details: {str(e)}")
-        import traceback
-        logger.error(f"❌ Traceback: {traceback.format_exc()}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        logger.error(f"❌ Error queuing bulk resync: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/jobs')
+def list_jobs():
+    """API to list background jobs"""
+    try:
+        if not job_manager:
+            return jsonify({
+                'success': False,
+                'error': 'Job manager not initialized'
+            }), 500
+        
+        active_only = request.args.get('active', 'false').lower() == 'true'
+        jobs = job_manager.list_jobs(active_only=active_only)
+        
+        return jsonify({
+            'success': True,
+            'jobs': [job.to_dict() for job in jobs]
+        })
+        
+    except Exception as e:
+        logger.error(f"❌ Error listing jobs: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """API to get the state of a background job"""
+    try:
+        if not job_manager:
+            return jsonify({
+                'success': False,
+                'error': 'Job manager not initialized'
+            }), 500
+        
+        job = job_manager.get_job(job_id)
+        if not job:
+            return jsonify({
+                'success': False,
+                'error': 'Job not found'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'job': job.to_dict()
+        })
+        
+    except Exception as e:
+        logger.error(f"❌ Error getting job: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/profiles')
+def list_profiles():
+    """API to list saved profiles"""
+    if not is_admin_request():
+        return jsonify({
+            'success': False,
+            'error': 'Administrator access required'
+        }), 403
+    
+    return jsonify({
+        'success': True,
+        'profiles': profiler.list_profiles() if profiler else []
+    })
+
+@app.route('/api/profiles/<profile_id>/<fmt>')
+def download_profile(profile_id, fmt):
+    """API to download a profile artifact (pstats, collapsed or txt)"""
+    if not is_admin_request():
+        return jsonify({
+            'success': False,
+            'error': 'Administrator access required'
+        }), 403
+    
+    path = profiler.artifact_path(profile_id, fmt) if profiler else None
+    if not path:
+        return jsonify({
+            'success': False,
+            'error': 'Profile not found'
+        }), 404
+    
+    return send_file(path, mimetype=ARTIFACT_FORMATS[fmt], as_attachment=True,
+                     download_name=f"{profile_id}.{fmt}")
+
+@app.route('/api/memory')
+def memory_status():
+    """API to get memory usage, tracing state and live object counts"""
+    if not is_admin_request():
+        return jsonify({
+            'success': False,
+            'error': 'Administrator access required'
+        }), 403
+    
+    caches = {}
+    if response_serializer:
+        caches.update(response_serializer.get_cache_info())
+    if response_compressor:
+        caches.update(response_compressor.get_cache_info())
+    if scraper and scraper.http_cache:
+        caches.update(scraper.http_cache.get_cache_info())
+    
+    return jsonify({
+        'success': True,
+        'memory': memory_inspector.status(),
+        'objects': memory_inspector.object_counts(request.args.get('limit', 15, type=int)),
+        'caches': caches,
+        'browsers': scraper.driver_pool.get_info() if scraper and scraper.driver_pool else None
+    })
+
+@app.route('/api/memory/tracing', methods=['POST', 'DELETE'])
+def memory_tracing():
+    """API to start (POST, optional {"frames": N}) or stop (DELETE) allocation tracing"""
+    if not is_admin_request():
+        return jsonify({
+            'success': False,
+            'error': 'Administrator access required'
+        }), 403
+    
+    if request.method == 'DELETE':
+        status = memory_inspector.stop()
+    else:
+        data = request.get_json(silent=True) or {}
+        try:
+            frames = int(data.get('frames', 1))
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': 'frames must be an integer'
+            }), 400
+        status = memory_inspector.start(frames)
+    
+    return jsonify({
+        'success': True,
+        'memory': status
+    })
+
+@app.route('/api/memory/snapshots', methods=['GET', 'POST'])
+def memory_snapshots():
+    """API to list snapshots (GET) or take one (POST, optional {"label": "..."})"""
+    if not is_admin_request():
+        return jsonify({
+            'success': False,
+            'error': 'Administrator access required'
+        }), 403
+    
+    if request.method == 'GET':
+        return jsonify({
+            'success': True,
+            'snapshots': memory_inspector.list_snapshots()
+        })
+    
+    data = request.get_json(silent=True) or {}
+    try:
+        snapshot = memory_inspector.take_snapshot(str(data.get('label', '')))
+    except RuntimeError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 409
+    
+    return jsonify({
+        'success': True,
+        'snapshot': snapshot
+    }), 201
 
+@app.route('/api/memory/snapshots/<int:snapshot_id>')
+def memory_snapshot_top(snapshot_id):
+    """API to get the top allocation sites of a snapshot"""
+    if not is_admin_request():
+        return jsonify({
+            'success': False,
+            'error': 'Administrator access required'
+        }), 403
+    
+    try:
+        report = memory_inspector.top(snapshot_id, request.args.get('group_by', 'lineno'),
+                                      request.args.get('limit', 20, type=int))
+    except KeyError:
+        return jsonify({
+            'success': False,
+            'error': 'Snapshot not found'
+        }), 404
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    return jsonify(dict(report, success=True))
 
+@app.route('/api/memory/snapshots/<int:snapshot_id>/diff')
+def memory_snapshot_diff(snapshot_id):
+    """API to compare a snapshot with ?base=ID (default: the previous snapshot)"""
+    if not is_admin_request():
+        return jsonify({
+            'success': False,
+            'error': 'Administrator access required'
+        }), 403
+    
+    base_id = request.args.get('base', type=int) or memory_inspector.previous_snapshot_id(snapshot_id)
+    if base_id is None:
+        return jsonify({
+            'success': False,
+            'error': 'No earlier snapshot to compare with'
+        }), 400
+    
+    try:
+        report = memory_inspector.diff(snapshot_id, base_id, request.args.get('group_by', 'lineno'),
+                                       request.args.get('limit', 20, type=int))
+    except KeyError:
+        return jsonify({
+            'success': False,
+            'error': 'Snapshot not found'
+        }), 404
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    return jsonify(dict(report, success=True))
 
-@app.route('/static/<path:filename>')
+@app.route('/static/<path:filename>', endpoint='static')
 def static_files(filename):
-    """Serve static files"""
-    return send_from_directory('static', filename)
+    """Serve static files, using a precompressed variant when the client accepts it"""
+    if response_compressor:
+        encoding = response_compressor.choose_encoding(request.headers.get('Accept-Encoding', ''))
+        variant = response_compressor.get_static_variant(STATIC_DIR, filename, encoding) if encoding else None
+        if variant:
+            response = app.response_class(variant['body'], mimetype=variant['mimetype'])
+            response.headers['Content-Encoding'] = encoding
+            response.vary.add('Accept-Encoding')
+            response.set_etag(variant['etag'])
+            return response.make_conditional(request)
+    
+    return send_from_directory(STATIC_DIR, filename)
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics in the text exposition format"""
+    if settings_manager and not settings_manager.settings.metrics_enabled:
+        return jsonify({
+            'success': False,
+            'error': 'Metrics are disabled'
+        }), 404
+    
+    return app.response_class(REGISTRY.render(), content_type=REGISTRY.CONTENT_TYPE)
+
+@app.before_request
+def start_request_timer():
+    """Remember when the request started and collect Server-Timing segments for API calls"""
+    g.request_started = time.perf_counter()
+    if request.path.startswith('/api/'):
+        g.server_timing, g.server_timing_token = start_server_timing()
+
+@app.after_request
+def record_request_metrics(response):
+    """Observe request latency by route (registered first so it runs after compression)"""
+    started = g.get('request_started')
+    if started is not None:
+        elapsed = time.perf_counter() - started
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        HTTP_REQUEST_SECONDS.observe(elapsed, method=request.method, route=route, status=response.status_code)
+        
+        # Same measurements as the metrics above, attributed to this response
+        timing = g.pop('server_timing', None)
+        if timing is not None:
+            timing.add('total', elapsed)
+            response.headers['Server-Timing'] = timing.header_value()
+    return response
+
+@app.teardown_request
+def stop_request_timing(error=None):
+    """Stop collecting Server-Timing segments for this request"""
+    token = g.pop('server_timing_token', None)
+    if token is not None:
+        stop_server_timing(token)
+
+@app.before_request
+def start_request_profile():
+    """Profile this API request when called with ?profile=1 by an administrator"""
+    if not profiler or request.args.get('profile', '0').lower() in ('', '0', 'false') \
+            or not request.path.startswith('/api/'):
+        return None
+    
+    if not is_admin_request():
+        return jsonify({
+            'success': False,
+            'error': 'Profiling requires administrator access'
+        }), 403
+    
+    try:
+        g.profile_session = profiler.start(f"{request.method} {request.path}")
+    except RuntimeError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 409
+    return None
+
+@app.after_request
+def finish_request_profile(response):
+    """Save the request profile and point the client to it"""
+    session = g.pop('profile_session', None)
+    if session:
+        info = session.stop()
+        response.headers['X-Profile-Id'] = info['id']
+        response.headers['X-Profile-Url'] = f"/api/profiles/{info['id']}/collapsed"
+    return response
+
+@app.teardown_request
+def abort_request_profile(error=None):
+    """Stop a request profile that after_request did not reach"""
+    session = g.pop('profile_session', None)
+    if session:
+        session.stop()
+
+@app.after_request
+def compress_response(response):
+    """Compress JSON and text responses above the size threshold"""
+    if (not response_compressor or
+            response.direct_passthrough or
+            response.is_streamed or
+            response.status_code < 200 or response.status_code >= 300 or
+            'Content-Encoding' in response.headers or
+            not response_compressor.is_compressible(response.mimetype)):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = response_compressor.choose_encoding(request.headers.get('Accept-Encoding', ''))
+    if not encoding:
+        return response
+    
+    data = response.get_data()
+    if len(data) < response_compressor.min_size:
+        return response
+    
+    response.set_data(response_compressor.compress(data, encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
 
 @app.errorhandler(404)
 def not_found(error):
@@ -862,8 +1706,11 @@ def internal_error(error):
         'error': 'Internal server error'
     }), 500
 
+# Initialize components when importing the module
+initialize_components()
+
 if __name__ == '__main__':
-    # Initialize components
+    # Components are normally initialized on import; retry only if that failed
     if not initialize_components():
         logger.error("❌ Could not initialize components")
         sys.exit(1)
@@ -5,16 +5,24 @@ Backend module for FitGirl Updater
 Contains all the core functionality for the application
 """
 
-# Import main classes for easy access
-from .settings_manager import SettingsManager
-from .json_database_manager import JsonDatabaseManager
-from .game_release import GameRelease, ReleaseStatus
-from .x1337_scraper import X1337Scraper
+import importlib
 
-__all__ = [
-    'SettingsManager',
-    'JsonDatabaseManager', 
-    'GameRelease',
-    'ReleaseStatus',
-    'X1337Scraper'
-] 
\ No newline at end of file
+# Main classes for easy access, imported on first use: start_web.py reads the
+# settings before gevent patches the standard library, so importing the package
+# must not pull in requests, ssl or selenium
+_EXPORTS = {
+    'SettingsManager': '.settings_manager',
+    'JsonDatabaseManager': '.json_database_manager',
+    'GameRelease': '.game_release',
+    'ReleaseStatus': '.game_release',
+    'X1337Scraper': '.x1337_scraper',
+    'ResponseSerializer': '.response_serializer'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
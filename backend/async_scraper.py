@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Asynchronous scraping engine for FitGirl Downloader
+Fetches detail pages on one asyncio event loop with a shared keep-alive connection pool
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional, the thread pool engine is the fallback
+    aiohttp = None
+
+from .game_release import GameRelease
+from .http_cache import HTTP_CACHE_REQUESTS, HttpCache
+from .stage_timings import StageTimings
+from .x1337_scraper import SCRAPER_PAGES_FETCHED
+
+
+class AsyncScraperEngine:
+    """
+    Detail page engine of X1337Scraper for scraper_engine: async
+
+    Downloads run as coroutines (one connection pool, max_concurrent_requests in
+    flight, the scraper's per-host rate limit); parsing and the Selenium fallback
+    stay blocking and run on a small thread pool.
+    """
+
+    def __init__(self, scraper):
+        """
+        Initialize the engine
+
+        Args:
+            scraper: X1337Scraper providing the settings, rate limiter and parser
+        """
+        self.logger = logging.getLogger(__name__)
+        self.scraper = scraper
+        self.max_in_flight = scraper.max_workers
+        self.timeout = scraper.request_timeout
+        self.logger.info(f"🔧 Async scraper engine enabled ({self.max_in_flight} requests in flight)")
+
+    @contextmanager
+    def workers(self, timings: Optional[StageTimings] = None) -> Iterator[Callable[[str], Future]]:
+        """
+        Run the event loop for one sync run
+
+        Args:
+            timings: Stage timings of the run
+
+        Returns:
+            Context manager yielding submit(url) -> Future of the release (or None);
+            leaving it cancels the extractions still running
+        """
+        state: Dict[str, Any] = {}
+        ready = threading.Event()
+        thread = threading.Thread(target=self._run_loop, args=(timings, state, ready),
+                                  name="scrape-async", daemon=True)
+        thread.start()
+        ready.wait()
+        if 'error' in state:
+            thread.join()
+            raise state['error']
+
+        def submit(torrent_url: str) -> Future:
+            return asyncio.run_coroutine_threadsafe(self._extract_one(state, torrent_url), state['loop'])
+
+        try:
+            yield submit
+        finally:
+            try:
+                state['loop'].call_soon_threadsafe(state['stop'].set)
+            except RuntimeError:
+                pass  # The loop already finished
+            thread.join()
+
+    def _run_loop(self, timings: Optional[StageTimings], state: Dict[str, Any], ready: threading.Event):
+        """Run the event loop on the engine thread"""
+        try:
+            asyncio.run(self._serve(timings, state, ready))
+        except Exception as e:
+            self.logger.error(f"❌ Async scraper engine failed: {e}")
+            state['error'] = e
+        finally:
+            ready.set()
+
+    async def _serve(self, timings: Optional[StageTimings], state: Dict[str, Any], ready: threading.Event):
+        """Keep the connection pool open until the run ends"""
+        state['loop'] = asyncio.get_running_loop()
+        state['stop'] = asyncio.Event()
+        state['in_flight'] = asyncio.Semaphore(self.max_in_flight)
+        # Fetch stages are recorded on this thread
+        self.scraper._run_local.timings = timings
+
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight, limit_per_host=self.max_in_flight,
+                                         keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        headers = dict(self.scraper.session.headers)
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="scrape-parse") as parse_pool:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+                state['session'] = session
+                state['parse_pool'] = parse_pool
+                state['timings'] = timings
+                ready.set()
+                await state['stop'].wait()
+
+                # Cancel the extractions nobody is waiting for any more
+                tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _extract_one(self, state: Dict[str, Any], torrent_url: str) -> Optional[GameRelease]:
+        """Fetch and parse one detail page"""
+        async with state['in_flight']:
+            content = await self._fetch(state, torrent_url)
+
+        if content is None:
+            return None
+        return await asyncio.get_running_loop().run_in_executor(
+            state['parse_pool'], self.scraper._run_with_timings, state['timings'],
+            self.scraper._parse_release_details, torrent_url, content)
+
+    async def _off_loop(self, state: Dict[str, Any], func, *args: Any) -> Any:
+        """Run blocking work (SQLite cache queries, zlib) on the worker pool instead of the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(state['parse_pool'], func, *args)
+
+    async def _fetch(self, state: Dict[str, Any], url: str) -> Optional[bytes]:
+        """
+        GET a page once the per-host rate limit allows it
+
+        Args:
+            state: Event loop state (aiohttp session and worker pool)
+            url: Page URL
+
+        Returns:
+            Optional[bytes]: Page HTML, or None on errors and timeouts
+        """
+        session = state['session']
+        cache = self.scraper.http_cache
+        entry = await self._off_loop(state, cache.get, url) if cache else None
+        if entry and entry['fresh']:
+            HTTP_CACHE_REQUESTS.inc(result='hit')
+            await self._off_loop(state, cache.touch, url)
+            return entry['body']
+
+        delay = self.scraper.rate_limiter.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        started = time.perf_counter()
+        SCRAPER_PAGES_FETCHED.inc(kind='detail')
+        headers = HttpCache.conditional_headers(entry) if entry else None
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and entry:
+                    HTTP_CACHE_REQUESTS.inc(result='revalidated')
+                    await self._off_loop(state, cache.touch, url, True)
+                    self.scraper._record_stage('fetch', started)
+                    return entry['body']
+                content = await response.read()
+                self.scraper._record_download(response.status, len(content))
+                response.raise_for_status()
+                if cache:
+                    HTTP_CACHE_REQUESTS.inc(result='miss')
+                    await self._off_loop(state, cache.put, url, response.headers, content)
+        except asyncio.TimeoutError:
+            self.logger.error(f"❌ Timeout fetching {url}")
+            return None
+        except aiohttp.ClientError as e:
+            self.logger.error(f"❌ Error extracting details from {url}: {e}")
+            return None
+
+        self.scraper._record_stage('fetch', started)
+        return content
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bulk release re-scraping for FitGirl Downloader
+Refreshes many releases through a bounded worker pool (the scraper enforces the request rate)
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .game_release import GameRelease
+from .json_database_manager import JsonDatabaseManager
+
+
+class BulkResyncRunner:
+    """
+    Re-scrapes a list of releases and writes the results in batches
+    """
+
+    def __init__(self, db_manager: JsonDatabaseManager, scraper, max_workers: int = 5, batch_size: int = 25,
+                 max_report_hz: float = 4.0):
+        """
+        Initialize the runner
+
+        Args:
+            db_manager: Database manager
+            scraper: Scraper used to extract release details
+            max_workers: Maximum number of releases scraped at the same time
+            batch_size: Number of updated releases written per database save
+            max_report_hz: Maximum progress reports per second (0 reports every release)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_manager = db_manager
+        self.scraper = scraper
+        self.max_workers = max(1, max_workers)
+        self.batch_size = max(1, batch_size)
+        self.min_report_interval = 1.0 / max_report_hz if max_report_hz and max_report_hz > 0 else 0.0
+
+    def _resync_one(self, release_id: int) -> Optional[Tuple[int, GameRelease]]:
+        """
+        Re-scrape a single release
+
+        Args:
+            release_id: ID of the release
+
+        Returns:
+            Optional[Tuple[int, GameRelease]]: ID and updated release, or None if it failed
+        """
+        existing_release = self.db_manager.get_release_by_id(release_id)
+        if not existing_release:
+            self.logger.warning(f"⚠️ Release not found for bulk resync: {release_id}")
+            return None
+
+        updated_release = self.scraper._extract_release_details(existing_release.url, revalidate=True)
+        if not updated_release:
+            self.logger.warning(f"⚠️ Failed to re-scrape: {existing_release.title}")
+            return None
+
+        # The stored status is kept when the batch is written
+        updated_release.id = release_id
+        return release_id, updated_release
+
+    def run(self, release_ids: List[int], report: Callable[..., None]) -> Dict[str, Any]:
+        """
+        Re-scrape releases and report aggregate progress
+
+        Args:
+            release_ids: Releases to refresh
+            report: Progress reporter, called as report(message, **progress)
+
+        Returns:
+            Dict[str, Any]: Summary with counts, duration and throughput
+        """
+        total = len(release_ids)
+        processed = 0
+        updated = 0
+        failed_ids: List[int] = []
+        pending_writes: List[Tuple[int, GameRelease]] = []
+        started = time.monotonic()
+        last_report = 0.0
+
+        def flush():
+            nonlocal updated
+            if pending_writes:
+                updated += self.db_manager.update_releases_by_id(pending_writes)
+                pending_writes.clear()
+
+        def progress(message: str, force: bool = False):
+            nonlocal last_report
+            now = time.monotonic()
+            # Every report is a job update broadcast: skip those within the throttle window
+            if not force and now - last_report < self.min_report_interval:
+                return
+            last_report = now
+            elapsed = now - started
+            throughput = processed / elapsed if elapsed > 0 else 0.0
+            remaining = (total - processed) / throughput if throughput > 0 else None
+            report(message, total=total, processed=processed, updated=updated,
+                   failed=len(failed_ids), throughput=round(throughput, 2),
+                   eta_seconds=round(remaining) if remaining is not None else None)
+
+        self.logger.info(f"🔄 Bulk resync of {total} releases ({self.max_workers} workers)")
+        progress(f'Re-scraping {total} releases...', force=True)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="resync") as executor:
+            futures = {executor.submit(self._resync_one, release_id): release_id for release_id in release_ids}
+
+            for future in as_completed(futures):
+                release_id = futures[future]
+                processed += 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error(f"❌ Error re-scraping release {release_id}: {e}")
+                    result = None
+
+                if result:
+                    pending_writes.append(result)
+                    if len(pending_writes) >= self.batch_size:
+                        flush()
+                else:
+                    failed_ids.append(release_id)
+
+                progress(f'Re-scraped {processed} of {total} releases')
+
+        flush()
+        progress(f'Re-scraped {processed} of {total} releases', force=True)
+
+        duration = time.monotonic() - started
+        summary = {
+            'total': total,
+            'updated': updated,
+            'failed': len(failed_ids),
+            'failed_ids': failed_ids,
+            'duration_seconds': round(duration, 2),
+            'throughput': round(total / duration, 2) if duration > 0 else 0.0
+        }
+        self.logger.info(f"✅ Bulk resync completed: {updated} updated, {len(failed_ids)} failed "
+                         f"in {duration:.1f}s")
+        return summary
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Response compression for FitGirl Downloader
+Negotiates gzip/brotli encodings and keeps precompressed static assets in memory
+"""
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+from typing import Dict, Optional, Any
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+
+class ResponseCompressor:
+    """
+    Compressor for JSON responses and text static assets
+    """
+
+    COMPRESSIBLE_MIMETYPES = (
+        'application/json',
+        'application/javascript',
+        'application/xml',
+        'image/svg+xml',
+    )
+
+    def __init__(self, min_size: int = 1024, level: int = 6):
+        """
+        Initialize the compressor
+
+        Args:
+            min_size: Minimum body size in bytes to compress
+            level: Compression level (1-9, mapped to brotli quality for br)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.min_size = min_size
+        self.level = max(1, min(9, level))
+
+        # Relative static path -> precompressed variants
+        self._static_variants: Dict[str, Dict[str, Any]] = {}
+
+        encodings = 'br, gzip' if brotli is not None else 'gzip'
+        self.logger.info(f"🔧 Response compression enabled ({encodings}, min {min_size} bytes)")
+
+    def is_compressible(self, mimetype: Optional[str]) -> bool:
+        """
+        Check if a mimetype benefits from compression
+
+        Args:
+            mimetype: Response mimetype
+
+        Returns:
+            bool: True for text-like content
+        """
+        if not mimetype:
+            return False
+        return mimetype.startswith('text/') or mimetype in self.COMPRESSIBLE_MIMETYPES
+
+    def choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        """
+        Pick the best encoding accepted by the client
+
+        Args:
+            accept_encoding: Value of the Accept-Encoding header
+
+        Returns:
+            Optional[str]: 'br', 'gzip' or None
+        """
+        accepted = {}
+        for item in (accept_encoding or '').split(','):
+            parts = item.strip().split(';')
+            name = parts[0].strip().lower()
+            if not name:
+                continue
+            quality = 1.0
+            for param in parts[1:]:
+                param = param.strip()
+                if param.startswith('q='):
+                    try:
+                        quality = float(param[2:])
+                    except ValueError:
+                        quality = 0.0
+            accepted[name] = quality
+
+        if brotli is not None and accepted.get('br', 0) > 0:
+            return 'br'
+        if accepted.get('gzip', 0) > 0:
+            return 'gzip'
+        return None
+
+    def compress(self, data: bytes, encoding: str) -> bytes:
+        """
+        Compress a body
+
+        Args:
+            data: Raw body
+            encoding: 'br' or 'gzip'
+
+        Returns:
+            bytes: Compressed body
+        """
+        if encoding == 'br':
+            # Brotli quality goes to 11; keep it proportional to the gzip level
+            return brotli.compress(data, quality=min(11, self.level + 2))
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def precompress_directory(self, static_dir: str) -> int:
+        """
+        Precompress every compressible static file above the size threshold
+
+        Args:
+            static_dir: Static assets directory
+
+        Returns:
+            int: Number of precompressed files
+        """
+        count = 0
+        saved = 0
+
+        for root, _, files in os.walk(static_dir):
+            for filename in files:
+                path = os.path.join(root, filename)
+                rel_path = os.path.relpath(path, static_dir).replace(os.sep, '/')
+                if self._precompress_file(rel_path, path):
+                    variants = self._static_variants[rel_path]
+                    count += 1
+                    saved += variants['size'] - len(variants['gzip'])
+
+        self.logger.info(f"🗜️ Precompressed {count} static files ({saved / 1024:.1f} KB saved with gzip)")
+        return count
+
+    def _precompress_file(self, rel_path: str, path: str) -> bool:
+        """
+        Precompress a single static file
+
+        Args:
+            rel_path: Path relative to the static directory
+            path: Absolute path
+
+        Returns:
+            bool: True if variants were stored
+        """
+        mimetype = mimetypes.guess_type(path)[0]
+        if not self.is_compressible(mimetype):
+            return False
+
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            if len(data) < self.min_size:
+                return False
+
+            variants = {
+                'mimetype': mimetype,
+                'mtime': os.path.getmtime(path),
+                'size': len(data),
+                'etag': hashlib.md5(data).hexdigest(),
+                'gzip': self.compress(data, 'gzip')
+            }
+            if brotli is not None:
+                variants['br'] = self.compress(data, 'br')
+
+            self._static_variants[rel_path] = variants
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not precompress {rel_path}: {e}")
+            return False
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """
+        Get precompressed static file statistics
+
+        Returns:
+            Dict[str, Any]: Number of precompressed files and bytes held in memory
+        """
+        variants = list(self._static_variants.values())
+        return {
+            'static_files': len(variants),
+            'static_bytes': sum(len(v['gzip']) + len(v.get('br', b'')) for v in variants)
+        }
+
+    def get_static_variant(self, static_dir: str, rel_path: str, encoding: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a precompressed variant of a static file, refreshing it if the file changed
+
+        Args:
+            static_dir: Static assets directory
+            rel_path: Path relative to the static directory
+            encoding: 'br' or 'gzip'
+
+        Returns:
+            Optional[Dict[str, Any]]: Body, mimetype and etag, or None if not available
+        """
+        variants = self._static_variants.get(rel_path)
+        if not variants:
+            return None
+
+        path = os.path.join(static_dir, rel_path)
+        try:
+            if os.path.getmtime(path) != variants['mtime']:
+                if not self._precompress_file(rel_path, path):
+                    self._static_variants.pop(rel_path, None)
+                    return None
+                variants = self._static_variants[rel_path]
+        except OSError:
+            self._static_variants.pop(rel_path, None)
+            return None
+
+        body = variants.get(encoding)
+        if body is None:
+            return None
+
+        return {
+            'body': body,
+            'mimetype': variants['mimetype'],
+            'etag': f"{variants['etag']}-{encoding}"
+        }
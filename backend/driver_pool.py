@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Headless Chrome pool for FitGirl Downloader
+Leases reusable Selenium drivers to the image fallback and recycles worn-out browsers
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from .metrics import REGISTRY
+
+DRIVER_STARTS = REGISTRY.counter(
+    'fitgirl_selenium_driver_starts_total', 'Headless Chrome instances started')
+DRIVER_RECYCLES = REGISTRY.counter(
+    'fitgirl_selenium_driver_recycles_total', 'Headless Chrome instances retired', ['reason'])
+DRIVER_LEASE_WAIT_SECONDS = REGISTRY.histogram(
+    'fitgirl_selenium_lease_wait_seconds', 'Time spent waiting for a free Chrome instance')
+
+# Requests the image fallback never needs: fonts, media and ad/tracker hosts
+# (Network.setBlockedURLs patterns). Image bytes are disabled by a preference.
+BLOCKED_URL_PATTERNS = (
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.ogg', '*.mp3', '*.m3u8',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagmanager.com*',
+    '*google-analytics.com*', '*adservice.google.*', '*facebook.net*',
+    '*popads.net*', '*popcash.net*', '*propellerads.com*', '*adsterra.com*',
+    '*onclickads.net*', '*histats.com*', '*mc.yandex.ru*', '*limeiptv.to*',
+)
+
+
+def chrome_options(user_agent: str, block_resources: bool = True) -> Options:
+    """
+    Options of the headless Chrome instances
+
+    Args:
+        user_agent: User-Agent sent by the browser
+        block_resources: Skip image downloads and return from driver.get() once the
+                         DOM is ready (lazy-load scripts still run)
+
+    Returns:
+        Options: Chrome options
+    """
+    options = Options()
+    options.add_argument('--headless')  # Run without window
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+    options.add_argument(f'--user-agent={user_agent}')
+    if block_resources:
+        options.add_argument('--disable-extensions')
+        options.add_argument('--mute-audio')
+        # Image elements keep their src attributes, only the bytes are not downloaded
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        options.page_load_strategy = 'eager'
+    return options
+
+
+class _PooledDriver:
+    """A Chrome instance and its usage"""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.pages = 0
+        self.started_at = time.time()
+        self.idle_since = time.monotonic()
+
+
+class DriverPool:
+    """
+    Bounded pool of headless Chrome drivers with lease/return semantics
+
+    Browsers start on demand up to `size` and are reused across releases and runs.
+    A driver is health-checked when leased, and retired after `max_pages` pages,
+    when its JavaScript heap grows beyond `max_memory_mb`, when its user failed
+    with it, or after `idle_timeout` seconds without a lease. If Chrome cannot
+    start, the pool is unavailable until a retry delay that doubles on each
+    failure has passed.
+    """
+
+    RETRY_DELAY = 30.0
+    MAX_RETRY_DELAY = 1800.0
+
+    def __init__(self, size: int = 1, max_pages: int = 50, max_memory_mb: int = 512,
+                 page_load_timeout: int = 30, user_agent: str = '', block_resources: bool = True,
+                 idle_timeout: float = 300.0):
+        """
+        Initialize the pool
+
+        Args:
+            size: Maximum number of Chrome instances
+            max_pages: Pages loaded before a driver is recycled (0 = never)
+            max_memory_mb: JavaScript heap size that recycles a driver (0 = never)
+            page_load_timeout: Page load timeout of each driver (seconds)
+            user_agent: User-Agent sent by the browsers
+            block_resources: Block image bytes, fonts, media and ad hosts, and load pages eagerly
+            idle_timeout: Seconds an unused driver is kept before it is quit (0 = until close())
+        """
+        self.logger = logging.getLogger(__name__)
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.page_load_timeout = page_load_timeout
+        self.user_agent = user_agent
+        self.block_resources = block_resources
+        self.idle_timeout = idle_timeout
+
+        self._idle: List[_PooledDriver] = []
+        self._leased = 0
+        self._generation = 0
+        self._condition = threading.Condition()
+        # Chrome start failures: no start is attempted before _retry_at
+        self._failures = 0
+        self._retry_at = 0.0
+        self._reaper: Optional[threading.Thread] = None
+
+        REGISTRY.gauge('fitgirl_selenium_drivers', 'Headless Chrome instances by state', ('state',),
+                       callback=lambda: {'idle': len(self._idle), 'leased': self._leased})
+
+    @property
+    def available(self) -> bool:
+        """False while Chrome is considered unable to start (until the retry delay passes)"""
+        return time.monotonic() >= self._retry_at
+
+    def _start(self) -> Optional[_PooledDriver]:
+        """Start a Chrome instance, making the pool unavailable for a while if Chrome cannot run"""
+        try:
+            driver = webdriver.Chrome(options=chrome_options(self.user_agent, self.block_resources))
+            driver.set_page_load_timeout(self.page_load_timeout)
+        except Exception as e:
+            with self._condition:
+                delay = min(self.RETRY_DELAY * 2 ** self._failures, self.MAX_RETRY_DELAY)
+                self._failures += 1
+                self._retry_at = time.monotonic() + delay
+                # Waiting leases give up instead of waiting for a browser that cannot start
+                self._condition.notify_all()
+            self.logger.warning(f"⚠️ Could not start Chrome (continuing without dynamic images, "
+                                f"retrying in {delay:.0f}s): {e}")
+            return None
+        with self._condition:
+            self._failures = 0
+        if self.block_resources:
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(BLOCKED_URL_PATTERNS)})
+            except Exception as e:
+                self.logger.warning(f"⚠️ Could not block heavy resources in Chrome: {e}")
+        DRIVER_STARTS.inc()
+        self.logger.info("🌐 Selenium Chrome driver started")
+        return _PooledDriver(driver)
+
+    def _retire(self, pooled: _PooledDriver, reason: str):
+        """Quit a driver"""
+        DRIVER_RECYCLES.inc(reason=reason)
+        self.logger.debug(f"♻️ Recycling Chrome driver after {pooled.pages} pages ({reason})")
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_healthy(pooled: _PooledDriver) -> bool:
+        """Check that the browser still answers"""
+        try:
+            pooled.driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def _memory_mb(self, pooled: _PooledDriver) -> float:
+        """JavaScript heap of the current page in MB (0 when unknown)"""
+        try:
+            used = pooled.driver.execute_script(
+                'return window.performance && performance.memory ? performance.memory.usedJSHeapSize : 0')
+            return (used or 0) / 1024 / 1024
+        except Exception:
+            return 0.0
+
+    def _acquire(self, timeout: float) -> Optional[_PooledDriver]:
+        """Take an idle driver, or reserve a slot to start one"""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if not self.available:
+                    return None
+                if self._idle:
+                    self._leased += 1
+                    return self._idle.pop()
+                if self._leased < self.size:
+                    self._leased += 1
+                    return _PooledDriver(None)  # Placeholder, started outside the lock
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+    def _release_slot(self):
+        """Give back a leased slot"""
+        with self._condition:
+            self._leased -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self, timeout: float = 120.0) -> Iterator[Optional[webdriver.Chrome]]:
+        """
+        Borrow a driver for one page
+
+        Args:
+            timeout: Seconds to wait for a free driver
+
+        Returns:
+            Context manager yielding a driver, or None if Chrome is unavailable or
+            every driver stayed busy; the driver is discarded if the block raises
+        """
+        started = time.perf_counter()
+        pooled = self._acquire(timeout)
+        if pooled is None:
+            yield None
+            return
+
+        generation = self._generation
+        if pooled.driver is not None and not self._is_healthy(pooled):
+            self._retire(pooled, 'unhealthy')
+            pooled = _PooledDriver(None)
+        if pooled.driver is None:
+            pooled = self._start()
+            if pooled is None:
+                self._release_slot()
+                yield None
+                return
+        DRIVER_LEASE_WAIT_SECONDS.observe(time.perf_counter() - started)
+
+        try:
+            yield pooled.driver
+        except BaseException:
+            self._retire(pooled, 'error')
+            self._release_slot()
+            raise
+
+        pooled.pages += 1
+        if generation != self._generation:
+            self._retire(pooled, 'closed')
+        elif self.max_pages and pooled.pages >= self.max_pages:
+            self._retire(pooled, 'pages')
+        elif self.max_memory_mb and self._memory_mb(pooled) > self.max_memory_mb:
+            self._retire(pooled, 'memory')
+        else:
+            pooled.idle_since = time.monotonic()
+            with self._condition:
+                self._idle.append(pooled)
+                self._start_reaper()
+        self._release_slot()
+
+    def _start_reaper(self):
+        """Start the thread that quits idle drivers, if needed (lock must be held)"""
+        if self.idle_timeout > 0 and (self._reaper is None or not self._reaper.is_alive()):
+            self._reaper = threading.Thread(target=self._reap_idle, name="driver-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_idle(self):
+        """Quit drivers unused for idle_timeout seconds; exits once no driver is idle"""
+        while True:
+            with self._condition:
+                if not self._idle:
+                    self._reaper = None
+                    return
+                now = time.monotonic()
+                expired = [pooled for pooled in self._idle if now - pooled.idle_since >= self.idle_timeout]
+                self._idle = [pooled for pooled in self._idle if pooled not in expired]
+                next_expiry = min((pooled.idle_since + self.idle_timeout for pooled in self._idle), default=now)
+            for pooled in expired:
+                self._retire(pooled, 'idle')
+            if expired:
+                self.logger.info(f"🔒 Closed {len(expired)} idle Selenium driver(s)")
+            time.sleep(max(1.0, next_expiry - time.monotonic()))
+
+    def close(self):
+        """
+        Quit every idle driver; leased drivers are quit when returned
+
+        The pool stays usable: later leases start new browsers.
+        """
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._generation += 1
+        for pooled in idle:
+            self._retire(pooled, 'closed')
+        if idle:
+            self.logger.info(f"🔒 Closed {len(idle)} Selenium driver(s)")
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get pool state
+
+        Returns:
+            Dict[str, Any]: Availability, size and idle/leased drivers
+        """
+        with self._condition:
+            return {
+                'available': self.available,
+                'retry_in_seconds': round(max(0.0, self._retry_at - time.monotonic()), 1),
+                'size': self.size,
+                'idle': len(self._idle),
+                'leased': self._leased,
+                'idle_pages': [pooled.pages for pooled in self._idle]
+            }
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Event batcher for FitGirl Downloader
+Buffers items and delivers them as one batch per flush window
+"""
+
+import logging
+import threading
+from typing import Any, Callable, List, Optional
+
+
+class EventBatcher:
+    """
+    Collects items and hands them to a callback in batches
+    """
+
+    def __init__(self, flush_callback: Callable[[List[Any]], None],
+                 window: float = 1.0, max_batch: int = 100):
+        """
+        Initialize the batcher
+
+        Args:
+            flush_callback: Function that receives the buffered items
+            window: Seconds between the first buffered item and the flush
+            max_batch: Buffer size that triggers an immediate flush
+        """
+        self.logger = logging.getLogger(__name__)
+        self.flush_callback = flush_callback
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self._buffer: List[Any] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def add(self, item: Any):
+        """
+        Buffer an item
+
+        Args:
+            item: Item to deliver in the next batch
+        """
+        with self._lock:
+            self._buffer.append(item)
+            flush_now = len(self._buffer) >= self.max_batch or self.window <= 0
+            if not flush_now and self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if flush_now:
+            self.flush()
+
+    def flush(self):
+        """Deliver the buffered items, if any"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            items, self._buffer = self._buffer, []
+
+        if not items:
+            return
+
+        try:
+            self.flush_callback(items)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Error flushing {len(items)} batched events: {e}")
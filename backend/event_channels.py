@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebSocket event channels for FitGirl Downloader
+Maps client subscriptions to Socket.IO rooms so events only reach interested clients
+"""
+
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .game_release import ReleaseStatus
+
+# Channel names clients can subscribe to
+SYNC_PROGRESS = 'sync_progress'
+NEW_RELEASES = 'new_releases'
+RELEASE_STATUS = 'release_status'
+RELEASE_UPDATES = 'release_updates'
+JOBS = 'jobs'
+
+CHANNELS = (SYNC_PROGRESS, NEW_RELEASES, RELEASE_STATUS, RELEASE_UPDATES, JOBS)
+
+# Channels whose events concern a single release and honor a status filter
+STATUS_FILTERED_CHANNELS = (NEW_RELEASES, RELEASE_STATUS, RELEASE_UPDATES)
+
+# Subscription of clients that connect without choosing channels
+DEFAULT_CHANNELS = CHANNELS
+
+
+def channel_room(channel: str, status: Optional[str] = None) -> str:
+    """
+    Gets the room name for a channel
+
+    Args:
+        channel: Channel name
+        status: Optional status filter (only for status filtered channels)
+
+    Returns:
+        str: Room name
+    """
+    if status and channel in STATUS_FILTERED_CHANNELS:
+        return f"{channel}:{status}"
+    return channel
+
+
+def status_rooms(channel: str, *statuses: Optional[str]) -> List[str]:
+    """
+    Gets the rooms that should receive a release event
+
+    Args:
+        channel: Status filtered channel
+        *statuses: Statuses the release had or has
+
+    Returns:
+        List[str]: Unfiltered room plus one room per distinct status
+    """
+    rooms = [channel]
+    for status in statuses:
+        room = channel_room(channel, status)
+        if status and room not in rooms:
+            rooms.append(room)
+    return rooms
+
+
+def is_channel_room(room: str) -> bool:
+    """
+    Checks if a room belongs to a channel subscription
+
+    Args:
+        room: Room name
+
+    Returns:
+        bool: True for channel rooms (as opposed to per-client rooms)
+    """
+    return room.split(':', 1)[0] in CHANNELS
+
+
+def parse_subscription(data: Any) -> Tuple[List[str], Optional[str]]:
+    """
+    Validates a subscription request
+
+    Args:
+        data: Payload like {"channels": ["sync_progress"], "status": "NEW"};
+              missing channels mean the default subscription
+
+    Returns:
+        Tuple[List[str], Optional[str]]: Channels and status filter
+
+    Raises:
+        ValueError: If a channel or the status is unknown
+    """
+    data = data or {}
+    if not isinstance(data, dict):
+        raise ValueError('Subscription must be an object')
+
+    channels = data.get('channels')
+    if channels is None:
+        channels = list(DEFAULT_CHANNELS)
+    elif isinstance(channels, str):
+        channels = [channels]
+
+    unknown = [channel for channel in channels if channel not in CHANNELS]
+    if unknown:
+        raise ValueError(f"Unknown channels: {', '.join(map(str, unknown))}")
+
+    status = data.get('status') or None
+    if status is not None:
+        try:
+            status = ReleaseStatus[str(status).upper()].name
+        except KeyError:
+            raise ValueError(f"Invalid status: {status}")
+
+    return list(dict.fromkeys(channels)), status
+
+
+def subscription_rooms(channels: Iterable[str], status: Optional[str] = None) -> List[str]:
+    """
+    Gets the rooms a subscription joins
+
+    Args:
+        channels: Subscribed channels
+        status: Optional status filter
+
+    Returns:
+        List[str]: Room names
+    """
+    return [channel_room(channel, status) for channel in channels]
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Event log for FitGirl Downloader
+Keeps the most recent broadcast events so streaming clients can resume after a reconnect
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class LoggedEvent:
+    """
+    Event recorded in the log
+    """
+
+    id: int
+    event: str
+    data: Any
+    rooms: Tuple[str, ...]
+
+
+class EventLog:
+    """
+    Bounded, thread-safe ring buffer of events with blocking reads
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Initialize the event log
+
+        Args:
+            capacity: Number of events kept for resuming clients
+        """
+        self._events: "deque[LoggedEvent]" = deque(maxlen=max(1, capacity))
+        self._condition = threading.Condition()
+        # IDs start from the current time so IDs from a previous process are detected as gaps
+        self._last_id = int(time.time() * 1000)
+
+    @property
+    def last_id(self) -> int:
+        """ID of the most recent event"""
+        return self._last_id
+
+    def append(self, event: str, data: Any, rooms: Iterable[str]) -> int:
+        """
+        Record an event and wake up waiting readers
+
+        Args:
+            event: Event name
+            data: Event payload
+            rooms: Channel rooms the event was sent to
+
+        Returns:
+            int: ID of the recorded event
+        """
+        with self._condition:
+            self._last_id += 1
+            self._events.append(LoggedEvent(self._last_id, event, data, tuple(rooms)))
+            self._condition.notify_all()
+            return self._last_id
+
+    def since(self, last_id: int) -> Tuple[List[LoggedEvent], bool]:
+        """
+        Get the events recorded after an ID
+
+        Args:
+            last_id: ID of the last event the reader received
+
+        Returns:
+            Tuple[List[LoggedEvent], bool]: Newer events, and True if some events
+            between last_id and the first returned event are no longer available
+        """
+        with self._condition:
+            return self._since(last_id)
+
+    def wait(self, last_id: int, timeout: Optional[float] = None) -> Tuple[List[LoggedEvent], bool]:
+        """
+        Block until there are events after an ID or the timeout expires
+
+        Args:
+            last_id: ID of the last event the reader received
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Tuple[List[LoggedEvent], bool]: Same as since()
+        """
+        with self._condition:
+            if self._last_id == last_id:
+                self._condition.wait(timeout)
+            return self._since(last_id)
+
+    def _since(self, last_id: int) -> Tuple[List[LoggedEvent], bool]:
+        """Collect events after last_id (condition must be held)"""
+        if last_id > self._last_id:
+            # ID from another process: everything the reader has is stale
+            return list(self._events), True
+
+        oldest_id = self._events[0].id if self._events else self._last_id + 1
+        missed = last_id < oldest_id - 1
+        events = [event for event in self._events if event.id > last_id]
+        return events, missed
@@ -43,6 +43,7 @@ class GameRelease:
     # Images
     cover_image_url: str = ""
     screenshot_urls: List[str] = field(default_factory=list)
+    images_pending: bool = False  # Images still to be loaded by the browser backfill
     
     # Status and metadata
     status: ReleaseStatus = ReleaseStatus.NEW
@@ -111,6 +112,7 @@ class GameRelease:
             'additional_data': self.additional_data,
             'cover_image_url': self.cover_image_url,
             'screenshot_urls': self.screenshot_urls,
+            'images_pending': self.images_pending,
             'status': self.status.name,
             'status_text': self.status_text,
             'status_color': self.status_color,
@@ -163,6 +165,7 @@ class GameRelease:
             additional_data=data.get('additional_data', {}),
             cover_image_url=data.get('cover_image_url', ''),
             screenshot_urls=data.get('screenshot_urls', []),
+            images_pending=data.get('images_pending', False),
             status=status,
             created_at=created_at,
             updated_at=updated_at
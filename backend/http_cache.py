@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP response cache for FitGirl Downloader
+Keeps scraped pages on disk (SQLite, compressed) and revalidates them with conditional requests
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .metrics import REGISTRY
+
+HTTP_CACHE_REQUESTS = REGISTRY.counter(
+    'fitgirl_http_cache_requests_total', 'Scraper requests by cache result', ['result'])
+
+# Response headers kept with a cached body
+_STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    used_at REAL NOT NULL,
+    size INTEGER NOT NULL
+)
+"""
+
+
+class HttpCache:
+    """
+    Persistent store of successful GET responses keyed by URL
+
+    Entries younger than the TTL are served without a request; older entries are
+    revalidated with If-None-Match / If-Modified-Since when the server sent
+    validators. The least recently used entries are evicted above the size cap.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 200 * 1024 * 1024, ttl: float = 86400):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite database file
+            max_bytes: Maximum compressed size of the stored bodies
+            ttl: Seconds an entry is served without contacting the server
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(_SCHEMA)
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)')
+        self._size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+        REGISTRY.gauge('fitgirl_http_cache_bytes', 'Compressed bytes stored in the HTTP cache',
+                       callback=lambda: self._size)
+        self.logger.info(f"🗄️ HTTP cache at {path} ({self._size / 1024 / 1024:.1f} MB stored)")
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Optional[Dict[str, Any]]: headers, body, etag, last_modified, fetched_at and
+            fresh (younger than the TTL), or None if the URL is not cached
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT headers, body, etag, last_modified, fetched_at FROM responses WHERE url = ?',
+                (url,)).fetchone()
+        if row is None:
+            return None
+
+        headers, body, etag, last_modified, fetched_at = row
+        try:
+            body = zlib.decompress(body)
+        except zlib.error:
+            self.logger.warning(f"⚠️ Corrupt HTTP cache entry dropped: {url}")
+            self.delete(url)
+            return None
+        return {
+            'headers': json.loads(headers),
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': fetched_at,
+            'fresh': time.time() - fetched_at < self.ttl
+        }
+
+    def is_fresh(self, url: str) -> bool:
+        """
+        Check whether a URL would be served without a request
+
+        Args:
+            url: Request URL
+
+        Returns:
+            bool: True if the URL is cached and younger than the TTL
+        """
+        with self._lock:
+            row = self._db.execute('SELECT fetched_at FROM responses WHERE url = ?', (url,)).fetchone()
+        return row is not None and time.time() - row[0] < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Request headers that revalidate a cached entry
+
+        Args:
+            entry: Entry returned by get()
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since (empty without validators)
+        """
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url: str, headers: Any, body: bytes):
+        """
+        Store a successful response
+
+        Args:
+            url: Request URL
+            headers: Response headers (only content type and validators are kept)
+            body: Decoded response body
+        """
+        kept = {name: headers[name] for name in _STORED_HEADERS if headers.get(name)}
+        compressed = zlib.compress(body, 6)
+        now = time.time()
+        with self._lock:
+            previous = self._db.execute('SELECT size FROM responses WHERE url = ?', (url,)).fetchone()
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, json.dumps(kept), compressed, kept.get('ETag'), kept.get('Last-Modified'),
+                 now, now, len(compressed)))
+            self._size += len(compressed) - (previous[0] if previous else 0)
+            self._evict()
+
+    def touch(self, url: str, revalidated: bool = False):
+        """
+        Mark an entry as used
+
+        Args:
+            url: Request URL
+            revalidated: The server confirmed the entry (restarts its TTL)
+        """
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self._db.execute('UPDATE responses SET used_at = ?, fetched_at = ? WHERE url = ?',
+                                 (now, now, url))
+            else:
+                self._db.execute('UPDATE responses SET used_at = ? WHERE url = ?', (now, url))
+
+    def delete(self, url: str):
+        """Remove an entry"""
+        with self._lock:
+            row = self._db.execute('SELECT size FROM responses WHERE url = ?', (url,)).fetchone()
+            if row:
+                self._db.execute('DELETE FROM responses WHERE url = ?', (url,))
+                self._size -= row[0]
+
+    def _evict(self):
+        """Drop least recently used entries above the size cap (lock held)"""
+        if self._size <= self.max_bytes:
+            return
+        evicted = 0
+        for url, size in self._db.execute('SELECT url, size FROM responses ORDER BY used_at').fetchall():
+            if self._size <= self.max_bytes:
+                break
+            self._db.execute('DELETE FROM responses WHERE url = ?', (url,))
+            self._size -= size
+            evicted += 1
+        self.logger.debug(f"🗄️ HTTP cache evicted {evicted} entries")
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+            self._size = 0
+        self.logger.info("🗄️ HTTP cache cleared")
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict[str, Any]: Entries, stored bytes, size cap and TTL
+        """
+        with self._lock:
+            entries = self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        return {
+            'http_cache_entries': entries,
+            'http_cache_bytes': self._size,
+            'http_cache_max_bytes': self.max_bytes,
+            'http_cache_ttl': self.ttl
+        }
+
+
+class CachingAdapter(HTTPAdapter):
+    """
+    Transport adapter that answers GET requests from an HttpCache
+
+    A request with 'Cache-Control: no-cache' skips TTL freshness and is always
+    revalidated. Responses served from the cache have from_cache set to True.
+    """
+
+    def __init__(self, cache: HttpCache, **kwargs: Any):
+        """
+        Initialize the adapter
+
+        Args:
+            cache: Response store
+            **kwargs: HTTPAdapter options (e.g. pool_maxsize)
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs: Any) -> requests.Response:
+        if request.method != 'GET' or stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        url = request.url
+        entry = self.cache.get(url)
+        if entry is not None:
+            if entry['fresh'] and 'no-cache' not in request.headers.get('Cache-Control', ''):
+                HTTP_CACHE_REQUESTS.inc(result='hit')
+                self.cache.touch(url)
+                return self._cached_response(request, entry)
+            request.headers.update(self.cache.conditional_headers(entry))
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            HTTP_CACHE_REQUESTS.inc(result='revalidated')
+            self.cache.touch(url, revalidated=True)
+            response.close()
+            return self._cached_response(request, entry)
+
+        HTTP_CACHE_REQUESTS.inc(result='miss')
+        if response.status_code == 200:
+            self.cache.put(url, response.headers, response.content)
+        return response
+
+    def _cached_response(self, request: requests.PreparedRequest, entry: Dict[str, Any]) -> requests.Response:
+        """Build a response from a cache entry"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry['body']
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        return response
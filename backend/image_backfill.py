@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Image backfill for FitGirl Downloader
+Loads the images of releases flagged images_pending with the browser pool, off the sync path
+"""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+from .game_release import GameRelease
+from .json_database_manager import JsonDatabaseManager
+from .metrics import REGISTRY
+
+IMAGE_BACKFILL_RELEASES = REGISTRY.counter(
+    'fitgirl_image_backfill_releases_total', 'Releases processed by the image backfill', ['result'])
+
+
+class ImageBackfillWorker:
+    """
+    Low-priority background thread that drains the images_pending queue
+
+    Releases are processed one at a time with a pause in between, so the backfill
+    never competes with a sync for more than one browser. The pool quits browsers
+    left idle once the queue is drained.
+    """
+
+    def __init__(self, db_manager: JsonDatabaseManager, scraper,
+                 on_update: Optional[Callable[[GameRelease], None]] = None,
+                 interval: float = 300.0, delay: float = 1.0):
+        """
+        Initialize the worker
+
+        Args:
+            db_manager: Database manager
+            scraper: Scraper providing load_dynamic_images() and the browser pool
+            on_update: Called with each release whose images were updated
+            interval: Seconds between queue checks when nobody calls notify()
+            delay: Pause between two releases (seconds)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_manager = db_manager
+        self.scraper = scraper
+        self.on_update = on_update
+        self.interval = interval
+        self.delay = delay
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        REGISTRY.gauge('fitgirl_image_backfill_pending', 'Releases waiting for the image backfill',
+                       callback=lambda: len(self.db_manager.select_release_ids(images_pending=True)))
+
+    def start(self):
+        """Start the worker thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="image-backfill", daemon=True)
+        self._thread.start()
+        self.logger.info("🖼️ Image backfill worker started")
+
+    def stop(self):
+        """Stop the worker after the release being processed"""
+        self._stop.set()
+        self._wake.set()
+
+    def notify(self):
+        """Check the queue now (e.g. after a sync inserted flagged releases)"""
+        self._wake.set()
+
+    def _run(self):
+        """Process the queue whenever notified or every interval"""
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                self.logger.error(f"❌ Image backfill error: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def run_once(self) -> int:
+        """
+        Process every release currently flagged images_pending
+
+        Returns:
+            int: Number of releases processed
+        """
+        pool = self.scraper.driver_pool
+        if not pool or not pool.available:
+            return 0
+        release_ids = self.db_manager.select_release_ids(images_pending=True)
+        if not release_ids:
+            return 0
+
+        self.logger.info(f"🖼️ Image backfill: {len(release_ids)} releases pending")
+        processed = 0
+        for release_id in release_ids:
+            if self._stop.is_set():
+                break
+
+            release = self.db_manager.get_release_by_id(release_id)
+            if not release or not release.images_pending:
+                continue
+
+            images = self.scraper.load_dynamic_images(release.url, release.title)
+            if images is None:
+                # No browser: keep the flags for a later pass
+                self.logger.warning("⚠️ No browser available for the image backfill, retrying later")
+                IMAGE_BACKFILL_RELEASES.inc(result='deferred')
+                break
+
+            cover_image_url, screenshot_urls = images
+            if not self.db_manager.update_release_images(release_id, cover_image_url, screenshot_urls):
+                IMAGE_BACKFILL_RELEASES.inc(result='error')
+                continue
+            IMAGE_BACKFILL_RELEASES.inc(result='found' if cover_image_url or screenshot_urls else 'empty')
+            processed += 1
+
+            if self.on_update:
+                updated = self.db_manager.get_release_by_id(release_id)
+                if updated:
+                    self.on_update(updated)
+
+            self._stop.wait(self.delay)
+
+        return processed
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Background job manager for FitGirl Downloader
+Runs long operations on a bounded executor and reports their progress
+"""
+
+import logging
+import threading
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class BackgroundJob:
+    """
+    State of a background job
+    """
+
+    id: str
+    job_type: str
+    key: str
+    status: str = "queued"  # queued, running, completed, error
+    message: str = ""
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def is_active(self) -> bool:
+        """True while the job is queued or running"""
+        return self.status in ("queued", "running")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the job to dictionary for serialization"""
+        return {
+            'id': self.id,
+            'type': self.job_type,
+            'key': self.key,
+            'status': self.status,
+            'message': self.message,
+            'progress': self.progress,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class JobManager:
+    """
+    Bounded executor for background jobs with duplicate collapsing
+    """
+
+    def __init__(self, max_workers: int = 2, history_size: int = 200):
+        """
+        Initialize the job manager
+
+        Args:
+            max_workers: Maximum number of jobs running at the same time
+            history_size: Number of jobs kept for status queries
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max(1, max_workers)
+        self.history_size = history_size
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+        self._jobs: "OrderedDict[str, BackgroundJob]" = OrderedDict()
+        self._active_by_key: Dict[str, BackgroundJob] = {}
+        self._lock = threading.Lock()
+        self.update_callback = None
+
+        self.logger.info(f"🔧 Job manager initialized ({self.max_workers} workers)")
+
+    def set_update_callback(self, callback: Callable[[BackgroundJob], None]):
+        """
+        Set the callback notified on every job state change
+
+        Args:
+            callback: Function that receives the updated job
+        """
+        self.update_callback = callback
+
+    def submit(self, job_type: str, key: str, func: Callable[..., Any], *args: Any) -> Tuple[BackgroundJob, bool]:
+        """
+        Submit a job, collapsing it into an active job with the same key
+
+        Args:
+            job_type: Kind of job (e.g. 'release_resync')
+            key: Deduplication key; only one active job per key runs
+            func: Function called as func(report, *args); report(message, **progress)
+                  publishes progress and its return value becomes the job result
+            *args: Extra arguments for func
+
+        Returns:
+            Tuple[BackgroundJob, bool]: The job and True if it was newly created
+        """
+        with self._lock:
+            existing = self._active_by_key.get(key)
+            if existing:
+                self.logger.info(f"⏭️ Job already active for {key}: {existing.id}")
+                return existing, False
+
+            job = BackgroundJob(id=uuid.uuid4().hex, job_type=job_type, key=key)
+            self._jobs[job.id] = job
+            self._active_by_key[key] = job
+            self._trim_history()
+
+        self.logger.info(f"📥 Job queued: {job.job_type} ({job.key}) -> {job.id}")
+        self._notify(job)
+        self._executor.submit(self._run, job, func, args)
+        return job, True
+
+    def _run(self, job: BackgroundJob, func: Callable[..., Any], args: tuple):
+        """Execute a job and record its outcome"""
+        def report(message: str, **progress: Any):
+            job.message = message
+            job.progress.update(progress)
+            self._notify(job)
+
+        job.status = "running"
+        job.started_at = datetime.now()
+        self._notify(job)
+
+        try:
+            job.result = func(report, *args)
+            job.status = "completed"
+            self.logger.info(f"✅ Job completed: {job.job_type} ({job.key})")
+        except Exception as e:
+            job.status = "error"
+            job.error = str(e)
+            job.message = str(e)
+            self.logger.error(f"❌ Job failed: {job.job_type} ({job.key}): {e}")
+            self.logger.debug(traceback.format_exc())
+        finally:
+            job.finished_at = datetime.now()
+            with self._lock:
+                if self._active_by_key.get(job.key) is job:
+                    del self._active_by_key[job.key]
+            self._notify(job)
+
+    def _notify(self, job: BackgroundJob):
+        """Invoke the update callback, never letting it break the job"""
+        if self.update_callback:
+            try:
+                self.update_callback(job)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Error notifying job update: {e}")
+
+    def _trim_history(self):
+        """Forget the oldest finished jobs beyond the history size"""
+        while len(self._jobs) > self.history_size:
+            oldest_id = next((job_id for job_id, job in self._jobs.items() if not job.is_active), None)
+            if oldest_id is None:
+                break
+            del self._jobs[oldest_id]
+
+    def get_job(self, job_id: str) -> Optional[BackgroundJob]:
+        """
+        Get a job by ID
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Optional[BackgroundJob]: Found job or None
+        """
+        return self._jobs.get(job_id)
+
+    def list_jobs(self, active_only: bool = False) -> List[BackgroundJob]:
+        """
+        List known jobs, most recent first
+
+        Args:
+            active_only: Only return queued or running jobs
+
+        Returns:
+            List[BackgroundJob]: Jobs
+        """
+        jobs = list(self._jobs.values())
+        if active_only:
+            jobs = [job for job in jobs if job.is_active]
+        return list(reversed(jobs))
+
+    def shutdown(self, wait: bool = False):
+        """
+        Stop accepting jobs
+
+        Args:
+            wait: Wait for running jobs to finish
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self.logger.info("🔒 Job manager stopped")
@@ -8,18 +8,42 @@ Handles all database operations using JSON files
 import json
 import os
 import shutil
-from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+import threading
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import List, Optional, Dict, Any, Tuple, Callable, Iterable, Set
 import logging
 from contextlib import contextmanager
 
 from .game_release import GameRelease, ReleaseStatus
+from .metrics import REGISTRY
+
+DB_OPERATION_SECONDS = REGISTRY.histogram(
+    'fitgirl_db_operation_duration_seconds', 'Duration of database operations', ['operation'],
+    server_timing='db-{operation}')
+DB_SAVED_BYTES = REGISTRY.counter(
+    'fitgirl_db_saved_bytes_total', 'Bytes written by database saves')
+DB_FILE_BYTES = REGISTRY.gauge(
+    'fitgirl_db_file_bytes', 'Size of the database file after the last save')
+
+
+def synchronized(method):
+    """Serialize mutations of the in-memory database across threads"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class JsonDatabaseManager:
     """
     JSON database manager for FitGirl Downloader
     """
     
+    # Rejected listing URLs remembered for the incremental sync early stop
+    MAX_REJECTED_URLS = 1000
+    
     def __init__(self, db_path: str = "fitgirl_releases.json"):
         """
         Initialize the JSON database manager
@@ -30,6 +54,9 @@ class JsonDatabaseManager:
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
         
+        # Sync worker and background jobs write concurrently
+        self._lock = threading.RLock()
+        
         # Default database structure
         self.db_structure = {
             "metadata": {
@@ -39,9 +66,17 @@ class JsonDatabaseManager:
                 "total_releases": 0
             },
             "releases": [],
-            "operation_logs": []
+            "operation_logs": [],
+            # Listing URLs that could not be stored (no magnet, parse failure) -> last failure time
+            "rejected_urls": {}
         }
         
+        # Callbacks notified after every mutation: (action, release_id)
+        self._change_listeners: List[Callable[[str, Optional[int]], None]] = []
+        
+        # Release count per status, maintained on every mutation
+        self._status_counts: Dict[str, int] = {}
+        
         # Automatically load the database
         self._load_database()
     
@@ -66,6 +101,7 @@ class JsonDatabaseManager:
             self.logger.error(f"❌ Error initializing database: {e}")
             return False
     
+    @DB_OPERATION_SECONDS.time(operation='load')
     def _load_database(self):
         """
         Load the database from the JSON file
@@ -82,11 +118,15 @@ class JsonDatabaseManager:
             if "operation_logs" not in data:
                 data["operation_logs"] = []
             
+            if "rejected_urls" not in data:
+                data["rejected_urls"] = {}
+            
             # Update metadata
             data["metadata"]["last_updated"] = datetime.now().isoformat()
             data["metadata"]["total_releases"] = len(data.get("releases", []))
             
             self.db_structure = data
+            self._recount_statuses()
             
         except json.JSONDecodeError as e:
             self.logger.error(f"❌ JSON decode error: {e}")
@@ -106,6 +146,8 @@ class JsonDatabaseManager:
             self.db_structure["metadata"]["last_updated"] = datetime.now().isoformat()
             self._save_database()
     
+    @synchronized
+    @DB_OPERATION_SECONDS.time(operation='save')
     def _save_database(self):
         """
         Save the database to the JSON file
@@ -113,10 +155,78 @@ class JsonDatabaseManager:
         try:
             with open(self.db_path, 'w', encoding='utf-8') as f:
                 json.dump(self.db_structure, f, indent=2, ensure_ascii=False)
+                saved_bytes = f.tell()
+            DB_SAVED_BYTES.inc(saved_bytes)
+            DB_FILE_BYTES.set(saved_bytes)
             self.logger.debug(f"💾 Database saved: {self.db_path}")
         except Exception as e:
             self.logger.error(f"❌ Error saving database: {e}")
     
+    def add_change_listener(self, callback: Callable[[str, Optional[int]], None]):
+        """
+        Register a callback that is notified after every mutation
+        
+        Args:
+            callback: Function that receives (action, release_id); release_id is None
+                      when every release is affected
+        """
+        self._change_listeners.append(callback)
+    
+    def _notify_change(self, action: str, release_id: Optional[int] = None):
+        """
+        Notify change listeners about a mutation
+        
+        Args:
+            action: Kind of mutation ('insert', 'update', 'status', 'delete', 'clear')
+            release_id: Affected release or None for all releases
+        """
+        for callback in self._change_listeners:
+            try:
+                callback(action, release_id)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Error in change listener: {e}")
+    
+    def _recount_statuses(self):
+        """
+        Rebuild the per-status release counters
+        """
+        counts = {status.name: 0 for status in ReleaseStatus}
+        for release_dict in self.db_structure["releases"]:
+            status = release_dict.get("status") or "NEW"
+            counts[status] = counts.get(status, 0) + 1
+        self._status_counts = counts
+    
+    def _adjust_status_count(self, old_status: Optional[str], new_status: Optional[str]):
+        """
+        Update the per-status counters for a single release
+        
+        Args:
+            old_status: Previous status name, None for an inserted release
+            new_status: New status name, None for a deleted release
+        """
+        if old_status:
+            self._status_counts[old_status] = self._status_counts.get(old_status, 0) - 1
+        if new_status:
+            self._status_counts[new_status] = self._status_counts.get(new_status, 0) + 1
+    
+    def count_releases(self) -> int:
+        """
+        Gets the total number of releases without materializing them
+        
+        Returns:
+            int: Number of releases
+        """
+        return len(self.db_structure["releases"])
+    
+    def get_status_counts(self) -> Dict[str, int]:
+        """
+        Gets the number of releases per status
+        
+        Returns:
+            Dict[str, int]: Status name -> number of releases
+        """
+        return {status.name: self._status_counts.get(status.name, 0) for status in ReleaseStatus}
+    
     def _get_next_id(self) -> int:
         """
         Generate the next unique ID for a release
@@ -130,6 +240,7 @@ class JsonDatabaseManager:
         max_id = max([r.get("id", 0) for r in self.db_structure["releases"]], default=0)
         return max_id + 1
     
+    @synchronized
     def insert_release(self, release: GameRelease) -> Optional[int]:
         """
         Insert a new release
@@ -162,28 +273,32 @@ class JsonDatabaseManager:
             # Convert to dictionary
             release_dict = self._release_to_dict(release)
             release_dict["id"] = new_id
+            release_dict["created_at"] = datetime.now().isoformat()
             
             # Detailed image logging
-            self.logger.info(f"💾 Inserting release with images:")
-            self.logger.info(f"   - Cover: {release.cover_image_url}")
-            self.logger.info(f"   - Screenshots: {len(release.screenshot_urls)} images")
-            if release.screenshot_urls:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("💾 Inserting release with images:")
+                self.logger.debug("   - Cover: %s", release.cover_image_url)
+                self.logger.debug("   - Screenshots: %s images", len(release.screenshot_urls))
                 for i, screenshot in enumerate(release.screenshot_urls[:3]):  # Only show first 3
-                    self.logger.info(f"     {i+1}. {screenshot}")
+                    self.logger.debug("     %s. %s", i+1, screenshot)
             
             # Add to list
             self.db_structure["releases"].append(release_dict)
+            self._adjust_status_count(None, release_dict["status"])
             
             # Save to file
             self._save_database()
+            self._notify_change('insert', new_id)
             
-            self.logger.info(f"✅ Release inserted: {new_id} - {release.title}")
+            self.logger.info("✅ Release inserted: %s - %s", new_id, release.title)
             return new_id
             
         except Exception as e:
             self.logger.error(f"❌ Error inserting release: {e}")
             return None
     
+    @synchronized
     def update_release(self, release: GameRelease) -> bool:
         """
         Update an existing release
@@ -201,11 +316,13 @@ class JsonDatabaseManager:
                     # Update data
                     release_dict = self._release_to_dict(release)
                     release_dict["id"] = existing_release["id"]
-                    release_dict["created_at"] = existing_release["created_at"]
+                    release_dict["created_at"] = existing_release.get("created_at")
                     release_dict["updated_at"] = datetime.now().isoformat()
                     
                     self.db_structure["releases"][i] = release_dict
+                    self._adjust_status_count(existing_release.get("status") or "NEW", release_dict["status"])
                     self._save_database()
+                    self._notify_change('update', existing_release["id"])
                     
                     self.logger.info(f"✅ Release updated: {existing_release['id']} - {release.title}")
                     return True
@@ -217,6 +334,7 @@ class JsonDatabaseManager:
             self.logger.error(f"❌ Error updating release: {e}")
             return False
 
+    @synchronized
     def update_release_by_id(self, release_id: int, release: GameRelease) -> bool:
         """
         Update an existing release by ID
@@ -233,24 +351,14 @@ class JsonDatabaseManager:
             for i, existing_release in enumerate(self.db_structure["releases"]):
                 if existing_release["id"] == release_id:
                     self.logger.info(f"🔍 Found existing release: {existing_release.get('title', 'No title')}")
-                    self.logger.info(f"🔍 Existing release keys: {list(existing_release.keys())}")
                     
                     # Update data
-                    release_dict = self._release_to_dict(release)
-                    release_dict["id"] = release_id  # Preserve the original ID
-                    
-                    # Preserve created_at if it exists, otherwise use current time
-                    if "created_at" in existing_release and existing_release["created_at"]:
-                        release_dict["created_at"] = existing_release["created_at"]
-                        self.logger.info(f"🔍 Preserved created_at: {existing_release['created_at']}")
-                    else:
-                        release_dict["created_at"] = datetime.now().isoformat()
-                        self.logger.info(f"🔍 Set new created_at: {release_dict['created_at']}")
-                    
-                    release_dict["updated_at"] = datetime.now().isoformat()
+                    release_dict = self._build_updated_dict(existing_release, release_id, release)
                     
                     self.db_structure["releases"][i] = release_dict
+                    self._adjust_status_count(existing_release.get("status") or "NEW", release_dict["status"])
                     self._save_database()
+                    self._notify_change('update', release_id)
                     
                     self.logger.info(f"✅ Release updated by ID: {release_id} - {release.title}")
                     return True
@@ -264,6 +372,115 @@ class JsonDatabaseManager:
             self.logger.error(f"❌ Traceback: {traceback.format_exc()}")
             return False
     
+    @synchronized
+    def update_releases_by_id(self, updates: List[Tuple[int, GameRelease]]) -> int:
+        """
+        Update several releases by ID with a single database save
+        
+        Args:
+            updates: List of (release_id, release data) pairs
+            
+        Returns:
+            int: Number of releases updated
+        """
+        try:
+            index_by_id = {r["id"]: i for i, r in enumerate(self.db_structure["releases"])}
+            updated_ids = []
+            
+            for release_id, release in updates:
+                index = index_by_id.get(release_id)
+                if index is None:
+                    self.logger.warning(f"⚠️ Release not found for update by ID: {release_id}")
+                    continue
+                
+                existing_release = self.db_structure["releases"][index]
+                release_dict = self._build_updated_dict(existing_release, release_id, release)
+                self.db_structure["releases"][index] = release_dict
+                self._adjust_status_count(existing_release.get("status") or "NEW", release_dict["status"])
+                updated_ids.append(release_id)
+            
+            if updated_ids:
+                self._save_database()
+                for release_id in updated_ids:
+                    self._notify_change('update', release_id)
+            
+            self.logger.info(f"✅ Batch update: {len(updated_ids)} of {len(updates)} releases updated")
+            return len(updated_ids)
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error in batch update: {e}")
+            return 0
+    
+    def _build_updated_dict(self, existing_release: Dict[str, Any], release_id: int,
+                            release: GameRelease) -> Dict[str, Any]:
+        """
+        Build the stored dictionary of an updated release
+        
+        Only scraped fields are replaced. The status and the images loaded by the
+        backfill are read from the stored release (the lock is held), so changes
+        made while the release was being re-scraped are not overwritten.
+        
+        Args:
+            existing_release: Stored dictionary being replaced
+            release_id: ID to preserve
+            release: New release data
+            
+        Returns:
+            Dict[str, Any]: Dictionary to store
+        """
+        release_dict = self._release_to_dict(release)
+        release_dict["id"] = release_id  # Preserve the original ID
+        release_dict["status"] = existing_release.get("status") or release_dict["status"]
+        
+        # Images only a browser can load: keep those the backfill already stored
+        if release.images_pending and (existing_release.get("cover_image_url") or
+                                       existing_release.get("screenshot_urls")):
+            release_dict["cover_image_url"] = existing_release.get("cover_image_url") or ""
+            release_dict["screenshot_urls"] = existing_release.get("screenshot_urls") or []
+            release_dict["images_pending"] = False
+        
+        # Preserve created_at if it exists, otherwise use current time
+        release_dict["created_at"] = existing_release.get("created_at") or datetime.now().isoformat()
+        release_dict["updated_at"] = datetime.now().isoformat()
+        return release_dict
+    
+    def select_release_ids(self, status: Optional[ReleaseStatus] = None, missing_cover: bool = False,
+                           missing_screenshots: bool = False, stale_days: Optional[int] = None,
+                           images_pending: bool = False) -> List[int]:
+        """
+        Select release IDs matching all the given conditions
+        
+        Args:
+            status: Only releases with this status
+            missing_cover: Only releases without a cover image
+            missing_screenshots: Only releases without screenshots
+            stale_days: Only releases not refreshed in this many days
+                        (releases without timestamps count as stale)
+            images_pending: Only releases waiting for the image backfill
+            
+        Returns:
+            List[int]: Matching release IDs
+        """
+        cutoff = (datetime.now() - timedelta(days=stale_days)).isoformat() if stale_days is not None else None
+        
+        release_ids = []
+        for release_dict in self.db_structure["releases"]:
+            if status and release_dict.get("status", "NEW") != status.name:
+                continue
+            if missing_cover and release_dict.get("cover_image_url"):
+                continue
+            if missing_screenshots and release_dict.get("screenshot_urls"):
+                continue
+            if images_pending and not release_dict.get("images_pending"):
+                continue
+            if cutoff:
+                refreshed_at = release_dict.get("updated_at") or release_dict.get("created_at")
+                if refreshed_at and refreshed_at >= cutoff:
+                    continue
+            release_ids.append(release_dict["id"])
+        
+        return release_ids
+    
     def upsert_release(self, release: GameRelease) -> Optional[int]:
         """
         Insert or update a release
@@ -290,6 +507,7 @@ class JsonDatabaseManager:
             self.logger.error(f"❌ Error in upsert release: {e}")
             return None
     
+    @DB_OPERATION_SECONDS.time(operation='get')
     def get_release_by_id(self, release_id: int) -> Optional[GameRelease]:
         """
         Gets a release by ID
@@ -330,6 +548,7 @@ class JsonDatabaseManager:
             self.logger.error(f"❌ Error getting release by URL: {e}")
             return None
     
+    @DB_OPERATION_SECONDS.time(operation='query')
     def get_all_releases(self, limit: Optional[int] = None, 
                         offset: int = 0, sort_by: str = "date_desc") -> List[GameRelease]:
         """
@@ -400,6 +619,7 @@ class JsonDatabaseManager:
             self.logger.error(f"❌ Error getting releases: {e}")
             return []
     
+    @DB_OPERATION_SECONDS.time(operation='search')
     def search_releases(self, query: str, status_filter: Optional[ReleaseStatus] = None,
                        limit: Optional[int] = None) -> List[GameRelease]:
         """
@@ -443,6 +663,7 @@ class JsonDatabaseManager:
             self.logger.error(f"❌ Error searching releases: {e}")
             return []
     
+    @synchronized
     def update_release_status(self, release_id: int, status: ReleaseStatus) -> bool:
         """
         Updates the status of a release
@@ -457,9 +678,11 @@ class JsonDatabaseManager:
         try:
             for release_dict in self.db_structure["releases"]:
                 if release_dict["id"] == release_id:
+                    self._adjust_status_count(release_dict.get("status") or "NEW", status.name)
                     release_dict["status"] = status.name
                     release_dict["updated_at"] = datetime.now().isoformat()
                     self._save_database()
+                    self._notify_change('status', release_id)
                     
                     self.logger.info(f"✅ Status updated: {release_id} -> {status.name}")
                     return True
@@ -471,6 +694,43 @@ class JsonDatabaseManager:
             self.logger.error(f"❌ Error updating status: {e}")
             return False
     
+    @synchronized
+    def update_release_images(self, release_id: int, cover_image_url: str, screenshot_urls: List[str]) -> bool:
+        """
+        Store the images found by the backfill and clear the pending flag
+        
+        Args:
+            release_id: ID of the release
+            cover_image_url: Cover image URL (empty keeps the current one)
+            screenshot_urls: Screenshot URLs (empty keeps the current ones)
+            
+        Returns:
+            bool: True if updated successfully
+        """
+        try:
+            for release_dict in self.db_structure["releases"]:
+                if release_dict["id"] == release_id:
+                    if cover_image_url:
+                        release_dict["cover_image_url"] = cover_image_url
+                    if screenshot_urls:
+                        release_dict["screenshot_urls"] = screenshot_urls
+                    release_dict["images_pending"] = False
+                    release_dict["updated_at"] = datetime.now().isoformat()
+                    self._save_database()
+                    self._notify_change('update', release_id)
+                    
+                    self.logger.info(f"🖼️ Images updated: {release_id} ({1 if cover_image_url else 0} cover, "
+                                     f"{len(screenshot_urls)} screenshots)")
+                    return True
+            
+            self.logger.warning(f"⚠️ Release not found for image update: {release_id}")
+            return False
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error updating images: {e}")
+            return False
+    
+    @synchronized
     def delete_release(self, release_id: int) -> bool:
         """
         Deletes a release
@@ -485,7 +745,9 @@ class JsonDatabaseManager:
             for i, release_dict in enumerate(self.db_structure["releases"]):
                 if release_dict["id"] == release_id:
                     deleted_release = self.db_structure["releases"].pop(i)
+                    self._adjust_status_count(deleted_release.get("status") or "NEW", None)
                     self._save_database()
+                    self._notify_change('delete', release_id)
                     
                     self.logger.info(f"✅ Release deleted: {release_id} - {deleted_release.get('title', '')}")
                     return True
@@ -497,6 +759,7 @@ class JsonDatabaseManager:
             self.logger.error(f"❌ Error deleting release: {e}")
             return False
     
+    @synchronized
     def clear_all_releases(self) -> bool:
         """
         Deletes all releases
@@ -507,7 +770,10 @@ class JsonDatabaseManager:
         try:
             count = len(self.db_structure["releases"])
             self.db_structure["releases"] = []
+            self.db_structure["rejected_urls"] = {}
+            self._recount_statuses()
             self._save_database()
+            self._notify_change('clear')
             
             self.logger.info(f"✅ All releases deleted: {count} releases")
             return True
@@ -516,6 +782,41 @@ class JsonDatabaseManager:
             self.logger.error(f"❌ Error deleting all releases: {e}")
             return False
     
+    def get_rejected_urls(self) -> Set[str]:
+        """
+        Gets the listing URLs that earlier syncs could not store
+        
+        Returns:
+            Set[str]: Rejected torrent URLs
+        """
+        with self._lock:
+            return set(self.db_structure["rejected_urls"])
+    
+    @synchronized
+    def update_rejected_urls(self, rejected: Iterable[str], accepted: Iterable[str]):
+        """
+        Record the listing URLs a sync rejected and forget those it stored
+        
+        Only the most recent MAX_REJECTED_URLS failures are kept.
+        
+        Args:
+            rejected: URLs that could not be stored in this sync
+            accepted: URLs stored in this sync
+        """
+        rejected_urls = self.db_structure["rejected_urls"]
+        changed = False
+        for url in accepted:
+            changed |= rejected_urls.pop(url, None) is not None
+        now = datetime.now().isoformat()
+        for url in rejected:
+            rejected_urls.pop(url, None)  # Move to the end (most recent)
+            rejected_urls[url] = now
+            changed = True
+        for url in list(rejected_urls)[:max(0, len(rejected_urls) - self.MAX_REJECTED_URLS)]:
+            del rejected_urls[url]
+        if changed:
+            self._save_database()
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Gets database statistics
@@ -526,13 +827,8 @@ class JsonDatabaseManager:
         try:
             releases = self.db_structure["releases"]
             
-            # Count by status
-            status_counts = {}
-            for status in ReleaseStatus:
-                status_counts[status.name] = len([
-                    r for r in releases 
-                    if r.get("status", "NEW") == status.name
-                ])
+            # Count by status (maintained counters)
+            status_counts = self.get_status_counts()
             
             # Get dates
             dates = [r.get("publish_date") for r in releases if r.get("publish_date")]
@@ -600,6 +896,7 @@ class JsonDatabaseManager:
                     self.logger.info(f"📦 Migrated status for: {release_dict.get('title', 'No title')}")
             
             if migrated_count > 0:
+                self._recount_statuses()
                 self._save_database()
                 self.logger.info(f"✅ Migration completed: {migrated_count} releases updated")
             else:
@@ -633,6 +930,7 @@ class JsonDatabaseManager:
             "additional_data": release.additional_data,
             "cover_image_url": release.cover_image_url,
             "screenshot_urls": release.screenshot_urls,
+            "images_pending": release.images_pending,
             "status": release.status.name
         }
     
@@ -675,6 +973,7 @@ class JsonDatabaseManager:
                 additional_data=release_dict.get("additional_data", {}),
                 cover_image_url=release_dict.get("cover_image_url", ""),
                 screenshot_urls=release_dict.get("screenshot_urls", []),
+                images_pending=release_dict.get("images_pending", False),
                 status=ReleaseStatus[release_dict.get("status", "NEW")]
             )
             
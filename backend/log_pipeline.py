@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Logging pipeline for FitGirl Downloader
+Hands log records to a background thread and samples high-volume message categories
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import Dict, Iterable, Optional
+
+from .metrics import REGISTRY
+
+LOG_FORMAT = '%(asctime)s %(levelname)s [%(name)s] %(message)s'
+LOG_DIR = 'logs'
+LOG_FILE = 'fitgirl_downloader.log'
+
+# Categories whose DEBUG messages are only emitted when listed in log_verbose
+VERBOSE_CATEGORIES = ('details', 'images')
+
+LOG_RECORDS_DROPPED = REGISTRY.counter(
+    'fitgirl_log_records_dropped_total', 'Log records dropped by category sampling', ('category',))
+
+# Category loggers created so far and the categories currently enabled for DEBUG
+_category_loggers: Dict[str, logging.Logger] = {}
+_verbose_categories = set()
+_listener: Optional[QueueListener] = None
+
+
+def _category(record: logging.LogRecord) -> str:
+    """Category of a record (last component of the logger name)"""
+    return record.name.rsplit('.', 1)[-1]
+
+
+def _apply_verbosity(logger: logging.Logger, category: str):
+    """Enable DEBUG on a verbose category logger only when it was requested"""
+    if category in VERBOSE_CATEGORIES:
+        logger.setLevel(logging.DEBUG if category in _verbose_categories else logging.INFO)
+
+
+def get_category_logger(name: str, category: str) -> logging.Logger:
+    """
+    Get the logger for a message category of a module
+
+    Args:
+        name: Module logger name (usually __name__)
+        category: Message category (e.g. 'progress', 'images')
+
+    Returns:
+        logging.Logger: Child logger named '<name>.<category>'
+    """
+    logger = logging.getLogger(f"{name}.{category}")
+    _category_loggers[logger.name] = logger
+    _apply_verbosity(logger, category)
+    return logger
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Passes one of every N records of a sampled category
+    """
+
+    def __init__(self, rates: Optional[Dict[str, int]] = None):
+        """
+        Initialize the filter
+
+        Args:
+            rates: Category -> N (1 or less keeps every record)
+        """
+        super().__init__()
+        self.rates = {category: int(rate) for category, rate in (rates or {}).items() if int(rate) > 1}
+        self._seen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Warnings and errors are never sampled away
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+
+        category = _category(record)
+        rate = self.rates.get(category)
+        if rate is None:
+            return True
+
+        with self._lock:
+            seen = self._seen.get(category, 0)
+            self._seen[category] = seen + 1
+
+        if seen % rate == 0:
+            return True
+        LOG_RECORDS_DROPPED.inc(category=category)
+        return False
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves message formatting to the listener thread
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Tracebacks are rendered now, while the frames they reference are current
+        if record.exc_info:
+            return super().prepare(record)
+        return record
+
+
+def configure_logging(level: int = logging.INFO, log_to_file: bool = False, max_log_files: int = 30,
+                      sample_rates: Optional[Dict[str, int]] = None,
+                      verbose: Iterable[str] = ()) -> QueueListener:
+    """
+    Route every log record through a queue to a background listener
+
+    Args:
+        level: Root logging level
+        log_to_file: Also write a daily rotated file in logs/
+        max_log_files: Number of rotated files kept
+        sample_rates: Category -> N, keeping one of every N records of that category
+        verbose: Categories whose DEBUG messages are emitted
+
+    Returns:
+        QueueListener: The running listener (stopped automatically at exit)
+    """
+    global _listener
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler()]
+    if log_to_file:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        handlers.append(TimedRotatingFileHandler(os.path.join(LOG_DIR, LOG_FILE), when='midnight',
+                                                 backupCount=max_log_files, encoding='utf-8'))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(SamplingFilter(sample_rates))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _verbose_categories.clear()
+    _verbose_categories.update(verbose or ())
+    for name, logger in _category_loggers.items():
+        _apply_verbosity(logger, name.rsplit('.', 1)[-1])
+
+    if _listener is not None:
+        _listener.stop()
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging():
+    """Flush queued records and stop the listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
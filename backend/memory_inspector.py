@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Memory inspector for FitGirl Downloader
+tracemalloc snapshots, snapshot diffs and live object counts for diagnosing leaks
+"""
+
+import gc
+import logging
+import threading
+import tracemalloc
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from bs4.element import NavigableString, Tag
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .game_release import GameRelease
+
+# Ways to group allocation statistics (see tracemalloc.Snapshot.statistics)
+GROUP_BY = ('lineno', 'filename', 'traceback')
+
+# Object groups reported by object_counts(); the first matching class wins
+TRACKED_OBJECTS: Tuple[Tuple[str, type], ...] = (
+    ('game_releases', GameRelease),
+    ('soup_documents', BeautifulSoup),
+    ('soup_tags', Tag),
+    ('soup_strings', NavigableString),
+    ('webdrivers', WebDriver),
+)
+
+# Allocations made by the inspector itself or by the import machinery
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+def resident_memory_bytes() -> Optional[int]:
+    """
+    Current resident set size of the process
+
+    Returns:
+        Optional[int]: RSS in bytes, or None where /proc is not available
+    """
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class MemoryInspector:
+    """
+    Starts and stops tracemalloc and keeps a bounded set of snapshots
+    """
+
+    def __init__(self, keep: int = 10):
+        """
+        Initialize the inspector
+
+        Args:
+            keep: Number of snapshots kept in memory (oldest are dropped)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.keep = max(2, keep)
+        self._snapshots: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        """Whether tracemalloc is tracing allocations"""
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> Dict[str, Any]:
+        """
+        Start tracing allocations
+
+        Args:
+            frames: Stack frames stored per allocation (more frames cost more memory)
+
+        Returns:
+            Dict[str, Any]: Current status
+        """
+        frames = max(1, min(int(frames), 50))
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self.logger.info(f"🧠 Memory tracing started ({frames} frames)")
+        return self.status()
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        Stop tracing allocations and discard the snapshots
+
+        Returns:
+            Dict[str, Any]: Current status
+        """
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            self.logger.info("🧠 Memory tracing stopped")
+        with self._lock:
+            self._snapshots.clear()
+        return self.status()
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get tracing state and process memory
+
+        Returns:
+            Dict[str, Any]: Tracing flag, traced and peak bytes, tracemalloc overhead,
+            resident memory and the saved snapshots
+        """
+        tracing = tracemalloc.is_tracing()
+        traced, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+        return {
+            'tracing': tracing,
+            'frames': tracemalloc.get_traceback_limit() if tracing else 0,
+            'traced_bytes': traced,
+            'peak_traced_bytes': peak,
+            'tracemalloc_overhead_bytes': tracemalloc.get_tracemalloc_memory() if tracing else 0,
+            'rss_bytes': resident_memory_bytes(),
+            'snapshots': self.list_snapshots()
+        }
+
+    def take_snapshot(self, label: str = "") -> Dict[str, Any]:
+        """
+        Take a snapshot of the traced allocations
+
+        Args:
+            label: Optional description (e.g. 'before sync')
+
+        Returns:
+            Dict[str, Any]: Snapshot information
+
+        Raises:
+            RuntimeError: If tracing is not started
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError('Memory tracing is not started')
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        with self._lock:
+            snapshot_id = self._next_id
+            self._next_id += 1
+            self._snapshots[snapshot_id] = {
+                'id': snapshot_id,
+                'label': label,
+                'taken_at': datetime.now().isoformat(),
+                'traced_bytes': sum(stat.size for stat in snapshot.statistics('filename')),
+                'snapshot': snapshot
+            }
+            while len(self._snapshots) > self.keep:
+                self._snapshots.popitem(last=False)
+
+        self.logger.info(f"🧠 Memory snapshot {snapshot_id} taken{f' ({label})' if label else ''}")
+        return self._describe(self._snapshots[snapshot_id])
+
+    @staticmethod
+    def _describe(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Snapshot information without the snapshot itself"""
+        return {key: value for key, value in entry.items() if key != 'snapshot'}
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """
+        List saved snapshots
+
+        Returns:
+            List[Dict[str, Any]]: ID, label, time and traced bytes, oldest first
+        """
+        with self._lock:
+            return [self._describe(entry) for entry in self._snapshots.values()]
+
+    def _get(self, snapshot_id: int) -> Dict[str, Any]:
+        """Get a saved snapshot entry, raising KeyError if unknown"""
+        with self._lock:
+            entry = self._snapshots.get(snapshot_id)
+        if entry is None:
+            raise KeyError(f"Snapshot not found: {snapshot_id}")
+        return entry
+
+    def previous_snapshot_id(self, snapshot_id: int) -> Optional[int]:
+        """
+        Get the snapshot saved before another one
+
+        Args:
+            snapshot_id: Snapshot ID
+
+        Returns:
+            Optional[int]: ID of the previous snapshot, or None
+        """
+        with self._lock:
+            earlier = [other for other in self._snapshots if other < snapshot_id]
+        return earlier[-1] if earlier else None
+
+    @staticmethod
+    def _check_group_by(group_by: str):
+        """Validate a grouping key"""
+        if group_by not in GROUP_BY:
+            raise ValueError(f"group_by must be one of: {', '.join(GROUP_BY)}")
+
+    @staticmethod
+    def _location(traceback: tracemalloc.Traceback, group_by: str) -> Dict[str, Any]:
+        """Describe where an allocation group comes from"""
+        frame = traceback[0]
+        location = {'file': frame.filename, 'line': frame.lineno if group_by != 'filename' else None}
+        if group_by == 'traceback':
+            location['traceback'] = [f"{f.filename}:{f.lineno}" for f in traceback]
+        return location
+
+    def top(self, snapshot_id: int, group_by: str = 'lineno', limit: int = 20) -> Dict[str, Any]:
+        """
+        Get the largest allocation sites of a snapshot
+
+        Args:
+            snapshot_id: Snapshot ID
+            group_by: 'lineno', 'filename' or 'traceback'
+            limit: Number of sites returned
+
+        Returns:
+            Dict[str, Any]: Snapshot information and the sites, largest first
+
+        Raises:
+            KeyError: If the snapshot does not exist
+            ValueError: If group_by is invalid
+        """
+        self._check_group_by(group_by)
+        entry = self._get(snapshot_id)
+        stats = entry['snapshot'].statistics(group_by)
+        return {
+            'snapshot': self._describe(entry),
+            'group_by': group_by,
+            'top': [dict(self._location(stat.traceback, group_by),
+                         size_bytes=stat.size, count=stat.count) for stat in stats[:limit]]
+        }
+
+    def diff(self, snapshot_id: int, base_id: int, group_by: str = 'lineno', limit: int = 20) -> Dict[str, Any]:
+        """
+        Compare a snapshot with an earlier one
+
+        Args:
+            snapshot_id: Newer snapshot ID
+            base_id: Snapshot ID to compare against
+            group_by: 'lineno', 'filename' or 'traceback'
+            limit: Number of sites returned
+
+        Returns:
+            Dict[str, Any]: Both snapshots, total growth and the sites that grew
+            or shrank the most
+
+        Raises:
+            KeyError: If a snapshot does not exist
+            ValueError: If group_by is invalid
+        """
+        self._check_group_by(group_by)
+        entry = self._get(snapshot_id)
+        base = self._get(base_id)
+        stats = entry['snapshot'].compare_to(base['snapshot'], group_by)
+        return {
+            'snapshot': self._describe(entry),
+            'base': self._describe(base),
+            'group_by': group_by,
+            'size_diff_bytes': entry['traced_bytes'] - base['traced_bytes'],
+            'top': [dict(self._location(stat.traceback, group_by),
+                         size_bytes=stat.size, size_diff_bytes=stat.size_diff,
+                         count=stat.count, count_diff=stat.count_diff) for stat in stats[:limit]]
+        }
+
+    @staticmethod
+    def object_counts(limit: int = 15) -> Dict[str, Any]:
+        """
+        Count live objects tracked by the garbage collector
+
+        Args:
+            limit: Number of most common types returned
+
+        Returns:
+            Dict[str, Any]: Counts of the tracked application objects (releases,
+            soup nodes, web drivers), the most common types and the total
+        """
+        type_counts = Counter(type(obj) for obj in gc.get_objects())
+
+        tracked = {name: 0 for name, _ in TRACKED_OBJECTS}
+        for obj_type, count in type_counts.items():
+            for name, cls in TRACKED_OBJECTS:
+                if issubclass(obj_type, cls):
+                    tracked[name] += count
+                    break
+
+        return {
+            'tracked': tracked,
+            'top_types': [{'type': f"{obj_type.__module__}.{obj_type.__qualname__}", 'count': count}
+                          for obj_type, count in type_counts.most_common(limit)],
+            'total': sum(type_counts.values()),
+            'gc_counts': list(gc.get_count())
+        }
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metrics registry for FitGirl Downloader
+Counters, gauges and histograms rendered in the Prometheus text exposition format
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Prometheus client default buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+# Buckets for long operations such as sync stages (seconds)
+LONG_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+
+LabelValues = Tuple[str, ...]
+
+
+class ServerTiming:
+    """
+    Durations collected while handling one request, for the Server-Timing header
+    """
+
+    def __init__(self):
+        """Initialize an empty collection"""
+        self._segments: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float):
+        """
+        Add time to a segment (repeated segments are summed)
+
+        Args:
+            name: Segment name
+            seconds: Duration in seconds
+        """
+        self._segments[name] = self._segments.get(name, 0.0) + seconds
+
+    def header_value(self) -> str:
+        """
+        Render the segments as a Server-Timing header value
+
+        Returns:
+            str: e.g. 'db-query;dur=1.25, serialize;dur=0.31'
+        """
+        return ', '.join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in self._segments.items())
+
+
+# Collection for the request being handled in the current context (thread or greenlet)
+_server_timing: ContextVar[Optional[ServerTiming]] = ContextVar('server_timing', default=None)
+
+
+def start_server_timing() -> Tuple[ServerTiming, Token]:
+    """
+    Start collecting Server-Timing segments in the current context
+
+    Returns:
+        Tuple[ServerTiming, Token]: The collection and the token for stop_server_timing()
+    """
+    timing = ServerTiming()
+    return timing, _server_timing.set(timing)
+
+
+def stop_server_timing(token: Token):
+    """Stop collecting Server-Timing segments in the current context"""
+    _server_timing.reset(token)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value"""
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    """Escape a label value for the exposition format"""
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set as {name="value",...}"""
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape_label(value)}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+class Metric:
+    """
+    Base class for a named metric with optional labels
+    """
+
+    type_name = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 callback: Optional[Callable[[], Any]] = None):
+        """
+        Initialize the metric
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names
+            callback: Function evaluated at collection time instead of stored values;
+                      returns a number, or a dict of label value tuples to numbers
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        self._values: Dict[LabelValues, Any] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            # Unlabeled metrics are exported from the start
+            self._values[()] = 0.0
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        """Convert keyword labels to the internal key"""
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} is missing label {e}")
+
+    def _callback_values(self) -> Dict[LabelValues, float]:
+        """Evaluate the collection callback"""
+        try:
+            result = self.callback()
+        except Exception:
+            return {}
+        if result is None:
+            return {}
+        if isinstance(result, dict):
+            return {tuple(str(v) for v in (key if isinstance(key, tuple) else (key,))): float(value)
+                    for key, value in result.items()}
+        return {(): float(result)}
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], LabelValues, float]]:
+        """
+        Yield the samples of this metric
+
+        Returns:
+            Iterator of (name, label names, label values, value)
+        """
+        if self.callback:
+            values = self._callback_values()
+        else:
+            with self._lock:
+                values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield self.name, self.labelnames, key, value
+
+    def render(self) -> str:
+        """Render the metric in the text exposition format"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for name, labelnames, labelvalues, value in self.samples():
+            lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing value
+    """
+
+    type_name = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels: Any):
+        """
+        Increase the counter
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current value for a label set"""
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(Metric):
+    """
+    Value that can go up and down
+    """
+
+    type_name = 'gauge'
+
+    def set(self, value: float, **labels: Any):
+        """Set the gauge"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any):
+        """Increase the gauge"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any):
+        """Decrease the gauge"""
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        """Current value for a label set"""
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Histogram(Metric):
+    """
+    Distribution of observations in cumulative buckets
+    """
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, server_timing: Optional[str] = None):
+        """
+        Initialize the histogram
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names
+            buckets: Upper bounds of the buckets (+Inf is added)
+            server_timing: Server-Timing segment name, formatted with the labels
+                           (e.g. 'db-{operation}'); None keeps observations out of the header
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values = {}
+        self.server_timing = server_timing
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b))) + (math.inf,)
+
+    def observe(self, value: float, **labels: Any):
+        """
+        Record an observation
+
+        Args:
+            value: Observed value
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            state['buckets'][bisect_left(self.buckets, value)] += 1
+            state['sum'] += value
+            state['count'] += 1
+
+        if self.server_timing is not None:
+            timing = _server_timing.get()
+            if timing is not None:
+                timing.add(self.server_timing.format(**labels), value)
+
+    @contextmanager
+    def time(self, **labels: Any):
+        """Observe the duration of a block in seconds"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def snapshot(self, **labels: Any) -> Dict[str, Any]:
+        """
+        Get count and sum for a label set
+
+        Returns:
+            Dict[str, Any]: Count and sum of observations
+        """
+        state = self._values.get(self._key(labels))
+        if not state:
+            return {'count': 0, 'sum': 0.0}
+        return {'count': state['count'], 'sum': state['sum']}
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], LabelValues, float]]:
+        with self._lock:
+            values = {key: {'buckets': list(state['buckets']), 'sum': state['sum'], 'count': state['count']}
+                      for key, state in self._values.items()}
+        bucket_labels = self.labelnames + ('le',)
+        for key, state in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, state['buckets']):
+                cumulative += count
+                yield f"{self.name}_bucket", bucket_labels, key + (_format_value(bound),), cumulative
+            yield f"{self.name}_sum", self.labelnames, key, state['sum']
+            yield f"{self.name}_count", self.labelnames, key, state['count']
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together
+    """
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args: Any, **kwargs: Any):
+        """Return the registered metric with this name, creating it if needed"""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as {metric.type_name}")
+            elif kwargs.get('callback') is not None:
+                metric.callback = kwargs['callback']
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                callback: Optional[Callable[[], Any]] = None) -> Counter:
+        """Get or create a counter"""
+        return self._get_or_create(Counter, name, documentation, labelnames, callback=callback)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+              callback: Optional[Callable[[], Any]] = None) -> Gauge:
+        """Get or create a gauge"""
+        return self._get_or_create(Gauge, name, documentation, labelnames, callback=callback)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS, server_timing: Optional[str] = None) -> Histogram:
+        """Get or create a histogram"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets,
+                                   server_timing=server_timing)
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Get a registered metric by name"""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition text
+        """
+        with self._lock:
+            metrics: List[Metric] = [self._metrics[name] for name in sorted(self._metrics)]
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+# Process-wide registry used by the application modules
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Opt-in profiler for FitGirl Downloader
+Captures deterministic (cProfile) and sampled stack profiles of a single request or sync run
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Artifact formats: file extension -> download mimetype
+ARTIFACT_FORMATS = {
+    'pstats': 'application/octet-stream',
+    'collapsed': 'text/plain',
+    'txt': 'text/plain'
+}
+
+
+def _os_thread_api() -> Tuple[Callable[..., Any], Callable[[], int]]:
+    """
+    Get start_new_thread and get_ident for real OS threads
+
+    Under gevent monkey patching the threading module creates greenlets, which
+    cannot sample a busy greenlet; the sampler needs an OS thread.
+    """
+    try:
+        from gevent import monkey
+        if monkey.is_module_patched('threading'):
+            return (monkey.get_original('_thread', 'start_new_thread'),
+                    monkey.get_original('_thread', 'get_ident'))
+    except ImportError:
+        pass
+    import _thread
+    return _thread.start_new_thread, _thread.get_ident
+
+
+def _threads_are_greenlets() -> bool:
+    """Check if gevent replaced threads with greenlets sharing the OS thread"""
+    try:
+        from gevent import monkey
+        return monkey.is_module_patched('threading')
+    except ImportError:
+        return False
+
+
+class StackSampler:
+    """
+    Samples the stacks of a set of threads at a fixed interval into collapsed stacks
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        """
+        Initialize the sampler
+
+        Args:
+            thread_id: OS thread identifier to sample
+            interval: Seconds between samples
+        """
+        self.thread_id = thread_id
+        # Thread ID -> name prefixed to its stacks (None for the profiled thread)
+        self.threads: Dict[int, Optional[str]] = {thread_id: None}
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+        self._finished = threading.Event()
+
+    def add_thread(self, thread_id: int, name: str):
+        """
+        Also sample a worker thread
+
+        Args:
+            thread_id: OS thread identifier
+            name: Thread name, used as the root frame of its stacks
+        """
+        self.threads = {**self.threads, thread_id: name}
+
+    def start(self):
+        """Start sampling on a background OS thread"""
+        start_new_thread, _ = _os_thread_api()
+        start_new_thread(self._run, ())
+
+    def stop(self):
+        """Stop sampling and wait for the sampler to finish"""
+        self._stopped.set()
+        self._finished.wait(1.0)
+
+    def _run(self):
+        """Sampling loop"""
+        try:
+            while not self._stopped.is_set():
+                frames = sys._current_frames()
+                for thread_id, name in self.threads.items():
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        stack = self._collapse(frame)
+                        self.stacks[f"{name};{stack}" if name else stack] += 1
+                        self.samples += 1
+                time.sleep(self.interval)
+        finally:
+            self._finished.set()
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        """Convert a frame to a root-first, semicolon separated stack"""
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ';'.join(reversed(names))
+
+    def collapsed(self) -> str:
+        """
+        Render the samples in the collapsed stack format used by flamegraph tools
+
+        Returns:
+            str: One "stack count" line per distinct stack
+        """
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfileSession:
+    """
+    A running profile of the code executed by the current thread
+
+    With a thread prefix, the threads started while the session runs whose name
+    starts with it (e.g. the scrape pool workers) get their own cProfile profile,
+    merged into the artifacts on stop, and are sampled with their name as the root
+    frame. Other threads (timers, request handlers, jobs) and threads that were
+    already running are not profiled.
+    """
+
+    # Worker threads profiled per session at most
+    MAX_THREADS = 64
+
+    def __init__(self, profiler: "Profiler", label: str, thread_prefix: Optional[str] = None):
+        """
+        Initialize the session
+
+        Args:
+            profiler: Profiler that stores the artifacts
+            label: Short description of what is profiled (e.g. the request path)
+            thread_prefix: Also profile new threads whose name starts with this prefix
+        """
+        self.profiler = profiler
+        self.label = label
+        self.profile = cProfile.Profile()
+        _, self._get_ident = _os_thread_api()
+        self.sampler = StackSampler(self._get_ident(), profiler.sample_interval)
+        self.started_at = datetime.now()
+        # Greenlets run on the profiled OS thread and are already covered
+        self.thread_prefix = thread_prefix if not _threads_are_greenlets() else None
+        self.profiled_threads = 0
+        self.thread_profiles: List[cProfile.Profile] = []
+        self._threads_lock = threading.Lock()
+        self._started = 0.0
+
+    def start(self) -> "ProfileSession":
+        """Start profiling"""
+        self._started = time.perf_counter()
+        self.sampler.start()
+        if self.thread_prefix:
+            threading.setprofile(self._profile_thread)
+        self.profile.enable()
+        return self
+
+    def _profile_thread(self, frame, event, arg):
+        """threading.setprofile hook: runs once in each new thread and installs its profiler"""
+        sys.setprofile(None)
+        name = threading.current_thread().name
+        if not name.startswith(self.thread_prefix):
+            return
+        with self._threads_lock:
+            if self.profiled_threads >= self.MAX_THREADS:
+                return
+            self.profiled_threads += 1
+        self.sampler.add_thread(self._get_ident(), name)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ allows a single cProfile profiler: the thread is only sampled
+            return
+        with self._threads_lock:
+            self.thread_profiles.append(profile)
+
+    def stats(self, stream: Optional[io.StringIO] = None) -> pstats.Stats:
+        """
+        Merge the statistics of the profiled thread and its workers
+
+        Args:
+            stream: Output stream of the report
+
+        Returns:
+            pstats.Stats: Combined statistics
+        """
+        stats = pstats.Stats(self.profile, stream=stream)
+        with self._threads_lock:
+            thread_profiles = list(self.thread_profiles)
+        for profile in thread_profiles:
+            try:
+                stats.add(profile)
+            except TypeError:
+                pass  # Thread started but recorded no calls
+        return stats
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        Stop profiling and save the artifacts
+
+        Returns:
+            Dict[str, Any]: Artifact information (see Profiler.save)
+        """
+        self.profile.disable()
+        if self.thread_prefix:
+            threading.setprofile(None)
+        self.sampler.stop()
+        return self.profiler.save(self, time.perf_counter() - self._started)
+
+
+class Profiler:
+    """
+    Creates profile sessions and manages their artifacts on disk
+    """
+
+    def __init__(self, output_dir: str = "profiles", sample_interval: float = 0.005, keep: int = 20):
+        """
+        Initialize the profiler
+
+        Args:
+            output_dir: Directory for profile artifacts
+            sample_interval: Seconds between stack samples
+            keep: Number of profiles kept on disk
+        """
+        self.logger = logging.getLogger(__name__)
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval
+        self.keep = max(1, keep)
+        self._lock = threading.Lock()
+        # Only one session runs at a time (the interpreter allows a single active profiler)
+        self._active: Optional[ProfileSession] = None
+
+    def start(self, label: str, thread_prefix: Optional[str] = None) -> ProfileSession:
+        """
+        Start profiling the current thread
+
+        Args:
+            label: Short description of what is profiled
+            thread_prefix: Also profile new threads whose name starts with this prefix
+
+        Returns:
+            ProfileSession: Running session; call stop() on the same thread
+
+        Raises:
+            RuntimeError: If another profile is running
+        """
+        with self._lock:
+            if self._active is not None:
+                raise RuntimeError(f"A profile is already running: {self._active.label}")
+            self._active = ProfileSession(self, label, thread_prefix)
+        return self._active.start()
+
+    def save(self, session: ProfileSession, duration: float) -> Dict[str, Any]:
+        """
+        Write the artifacts of a finished session
+
+        Args:
+            session: Stopped session
+            duration: Profiled wall time in seconds
+
+        Returns:
+            Dict[str, Any]: Profile ID, label, duration, sample count and formats
+        """
+        with self._lock:
+            if self._active is session:
+                self._active = None
+
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', session.label).strip('_')[:40] or 'profile'
+        profile_id = f"{session.started_at.strftime('%Y%m%d_%H%M%S_%f')}_{slug}"
+        base_path = os.path.join(self.output_dir, profile_id)
+
+        with self._lock:
+            os.makedirs(self.output_dir, exist_ok=True)
+            report = io.StringIO()
+            stats = session.stats(stream=report)
+            stats.dump_stats(f"{base_path}.pstats")
+
+            with open(f"{base_path}.collapsed", 'w', encoding='utf-8') as f:
+                f.write(session.sampler.collapsed())
+
+            report.write(f"# {session.label}\n# {duration:.3f}s wall, {session.sampler.samples} samples, "
+                         f"{len(session.thread_profiles)} worker threads\n\n")
+            stats.sort_stats('cumulative').print_stats(50)
+            with open(f"{base_path}.txt", 'w', encoding='utf-8') as f:
+                f.write(report.getvalue())
+
+            self._trim()
+
+        self.logger.info(f"🔬 Profile saved: {profile_id} ({duration:.2f}s, {session.sampler.samples} samples)")
+        return {
+            'id': profile_id,
+            'label': session.label,
+            'started_at': session.started_at.isoformat(),
+            'duration_seconds': round(duration, 3),
+            'samples': session.sampler.samples,
+            'threads': len(session.thread_profiles),
+            'formats': list(ARTIFACT_FORMATS)
+        }
+
+    def _trim(self):
+        """Delete the oldest profiles beyond the retention limit (lock must be held)"""
+        profile_ids = self._profile_ids()
+        for profile_id in profile_ids[self.keep:]:
+            for fmt in ARTIFACT_FORMATS:
+                try:
+                    os.remove(os.path.join(self.output_dir, f"{profile_id}.{fmt}"))
+                except FileNotFoundError:
+                    pass
+
+    def _profile_ids(self) -> List[str]:
+        """Saved profile IDs, most recent first"""
+        if not os.path.isdir(self.output_dir):
+            return []
+        ids = {name[:-len('.pstats')] for name in os.listdir(self.output_dir) if name.endswith('.pstats')}
+        return sorted(ids, reverse=True)
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        """
+        List saved profiles
+
+        Returns:
+            List[Dict[str, Any]]: ID and available formats, most recent first
+        """
+        return [{
+            'id': profile_id,
+            'formats': [fmt for fmt in ARTIFACT_FORMATS
+                        if os.path.exists(os.path.join(self.output_dir, f"{profile_id}.{fmt}"))]
+        } for profile_id in self._profile_ids()]
+
+    def artifact_path(self, profile_id: str, fmt: str) -> Optional[str]:
+        """
+        Get the path of a profile artifact
+
+        Args:
+            profile_id: Profile ID
+            fmt: Artifact format (pstats, collapsed, txt)
+
+        Returns:
+            Optional[str]: Absolute path, or None if it does not exist
+        """
+        if fmt not in ARTIFACT_FORMATS or not re.fullmatch(r'[A-Za-z0-9_]+', profile_id):
+            return None
+        path = os.path.abspath(os.path.join(self.output_dir, f"{profile_id}.{fmt}"))
+        return path if os.path.exists(path) else None
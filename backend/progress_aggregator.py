@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Progress aggregator for FitGirl Downloader
+Merges frequent progress updates and emits them at a bounded rate
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class ProgressAggregator:
+    """
+    Keeps the latest progress snapshot and throttles its broadcasting
+
+    Every update gets a sequence number and emits are serialized, so a trailing
+    timer flush never broadcasts a snapshot older than one already emitted (e.g.
+    'syncing' after 'completed').
+    """
+
+    TERMINAL_STATUSES = ('completed', 'error', 'idle')
+
+    def __init__(self, initial: Dict[str, Any], max_rate_hz: float = 4.0):
+        """
+        Initialize the aggregator
+
+        Args:
+            initial: Initial progress snapshot
+            max_rate_hz: Maximum number of emits per second (0 emits every update)
+        """
+        self.logger = logging.getLogger(__name__)
+        self._snapshot: Dict[str, Any] = dict(initial)
+        self._lock = threading.Lock()
+        # Held while a snapshot is broadcast, after _lock is released
+        self._emit_lock = threading.Lock()
+        self._sequence = 0
+        self._emitted_sequence = 0
+        self._last_emit = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self.emit_callback = None
+        self.updates = 0
+        self.emits = 0
+        self.set_max_rate(max_rate_hz)
+
+    def set_max_rate(self, max_rate_hz: float):
+        """
+        Change the maximum emit rate
+
+        Args:
+            max_rate_hz: Maximum number of emits per second (0 emits every update)
+        """
+        self.min_interval = 1.0 / max_rate_hz if max_rate_hz and max_rate_hz > 0 else 0.0
+
+    def set_emit_callback(self, callback: Callable[[Dict[str, Any]], None]):
+        """
+        Set the function that broadcasts a snapshot
+
+        Args:
+            callback: Function that receives a copy of the snapshot
+        """
+        self.emit_callback = callback
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a copy of the latest progress
+
+        Returns:
+            Dict[str, Any]: Progress snapshot
+        """
+        with self._lock:
+            return dict(self._snapshot)
+
+    def update(self, status: str, message: str, **kwargs: Any):
+        """
+        Merge a progress update, emitting now or on the next throttle window
+
+        Terminal statuses are always emitted immediately.
+
+        Args:
+            status: Progress status
+            message: Descriptive message
+            **kwargs: Additional progress fields
+        """
+        with self._lock:
+            self._snapshot.update({'status': status, 'message': message, **kwargs})
+            self._dirty = True
+            self._sequence += 1
+            self.updates += 1
+
+            now = time.monotonic()
+            wait = self._last_emit + self.min_interval - now
+            if status in self.TERMINAL_STATUSES or wait <= 0:
+                self._cancel_timer()
+                emit_now = True
+            else:
+                emit_now = False
+                if self._timer is None:
+                    self._timer = threading.Timer(wait, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if emit_now:
+            self.flush()
+
+    def flush(self):
+        """Emit the latest snapshot if it changed since the last emit"""
+        with self._lock:
+            self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._last_emit = time.monotonic()
+            snapshot = dict(self._snapshot)
+            sequence = self._sequence
+
+        with self._emit_lock:
+            # A newer snapshot was broadcast while this one waited
+            if sequence <= self._emitted_sequence:
+                return
+            self._emitted_sequence = sequence
+            self.emits += 1
+            if self.emit_callback:
+                try:
+                    self.emit_callback(snapshot)
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Error emitting progress: {e}")
+
+    def _cancel_timer(self):
+        """Cancel a pending trailing emit (lock must be held)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
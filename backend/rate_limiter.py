@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Request rate limiter for FitGirl Downloader
+Spaces out requests shared by several worker threads
+"""
+
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that grants at most `rate` slots per second
+    """
+
+    def __init__(self, rate: float):
+        """
+        Initialize the rate limiter
+
+        Args:
+            rate: Maximum number of acquisitions per second (0 disables the limit)
+        """
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserve the next slot without waiting for it
+
+        Returns:
+            float: Seconds until the reserved slot (callers that cannot block sleep it themselves)
+        """
+        if not self.interval:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        return slot - now
+
+    def wait(self) -> float:
+        """
+        Block until the caller may issue its next request
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    """
+    Thread-safe limiter that grants at most `rate` slots per second to each host
+    """
+
+    def __init__(self, rate: float):
+        """
+        Initialize the rate limiter
+
+        Args:
+            rate: Maximum number of requests per second and host (0 disables the limit)
+        """
+        self.rate = rate
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def _limiter(self, url: str) -> RateLimiter:
+        """Get the limiter of the host of a URL"""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = RateLimiter(self.rate)
+        return limiter
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserve the next slot of the host of a URL without waiting for it
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            float: Seconds until the reserved slot
+        """
+        return self._limiter(url).reserve()
+
+    def wait(self, url: str) -> float:
+        """
+        Block until the caller may issue its next request to the host of a URL
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        return self._limiter(url).wait()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Response serializer for FitGirl Downloader
+Encodes API payloads with the fastest available JSON backend and caches
+pre-serialized release fragments
+"""
+
+import json
+import logging
+import threading
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask.json.provider import DefaultJSONProvider
+
+from .metrics import REGISTRY
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard library is the fallback
+    orjson = None
+
+SERIALIZE_SECONDS = REGISTRY.histogram(
+    'fitgirl_response_serialize_duration_seconds', 'Time spent encoding JSON responses',
+    server_timing='serialize')
+FRAGMENT_LOOKUP_SECONDS = REGISTRY.histogram(
+    'fitgirl_fragment_lookup_duration_seconds', 'Time spent getting release fragments (cache lookups and misses)',
+    server_timing='cache')
+
+
+class ResponseSerializer:
+    """
+    Pluggable JSON encoder with a per-release fragment cache
+    """
+
+    BACKENDS = ('auto', 'orjson', 'stdlib')
+
+    def __init__(self, backend: str = "auto"):
+        """
+        Initialize the serializer
+
+        Args:
+            backend: Encoder to use ('auto', 'orjson' or 'stdlib')
+        """
+        self.logger = logging.getLogger(__name__)
+
+        if backend not in self.BACKENDS:
+            self.logger.warning(f"⚠️ Unknown JSON backend '{backend}', using 'auto'")
+            backend = 'auto'
+
+        if backend in ('auto', 'orjson') and orjson is not None:
+            self.backend = 'orjson'
+        else:
+            if backend == 'orjson':
+                self.logger.warning("⚠️ orjson is not installed, falling back to the standard library encoder")
+            self.backend = 'stdlib'
+
+        # (view, release_id) -> encoded release
+        self._fragments: Dict[Tuple[str, int], bytes] = {}
+        # Invalidation counter, and the value it had when each release (or everything) was last invalidated
+        self._generation = 0
+        self._invalidated_at: Dict[int, int] = {}
+        self._cleared_at = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.logger.info(f"🔧 Response serializer using {self.backend} backend")
+
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        """Encode types that the JSON backends don't handle natively"""
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        if isinstance(obj, Enum):
+            return obj.name
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(self, payload: Any) -> bytes:
+        """
+        Encode a payload to UTF-8 JSON
+
+        Args:
+            payload: Object to encode
+
+        Returns:
+            bytes: Encoded JSON
+        """
+        if self.backend == 'orjson':
+            return orjson.dumps(payload, default=self._default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(payload, default=self._default, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: Any) -> Any:
+        """
+        Decode JSON text or bytes
+
+        Args:
+            data: JSON document
+
+        Returns:
+            Any: Decoded object
+        """
+        if self.backend == 'orjson':
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def generation(self) -> int:
+        """
+        Get the invalidation counter
+
+        Take it before reading releases from the database and pass it to
+        fragments(), so releases read before a change are never cached.
+
+        Returns:
+            int: Current generation
+        """
+        with self._lock:
+            return self._generation
+
+    def fragment(self, view: str, release, builder: Callable[[Any], Dict[str, Any]],
+                 generation: Optional[int] = None) -> bytes:
+        """
+        Get the encoded representation of a release, building it only on a cache miss
+
+        Args:
+            view: Name of the representation (each endpoint exposes different fields)
+            release: GameRelease to encode
+            builder: Function that converts the release to a dictionary
+            generation: generation() taken before the release was read (default: now)
+
+        Returns:
+            bytes: Encoded release
+        """
+        if release.id is None:
+            return self.dumps(builder(release))
+
+        key = (view, release.id)
+        with self._lock:
+            cached = self._fragments.get(key)
+            if generation is None:
+                generation = self._generation
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        encoded = self.dumps(builder(release))
+        with self._lock:
+            # The release changed since it was read: the encoding is already stale
+            if max(self._cleared_at, self._invalidated_at.get(release.id, 0)) <= generation:
+                self._fragments[key] = encoded
+        return encoded
+
+    @FRAGMENT_LOOKUP_SECONDS.time()
+    def fragments(self, view: str, releases: List[Any], builder: Callable[[Any], Dict[str, Any]],
+                  generation: Optional[int] = None) -> List[bytes]:
+        """
+        Get the encoded representations of several releases
+
+        Args:
+            view: Name of the representation
+            releases: GameReleases to encode
+            builder: Function that converts a release to a dictionary
+            generation: generation() taken before the releases were read (default: now)
+
+        Returns:
+            List[bytes]: Encoded releases, in order
+        """
+        if generation is None:
+            generation = self.generation()
+        return [self.fragment(view, release, builder, generation) for release in releases]
+
+    @SERIALIZE_SECONDS.time()
+    def encode_with_fragments(self, payload: Dict[str, Any], key: str, fragments: List[bytes]) -> bytes:
+        """
+        Encode a payload and splice a list of pre-encoded fragments into it
+
+        Args:
+            payload: Envelope without the fragment list
+            key: Key under which the fragment list is placed
+            fragments: Pre-encoded JSON values
+
+        Returns:
+            bytes: Encoded JSON document
+        """
+        head = self.dumps(payload)
+        items = b'[' + b','.join(fragments) + b']'
+        member = self.dumps(key) + b':' + items
+        if head == b'{}':
+            return b'{' + member + b'}'
+        return head[:-1] + b',' + member + b'}'
+
+    def invalidate(self, release_id: Optional[int] = None):
+        """
+        Drop cached fragments
+
+        Args:
+            release_id: Release whose fragments are dropped, or None to drop everything
+        """
+        with self._lock:
+            self._generation += 1
+            if release_id is None:
+                self._fragments.clear()
+                self._invalidated_at.clear()
+                self._cleared_at = self._generation
+                return
+            self._invalidated_at[release_id] = self._generation
+            for key in [k for k in self._fragments if k[1] == release_id]:
+                del self._fragments[key]
+
+    def on_release_changed(self, action: str, release_id: Optional[int]):
+        """
+        Database change listener that keeps the fragment cache consistent
+
+        Args:
+            action: Kind of mutation ('insert', 'update', 'status', 'delete', 'clear')
+            release_id: Affected release, None when every release is affected
+        """
+        self.invalidate(release_id)
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """
+        Get fragment cache statistics
+
+        Returns:
+            Dict[str, Any]: Backend, cache size, hits and misses
+        """
+        with self._lock:
+            fragment_bytes = sum(len(encoded) for encoded in self._fragments.values())
+        return {
+            'backend': self.backend,
+            'fragments': len(self._fragments),
+            'fragment_bytes': fragment_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that routes jsonify() through a ResponseSerializer
+    """
+
+    def __init__(self, app, serializer: ResponseSerializer):
+        super().__init__(app)
+        self.serializer = serializer
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self.serializer.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return self.serializer.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        with SERIALIZE_SECONDS.time():
+            body = self.serializer.dumps(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
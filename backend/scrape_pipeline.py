@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming scrape pipeline for FitGirl Downloader
+Runs listing discovery, detail extraction and inserts concurrently with backpressure
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .game_release import GameRelease
+
+
+class DetailPipeline:
+    """
+    Streams discovered URLs through a detail worker pool, yielding results in discovery order
+
+    A discovery thread consumes the (blocking) URL iterator and submits each URL to
+    the workers as soon as it is found. At most `max_pending` submitted URLs wait
+    for the consumer, so discovery pauses when inserts fall behind.
+    """
+
+    def __init__(self, submit: Callable[[str], Future], max_pending: int = 20, join_timeout: float = 30.0):
+        """
+        Initialize the pipeline
+
+        Args:
+            submit: Starts extracting a URL and returns a future of the release
+            max_pending: Submitted URLs that may wait for the consumer
+            join_timeout: Seconds to wait for the discovery thread when stopping early
+        """
+        self.logger = logging.getLogger(__name__)
+        self.submit = submit
+        self.max_pending = max(1, max_pending)
+        self.join_timeout = join_timeout
+        self.discovered = 0
+
+    def run(self, links: Iterable[str],
+            is_running: Callable[[], bool] = lambda: True) -> Iterator[Tuple[int, str, Optional[GameRelease], int]]:
+        """
+        Extract releases as their URLs are discovered
+
+        Args:
+            links: URL source, e.g. a generator that downloads listing pages
+            is_running: Returns False to stop early (pending extractions are cancelled)
+
+        Returns:
+            Iterator of (index, URL, release or None, URLs discovered so far)
+
+        Raises:
+            Exception: Whatever the URL source raised, after the URLs it produced were yielded
+        """
+        pending: "queue.Queue[Optional[Tuple[str, Future]]]" = queue.Queue(maxsize=self.max_pending)
+        stop = threading.Event()
+        errors: List[Exception] = []
+
+        def put(item) -> bool:
+            """Queue an item, giving up once the consumer stopped"""
+            while not stop.is_set():
+                try:
+                    pending.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def discover():
+            try:
+                for url in links:
+                    if stop.is_set():
+                        break
+                    future = self.submit(url)
+                    self.discovered += 1
+                    if not put((url, future)):
+                        future.cancel()
+                        break
+            except Exception as e:
+                errors.append(e)
+            finally:
+                put(None)
+
+        thread = threading.Thread(target=discover, name="scrape-discovery", daemon=True)
+        thread.start()
+
+        index = 0
+        try:
+            while True:
+                if not is_running():
+                    self.logger.info("⏹️ Scraper stopped, cancelling pending detail pages")
+                    return
+                try:
+                    item = pending.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if item is None:
+                    break
+
+                url, future = item
+                try:
+                    release = future.result()
+                except Exception as e:
+                    self.logger.error(f"❌ Error extracting details from {url}: {e}")
+                    release = None
+                yield index, url, release, self.discovered
+                index += 1
+        finally:
+            stop.set()
+            while True:
+                try:
+                    item = pending.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[1].cancel()
+            thread.join(self.join_timeout)
+
+        if errors:
+            raise errors[0]
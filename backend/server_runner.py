@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Web server launch configuration for FitGirl Downloader
+Selects the Socket.IO async mode and the WSGI server options from the settings
+"""
+
+import importlib.util
+import logging
+from typing import Dict, Any
+
+from .settings_manager import AppSettings
+
+logger = logging.getLogger(__name__)
+
+SERVER_MODES = ('development', 'production')
+ASYNC_MODES = ('auto', 'gevent', 'eventlet', 'threading')
+
+
+def _is_available(module: str) -> bool:
+    """Check if a module can be imported without importing it"""
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_async_mode(settings: AppSettings) -> str:
+    """
+    Resolve the Socket.IO async mode for the configured server mode
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        str: 'gevent', 'eventlet' or 'threading'
+    """
+    server_mode = settings.server_mode
+    if server_mode not in SERVER_MODES:
+        logger.warning(f"⚠️ Unknown server mode '{server_mode}', using 'production'")
+        server_mode = 'production'
+
+    # The development server always runs on Werkzeug threads
+    if server_mode == 'development':
+        return 'threading'
+
+    requested = settings.async_mode
+    if requested not in ASYNC_MODES:
+        logger.warning(f"⚠️ Unknown async mode '{requested}', using 'auto'")
+        requested = 'auto'
+
+    if requested == 'threading':
+        return 'threading'
+
+    candidates = ['gevent', 'eventlet'] if requested == 'auto' else [requested]
+    for candidate in candidates:
+        if _is_available(candidate):
+            return candidate
+        if requested != 'auto':
+            logger.warning(f"⚠️ {candidate} is not installed")
+
+    logger.warning("⚠️ No production async server available, falling back to threaded Werkzeug")
+    return 'threading'
+
+
+def apply_monkey_patch(async_mode: str):
+    """
+    Patch the standard library for cooperative servers
+
+    Must run before the application modules are imported so sockets, threads
+    and sleeps used by the scraper become cooperative.
+
+    Args:
+        async_mode: Resolved async mode
+    """
+    if async_mode == 'gevent':
+        from gevent import monkey
+        monkey.patch_all()
+    elif async_mode == 'eventlet':
+        import eventlet
+        eventlet.monkey_patch()
+
+
+def configure_access_log(settings: AppSettings):
+    """
+    Apply access_log to the loggers that bypass socketio.run(log_output=...)
+
+    geventwebsocket's handler writes every request to its own logger even when
+    the gevent server runs with log=None.
+
+    Args:
+        settings: Application settings
+    """
+    level = logging.INFO if settings.access_log else logging.WARNING
+    logging.getLogger('geventwebsocket.handler').setLevel(level)
+
+
+def build_run_options(settings: AppSettings, async_mode: str) -> Dict[str, Any]:
+    """
+    Build the keyword arguments for socketio.run()
+
+    Args:
+        settings: Application settings
+        async_mode: Resolved async mode
+
+    Returns:
+        Dict[str, Any]: Options for socketio.run()
+    """
+    development = settings.server_mode == 'development'
+    options = {
+        'host': settings.web_host,
+        'port': settings.web_port,
+        'debug': settings.debug_mode and development,
+        'use_reloader': settings.debug_mode and development,
+        'log_output': settings.access_log,
+    }
+
+    if async_mode == 'gevent':
+        # Bound the number of greenlets serving connections
+        from gevent.pool import Pool
+        options['spawn'] = Pool(settings.max_connections)
+    elif async_mode == 'eventlet':
+        options['max_size'] = settings.max_connections
+    else:
+        options['allow_unsafe_werkzeug'] = True
+
+    return options
@@ -9,8 +9,8 @@ import os
 import json
 import yaml
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, asdict, field
 import logging
 
 @dataclass
@@ -22,6 +22,24 @@ class AppSettings:
     # Scraping configuration
     max_concurrent_requests: int = 5
     timeout: int = 30  # timeout in seconds
+    max_background_jobs: int = 2  # Concurrent background jobs (e.g. release resync)
+    requests_per_second: float = 2.0  # Politeness limit per host, shared by all scraper requests
+    scraper_engine: str = "threads"  # threads, async (detail pages over one aiohttp connection pool)
+    incremental_stop_pages: int = 2  # Incremental sync stops after N consecutive fully known listing pages (0 = all pages)
+    http_cache_enabled: bool = True  # Keep scraped pages on disk and revalidate them
+    http_cache_path: str = "cache/http_cache.sqlite"
+    http_cache_max_mb: int = 200  # Compressed size cap, least recently used pages are evicted
+    http_cache_ttl: int = 21600  # Seconds a cached detail page is reused without a request
+    selenium_pool_size: int = 1  # Headless Chrome instances shared by the image fallback
+    selenium_recycle_pages: int = 50  # Restart a Chrome instance after N pages (0 = never)
+    selenium_recycle_memory_mb: int = 512  # Restart a Chrome instance above this JS heap size (0 = never)
+    selenium_idle_timeout: int = 300  # Quit a Chrome instance unused for N seconds (0 = keep until shutdown)
+    selenium_block_resources: bool = True  # Skip image bytes, fonts, media and ad hosts in Chrome
+    selenium_image_timeout: float = 10.0  # Seconds the fallback waits for lazy images per attempt
+    image_backfill_enabled: bool = True  # Save releases first, load browser-only images in the background
+    image_backfill_interval: int = 300  # Seconds between checks of the image backfill queue
+    image_backfill_delay: float = 1.0  # Pause between two backfilled releases (seconds)
+    bulk_resync_batch_size: int = 25  # Releases written per database save in bulk resync
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     
     # Database configuration
@@ -32,16 +50,36 @@ class AppSettings:
     
     # Release synchronization configuration
     last_sync_check: Optional[datetime] = None
+    full_sync_completed: bool = False  # Set once a sync read all 100 listing pages; until then no early stop
     
     # Logging configuration
     log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
     log_to_file: bool = True
     max_log_files: int = 30
+    # Keep one of every N messages per category (e.g. progress updates)
+    log_sample_rates: Dict[str, int] = field(default_factory=lambda: {'progress': 10})
+    log_verbose: List[str] = field(default_factory=list)  # Per-release debug categories: details, images
     
     # Web server configuration
     web_port: int = 2121
     web_host: str = "0.0.0.0"
-    debug_mode: bool = True
+    debug_mode: bool = False
+    server_mode: str = "production"  # production, development (Werkzeug)
+    async_mode: str = "auto"  # auto, gevent, eventlet, threading
+    max_connections: int = 1000  # Concurrent connections (gevent/eventlet)
+    access_log: bool = False
+    progress_emit_hz: float = 4.0  # Maximum sync_progress (and bulk resync progress) broadcasts per second
+    release_event_window: float = 1.0  # Seconds new releases are batched per new_release_added event
+    event_log_size: int = 1000  # Events kept for Server-Sent Events resume (Last-Event-ID)
+    sse_keepalive: float = 15.0  # Seconds between keepalive comments on idle SSE streams
+    metrics_enabled: bool = True  # Expose Prometheus metrics on /metrics
+    admin_token: str = ""  # Required in X-Admin-Token for admin features; empty allows localhost only
+    profile_dir: str = "profiles"  # Where ?profile=1 and sync profiles are saved
+    profile_keep: int = 20  # Number of profiles kept on disk
+    json_backend: str = "auto"  # auto, orjson, stdlib
+    compression_enabled: bool = True
+    compression_min_size: int = 1024  # bytes
+    compression_level: int = 6  # 1-9
     
     # Application information
     version: str = "0.1.0"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stage timings for FitGirl Downloader
+Collects per-release scrape stage durations and summarizes them per sync run
+"""
+
+import math
+import threading
+from typing import Any, Dict, List, Sequence
+
+# Stages of a release scrape, in pipeline order
+SCRAPE_STAGES = ('fetch', 'parse', 'description', 'images', 'selenium', 'details', 'dates', 'insert')
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of sorted values
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile between 0 and 1
+
+    Returns:
+        float: Percentile value (0 for no values)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class StageTimings:
+    """
+    Durations of the scrape stages of one sync run
+    """
+
+    def __init__(self):
+        """Initialize empty timings"""
+        self._samples: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        """
+        Record the duration of a stage for one release
+
+        Args:
+            stage: Stage name
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            self._samples.setdefault(stage, []).append(seconds)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize each stage
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Stage -> count, total, mean, p50, p90, p99 and max
+            (seconds, rounded to milliseconds), in pipeline order
+        """
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self._samples.items()}
+
+        ordered = [stage for stage in SCRAPE_STAGES if stage in samples]
+        ordered += sorted(stage for stage in samples if stage not in SCRAPE_STAGES)
+
+        result = {}
+        for stage in ordered:
+            values = samples[stage]
+            total = sum(values)
+            result[stage] = {
+                'count': len(values),
+                'total': round(total, 3),
+                'mean': round(total / len(values), 3),
+                'p50': round(percentile(values, 0.50), 3),
+                'p90': round(percentile(values, 0.90), 3),
+                'p99': round(percentile(values, 0.99), 3),
+                'max': round(values[-1], 3)
+            }
+        return result
+
+    def format_table(self) -> str:
+        """
+        Render the summary as a text table for logs
+
+        Returns:
+            str: One line per stage
+        """
+        lines = [f"{'stage':<12}{'count':>7}{'total':>10}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}"]
+        for stage, stats in self.summary().items():
+            lines.append(f"{stage:<12}{stats['count']:>7}{stats['total']:>10.2f}{stats['p50']:>9.3f}"
+                         f"{stats['p90']:>9.3f}{stats['p99']:>9.3f}{stats['max']:>9.3f}")
+        return '\n'.join(lines)
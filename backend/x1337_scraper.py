@@ -5,14 +5,15 @@
 """
 
 import requests
+import threading
 import time
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from bs4 import BeautifulSoup
-from typing import List, Optional, Dict, Callable
+from typing import List, Optional, Dict, Callable, Iterable, Iterator, Set, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -21,6 +22,75 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 from .game_release import GameRelease, ReleaseStatus
 import logging
 from .settings_manager import SettingsManager
+from .metrics import REGISTRY, LONG_BUCKETS
+from .stage_timings import StageTimings
+from .rate_limiter import HostRateLimiter
+from .http_cache import CachingAdapter, HttpCache
+from .driver_pool import DriverPool
+from .scrape_pipeline import DetailPipeline
+from .log_pipeline import get_category_logger
+
+SCRAPER_PAGES_FETCHED = REGISTRY.counter(
+    'fitgirl_scraper_pages_fetched_total', 'Pages requested from 1337x', ['kind'])
+SCRAPER_DETAILS_PARSED = REGISTRY.counter(
+    'fitgirl_scraper_detail_pages_parsed_total', 'Release detail pages parsed into a release')
+SCRAPER_SELENIUM_FALLBACKS = REGISTRY.counter(
+    'fitgirl_scraper_selenium_fallbacks_total', 'Detail pages that needed Selenium to find images')
+SCRAPER_IMAGE_SOURCES = REGISTRY.counter(
+    'fitgirl_scraper_release_images_total', 'Detail pages by where their images were found', ['source'])
+SCRAPER_DOWNLOADED_BYTES = REGISTRY.counter(
+    'fitgirl_scraper_downloaded_bytes_total', 'Response body bytes downloaded by the scraper')
+SCRAPER_HTTP_ERRORS = REGISTRY.counter(
+    'fitgirl_scraper_http_errors_total', 'Scraper HTTP responses with an error status', ['status'])
+SELENIUM_IMAGE_WAIT_SECONDS = REGISTRY.histogram(
+    'fitgirl_selenium_image_wait_seconds', 'Time until lazy images settled in the Selenium fallback',
+    ['outcome'])
+SCRAPE_STAGE_SECONDS = REGISTRY.histogram(
+    'fitgirl_scrape_stage_duration_seconds', 'Duration of per-release scrape stages', ['stage'])
+SYNC_STAGE_SECONDS = REGISTRY.histogram(
+    'fitgirl_sync_stage_duration_seconds', 'Duration of synchronization stages', ['stage'],
+    buckets=LONG_BUCKETS)
+
+# Attributes where lazy loaders keep the real image URL, most specific first
+LAZY_IMAGE_ATTRIBUTES = ('data-original', 'data-src', 'data-lazy-src', 'data-lazy', 'data-url')
+LAZY_SRCSET_ATTRIBUTES = ('data-srcset', 'srcset')
+
+# Description blocks whose images are lazily loaded
+_DESCRIPTION_SELECTOR = 'div.torrent-detail-page, div.box-info-detail'
+
+# Scrolls each description image into view, one animation frame apart, so
+# IntersectionObserver and scroll based lazy loaders swap in the real URLs
+_TRIGGER_LAZY_IMAGES_JS = """
+var done = arguments[arguments.length - 1];
+var root = document.querySelector(arguments[0]);
+var images = root ? root.querySelectorAll('img') : [];
+var i = 0;
+(function step() {
+    if (i >= images.length) {
+        window.scrollTo(0, 0);
+        done(images.length);
+        return;
+    }
+    images[i++].scrollIntoView({block: 'center'});
+    window.dispatchEvent(new Event('scroll'));
+    requestAnimationFrame(function () { setTimeout(step, 30); });
+})();
+"""
+
+# Description images still showing a placeholder or loading, and the requests made so far
+_LAZY_IMAGE_STATE_JS = """
+var root = document.querySelector(arguments[0]);
+var images = root ? Array.prototype.slice.call(root.querySelectorAll('img')) : [];
+var pending = images.filter(function (img) {
+    var src = img.getAttribute('src') || '';
+    return !src || src.indexOf('data:') === 0 || src.indexOf('profile-load') !== -1 || !img.complete;
+});
+return {images: images.length, pending: pending.length, ready: document.readyState,
+        resources: performance.getEntriesByType('resource').length};
+"""
+
+# Polls without new network requests after which the page counts as idle
+_NETWORK_IDLE_POLLS = 3
 
 
 class X1337Scraper:
@@ -32,6 +102,11 @@ class X1337Scraper:
         """Initialize the scraper"""
         # Logger - initialize first
         self.logger = logging.getLogger(__name__)
+        # Per-release chatter is DEBUG and only emitted for categories listed in log_verbose
+        self.detail_logger = get_category_logger(__name__, 'details')
+        self.image_logger = get_category_logger(__name__, 'images')
+        # Progress messages are sampled (log_sample_rates)
+        self.progress_logger = get_category_logger(__name__, 'progress')
         
         self.base_url = "https://1337x.to"
         self.fitgirl_torrents_url = "https://1337x.to/FitGirl-torrents/"
@@ -47,16 +122,33 @@ class X1337Scraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        self.session.hooks['response'].append(self._record_response)
+        
+        # Concurrency and politeness limits (configured from settings in initialize())
+        self.max_workers = 1
+        self.request_timeout = 30
+        self.selenium_image_timeout = 10.0
+        self.defer_image_fallback = False
+        self.rate_limiter = HostRateLimiter(2.0)
+        self.http_cache: Optional[HttpCache] = None
+        self.async_engine = None
         
-        # Selenium configuration
-        self.driver = None
-        self._setup_selenium()
+        # Headless Chrome pool for the image fallback (configured in initialize())
+        self.driver_pool: Optional[DriverPool] = None
         
         # State control
         self._is_running = False
         self.progress_callback = None
         self.insert_callback = None
         self.url_check_callback = None
+        # Whether the last get_releases_from_pages() read every listing page without error
+        self.last_listing_complete = False
+        # Listing URLs the last get_releases_from_pages() could not turn into a release
+        self.last_rejected_urls: List[str] = []
+        
+        # Stage timings of the run executing on the current thread
+        self._run_local = threading.local()
+        self.last_run_timings: Optional[StageTimings] = None
         
         self.logger.info("🔧 X1337Scraper initialized")
     
@@ -68,7 +160,42 @@ class X1337Scraper:
             settings_manager: Configuration manager
         """
         self.settings_manager = settings_manager
-        self.logger.info("🔧 X1337Scraper initialized")
+        settings = settings_manager.settings
+        
+        # Detail pages are fetched by up to max_concurrent_requests workers sharing one
+        # per-host request budget
+        self.max_workers = max(1, settings.max_concurrent_requests)
+        self.request_timeout = settings.timeout
+        self.rate_limiter = HostRateLimiter(settings.requests_per_second)
+        pool_size = max(10, self.max_workers)
+        if settings.http_cache_enabled:
+            self.http_cache = HttpCache(settings.http_cache_path, settings.http_cache_max_mb * 1024 * 1024,
+                                        settings.http_cache_ttl)
+            adapter = CachingAdapter(self.http_cache, pool_maxsize=pool_size)
+        else:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        self.selenium_image_timeout = settings.selenium_image_timeout
+        # With the backfill enabled, releases needing a browser are saved first and imaged later
+        self.defer_image_fallback = settings.image_backfill_enabled
+        self.driver_pool = DriverPool(settings.selenium_pool_size, settings.selenium_recycle_pages,
+                                      settings.selenium_recycle_memory_mb, settings.timeout,
+                                      self.session.headers['User-Agent'], settings.selenium_block_resources,
+                                      settings.selenium_idle_timeout)
+        
+        if settings.scraper_engine == 'async':
+            from .async_scraper import AsyncScraperEngine, aiohttp
+            if aiohttp is not None:
+                self.async_engine = AsyncScraperEngine(self)
+            else:
+                self.logger.warning("⚠️ aiohttp is not installed, detail pages use the thread pool")
+        elif settings.scraper_engine != 'threads':
+            self.logger.warning(f"⚠️ Unknown scraper engine '{settings.scraper_engine}', using 'threads'")
+        
+        self.logger.info(f"🔧 X1337Scraper initialized ({self.max_workers} workers, "
+                         f"{settings.requests_per_second} requests/s per host)")
     
     def set_progress_callback(self, callback: Callable[[str, str, dict], None]):
         """
@@ -97,6 +224,115 @@ class X1337Scraper:
         """
         self.url_check_callback = callback
     
+    def _record_response(self, response, *args, **kwargs):
+        """Session hook that counts downloaded bytes and HTTP errors"""
+        if getattr(response, 'from_cache', False):
+            return
+        self._record_download(response.status_code, len(response.content))
+    
+    def _record_download(self, status_code: int, size: int):
+        """Count downloaded bytes and HTTP errors of a response"""
+        SCRAPER_DOWNLOADED_BYTES.inc(size)
+        if status_code >= 400:
+            SCRAPER_HTTP_ERRORS.inc(status=status_code)
+    
+    def _fetch(self, url: str, revalidate: bool = False) -> requests.Response:
+        """
+        GET a page once the per-host rate limit allows it
+        
+        Args:
+            url: Page URL
+            revalidate: Check a cached copy with the server even if it is still fresh
+            
+        Returns:
+            requests.Response: Successful response
+            
+        Raises:
+            requests.RequestException: On connection errors, timeouts and HTTP errors
+        """
+        # Pages served from the disk cache do not count against the rate limit
+        if not (self.http_cache and not revalidate and self.http_cache.is_fresh(url)):
+            self.rate_limiter.wait(url)
+        headers = {'Cache-Control': 'no-cache'} if revalidate else None
+        response = self.session.get(url, headers=headers, timeout=self.request_timeout)
+        response.raise_for_status()
+        return response
+    
+    def _run_with_timings(self, timings: Optional[StageTimings], func: Callable, *args):
+        """Call func on a worker thread, recording its stages into the timings of the run"""
+        self._run_local.timings = timings
+        try:
+            return func(*args)
+        finally:
+            self._run_local.timings = None
+    
+    @contextmanager
+    def _detail_workers(self, timings: Optional[StageTimings]) -> Iterator[Callable[[str], Future]]:
+        """
+        Start the detail page workers of a sync run
+        
+        Args:
+            timings: Stage timings of the run
+            
+        Returns:
+            Context manager yielding submit(url) -> Future of the release (or None)
+        """
+        if self.async_engine:
+            with self.async_engine.workers(timings) as submit:
+                yield submit
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scrape")
+        try:
+            yield lambda torrent_url: executor.submit(self._run_with_timings, timings,
+                                                      self._extract_release_details, torrent_url)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _extract_releases(self, torrent_links: Iterable[str]) -> Iterator[Tuple[int, str, Optional[GameRelease], int]]:
+        """
+        Extract the details of releases as their URLs are discovered
+        
+        Args:
+            torrent_links: Torrent URLs in listing order (may be a generator downloading listing pages)
+            
+        Returns:
+            Iterator of (index, URL, release or None, URLs discovered so far), in listing order
+        """
+        timings = getattr(self._run_local, 'timings', None)
+        with self._detail_workers(timings) as submit:
+            pipeline = DetailPipeline(submit, max_pending=self.max_workers * 4, join_timeout=self.request_timeout)
+            yield from pipeline.run(torrent_links, self.is_running)
+    
+    def _begin_run_timings(self) -> StageTimings:
+        """Start collecting stage timings for a sync run on this thread"""
+        timings = StageTimings()
+        self._run_local.timings = timings
+        self.last_run_timings = timings
+        return timings
+    
+    def _end_run_timings(self):
+        """Stop collecting stage timings on this thread"""
+        self._run_local.timings = None
+    
+    def _record_stage(self, stage: str, started: float) -> float:
+        """
+        Record a scrape stage that started at `started`
+        
+        Args:
+            stage: Stage name
+            started: time.perf_counter() value when the stage started
+            
+        Returns:
+            float: Current time.perf_counter(), the start of the next stage
+        """
+        now = time.perf_counter()
+        SCRAPE_STAGE_SECONDS.observe(now - started, stage=stage)
+        timings = getattr(self._run_local, 'timings', None)
+        if timings is not None:
+            timings.record(stage, now - started)
+        return now
+    
     def _update_progress(self, status: str, message: str, **kwargs):
         """
         Update progress using callback if available
@@ -108,26 +344,133 @@ class X1337Scraper:
         """
         if self.progress_callback:
             self.progress_callback(status, message, **kwargs)
-        self.logger.info(f"📊 {status}: {message}")
+        self.progress_logger.info("📊 %s: %s", status, message)
     
-    def _setup_selenium(self):
-        """Configure the Selenium driver"""
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')  # Run without window
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.set_page_load_timeout(30)
-            self.logger.info("🌐 Selenium Chrome driver configured")
+    def load_dynamic_images(self, torrent_url: str, title: str) -> Optional[Tuple[str, List[str]]]:
+        """
+        Loads a detail page in headless Chrome to find lazily loaded images
+        
+        Args:
+            torrent_url: Torrent URL
+            title: Release title (for logging)
             
-        except Exception as e:
-            self.logger.warning(f"⚠️ Could not configure Selenium (will continue without dynamic images): {e}")
-            self.driver = None
+        Returns:
+            Optional[Tuple[str, List[str]]]: Cover URL and screenshot URLs (empty when
+            none were found), or None if no browser was available
+        """
+        if not self.driver_pool or not self.driver_pool.available:
+            return None
+        
+        # Use Selenium to load dynamic images with retry mechanism
+        self.logger.info(f"🌐 Using Selenium to load dynamic images: {title}")
+        SCRAPER_SELENIUM_FALLBACKS.inc()
+        
+        cover_image_url = ""
+        screenshot_urls = []
+        max_retries = 2
+        
+        for attempt in range(max_retries):
+            try:
+                self.logger.info(f"🔄 Selenium attempt {attempt + 1}/{max_retries}")
+                
+                # Browsers are reused; a driver that fails here is discarded by the pool
+                with self.driver_pool.lease() as driver:
+                    if driver is None:
+                        self.logger.warning("⚠️ No Selenium driver available, skipping dynamic images")
+                        return None
+                    
+                    # Get processed HTML once the lazy images settled
+                    html = self._load_lazy_images(driver, torrent_url)
+                    selenium_soup = BeautifulSoup(html, 'html.parser')
+                    selenium_description_div = selenium_soup.find('div', class_='torrent-detail-page')
+                    if not selenium_description_div:
+                        selenium_description_div = selenium_soup.find('div', class_='box-info-detail')
+                    
+                    if selenium_description_div:
+                        # Add detailed HTML logging for debugging
+                        all_images = selenium_description_div.find_all('img')
+                        self.image_logger.debug("🔍 Selenium attempt %s found %s images in description", attempt + 1, len(all_images))
+                        
+                        if self.image_logger.isEnabledFor(logging.DEBUG):
+                            for i, img in enumerate(all_images[:10]):
+                                self.image_logger.debug("   Image %s: %s (alt: %s)", i+1,
+                                                        img.get('src', ''), img.get('alt', '')[:50])
+                        
+                        # Extract images from HTML with executed JavaScript
+                        if not cover_image_url:
+                            cover_image_url = self._extract_game_cover_image(selenium_description_div)
+                        if not screenshot_urls:
+                            screenshot_urls = self._extract_screenshots(selenium_description_div, cover_image_url)
+                        
+                        # If we found images, break the retry loop
+                        if cover_image_url or screenshot_urls:
+                            self.logger.info(f"✅ Found images on attempt {attempt + 1}")
+                            break
+                        else:
+                            self.logger.warning(f"⚠️ No images found on attempt {attempt + 1}")
+                    else:
+                        self.logger.warning(f"⚠️ No description div found on attempt {attempt + 1}")
+                        
+            except Exception as e:
+                self.logger.error(f"❌ Error with Selenium attempt {attempt + 1}: {e}")
+            
+            # If we found images, no need for more attempts
+            if cover_image_url or screenshot_urls:
+                break
+        
+        return cover_image_url, screenshot_urls
+    
+    def _load_lazy_images(self, driver, torrent_url: str) -> str:
+        """
+        Open a detail page in Chrome and wait for its lazily loaded description images
+        
+        Args:
+            driver: Leased Chrome driver
+            torrent_url: Torrent URL
+            
+        Returns:
+            str: Page HTML once every description image has a real, loaded URL, the
+            network went idle, or selenium_image_timeout passed
+        """
+        started = time.perf_counter()
+        deadline = started + self.selenium_image_timeout
+        driver.get(torrent_url)
+        WebDriverWait(driver, self.selenium_image_timeout).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        driver.set_script_timeout(max(1.0, deadline - time.perf_counter()))
+        try:
+            triggered = driver.execute_async_script(_TRIGGER_LAZY_IMAGES_JS, _DESCRIPTION_SELECTOR)
+            self.image_logger.debug("🔍 Triggered lazy loading of %s description images", triggered)
+        except TimeoutException:
+            # A slow scroll is not a browser failure: the condition wait still reads the page
+            self.image_logger.debug("⏱️ Lazy loading trigger timed out for %s", torrent_url)
+        
+        idle = {'resources': -1, 'polls': 0}
+        
+        def settled(d):
+            state = d.execute_script(_LAZY_IMAGE_STATE_JS, _DESCRIPTION_SELECTOR)
+            if state['images'] and not state['pending']:
+                return 'images'
+            # Network idle: the document finished loading and no request started since the last polls
+            if state['ready'] == 'complete' and state['resources'] == idle['resources']:
+                idle['polls'] += 1
+            else:
+                idle['polls'] = 0
+            idle['resources'] = state['resources']
+            return 'idle' if idle['polls'] >= _NETWORK_IDLE_POLLS else False
+        
+        try:
+            outcome = WebDriverWait(driver, max(0.5, deadline - time.perf_counter()),
+                                    poll_frequency=0.2).until(settled)
+        except TimeoutException:
+            outcome = 'deadline'
+        
+        waited = time.perf_counter() - started
+        SELENIUM_IMAGE_WAIT_SECONDS.observe(waited, outcome=outcome)
+        self.image_logger.debug("⏱️ Lazy images settled in %.2fs (%s)", waited, outcome)
+        return driver.page_source
     
     def get_fitgirl_releases(self, max_pages: int = 100) -> List[GameRelease]:
         """
@@ -143,30 +486,22 @@ class X1337Scraper:
         
         try:
             self._is_running = True
+            self._begin_run_timings()
             self._update_progress('scraping', 'Starting FitGirl releases download...')
             
-            # Get torrent list from complete pagination URL
-            torrent_links = self._get_torrent_links_from_torrents_page(max_pages)
-            
-            if not torrent_links:
-                self._update_progress('error', 'No torrent links found')
-                return []
+            # Listing pages are downloaded while the details of earlier torrents are extracted
+            torrent_links = self._iter_listing_links(1, max_pages, stop_when_empty=True)
             
-            self._update_progress('processing', f'Processing {len(torrent_links)} torrents...', 
-                               current_release=0, total_releases=len(torrent_links))
-            
-            # Process each torrent to get complete details
-            for i, torrent_url in enumerate(torrent_links):
+            details_started = time.perf_counter()
+            for i, torrent_url, release, discovered in self._extract_releases(torrent_links):
                 try:
-                    self._update_progress('processing', f'Processing torrent {i+1} of {len(torrent_links)}...', 
-                                       current_release=i+1, total_releases=len(torrent_links))
-                    
-                    release = self._extract_release_details(torrent_url)
+                    self._update_progress('processing', f'Processing torrent {i+1} of {discovered}...', 
+                                       current_release=i+1, total_releases=discovered)
                     
                     if release and release.has_download_links:
                         releases.append(release)
                         self._update_progress('processing', f'Release {len(releases)}: {release.title}',
-                                           current_release=i+1, total_releases=len(torrent_links), 
+                                           current_release=i+1, total_releases=discovered, 
                                            processed_releases=len(releases))
                     else:
                         if release:
@@ -174,16 +509,14 @@ class X1337Scraper:
                         else:
                             self.logger.warning(f"⚠️ Could not extract release from: {torrent_url}")
                         self._update_progress('processing', f'Skipping torrent without complete data', 
-                                           current_release=i+1, total_releases=len(torrent_links))
-                    
-                    # Pause between requests
-                    time.sleep(1)
+                                           current_release=i+1, total_releases=discovered)
                     
                 except Exception as e:
                     self._update_progress('processing', f'Error processing torrent: {str(e)}...', 
-                                       current_release=i+1, total_releases=len(torrent_links))
+                                       current_release=i+1, total_releases=discovered)
                     continue
             
+            SYNC_STAGE_SECONDS.observe(time.perf_counter() - details_started, stage='details')
             self._update_progress('completed', f'Processing completed: {len(releases)} releases obtained', 
                                processed_releases=len(releases))
             
@@ -193,6 +526,7 @@ class X1337Scraper:
         
         finally:
             self._is_running = False
+            self._end_run_timings()
         
         return releases
 
@@ -205,180 +539,195 @@ class X1337Scraper:
         """
         return self.get_fitgirl_releases(max_pages=100)
 
-    def get_releases_from_pages(self, start_page: int, end_page: int) -> List[GameRelease]:
+    def get_releases_from_pages(self, start_page: int, end_page: int, stop_after_known_pages: int = 0,
+                                rejected_urls: Optional[Set[str]] = None) -> List[GameRelease]:
         """
         Gets releases from a specific range of pages
         
+        Listing pages, detail pages and inserts run concurrently, so the first new
+        releases are inserted while later listing pages are still being downloaded.
+        
         Args:
             start_page: Initial page (1-based)
             end_page: Final page (inclusive)
+            stop_after_known_pages: Stop after this many consecutive listing pages
+                                    without unknown URLs (0 reads every page)
+            rejected_urls: URLs earlier runs could not store; they are retried but
+                           count as known for the early stop
             
         Returns:
-            List[GameRelease]: List of releases from the specified range
+            List[GameRelease]: List of releases from the specified range; the URLs
+            that could not be stored are left in last_rejected_urls
         """
         releases = []
+        self.last_listing_complete = False
+        self.last_rejected_urls = []
         
         try:
             self._is_running = True
+            self._begin_run_timings()
             self._update_progress('scraping', f'Getting releases from pages {start_page} to {end_page}')
             
-            # Get torrent links from specified range
-            torrent_links = []
+            # OPTIMIZATION: URLs that already exist are dropped before any detail page is requested
+            torrent_links = self._iter_listing_links(start_page, end_page, skip_known=True,
+                                                     stop_after_known_pages=stop_after_known_pages,
+                                                     rejected_urls=rejected_urls)
             
-            for page in range(start_page, end_page + 1):
-                page_url = f"{self.fitgirl_torrents_url}{page}/"
-                self._update_progress('scraping', f'Downloading page {page} of {end_page}...', 
-                                   current_page=page, total_pages=end_page)
-                
-                response = self.session.get(page_url, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Search for torrent links in the table
-                torrent_rows = soup.find_all('tr')
-                page_links = []
-                
-                for row in torrent_rows:
-                    # Search for torrent link
-                    torrent_link = row.find('a', href=lambda x: x and '/torrent/' in x)
-                    if torrent_link:
-                        full_url = self.base_url + torrent_link['href']
-                        if full_url not in torrent_links:
-                            torrent_links.append(full_url)
-                            page_links.append(full_url)
-                
-                self._update_progress('scraping', f'Page {page}: {len(page_links)} torrents found', 
-                                   current_page=page, total_pages=end_page, total_torrents=len(torrent_links))
-                
-                # Pause between pages
-                time.sleep(2)
-            
-            self._update_progress('processing', f'Processing {len(torrent_links)} torrents...', 
-                               current_release=0, total_releases=len(torrent_links))
-            
-            # Process each torrent to get complete details
-            for i, torrent_url in enumerate(torrent_links):
+            # Details are fetched concurrently and inserted in listing order
+            details_started = time.perf_counter()
+            for i, torrent_url, release, discovered in self._extract_releases(torrent_links):
                 try:
-                    self._update_progress('processing', f'Verifying torrent {i+1} of {len(torrent_links)}...', 
-                                       current_release=i+1, total_releases=len(torrent_links))
-                    
-                    # OPTIMIZATION: Check if URL already exists before processing
-                    if self.url_check_callback and self.url_check_callback(torrent_url):
-                        self.logger.info(f"⏭️ URL already exists, skipping processing: {torrent_url}")
-                        self._update_progress('processing', f'URL already exists, skipped', 
-                                           current_release=i+1, total_releases=len(torrent_links))
-                        continue
-                    
-                    # Only extract details if URL doesn't exist
-                    self._update_progress('processing', f'Extracting torrent details {i+1} of {len(torrent_links)}...', 
-                                       current_release=i+1, total_releases=len(torrent_links))
-                    
-                    release = self._extract_release_details(torrent_url)
-                    
                     if release and release.has_download_links:
                         if self.insert_callback:
                             # Insert immediately using callback
-                            if self.insert_callback(release):
+                            insert_started = time.perf_counter()
+                            inserted = self.insert_callback(release)
+                            self._record_stage('insert', insert_started)
+                            if inserted:
                                 releases.append(release)
                                 self._update_progress('processing', f'Release inserted: {release.title}', 
-                                                   current_release=i+1, total_releases=len(torrent_links), 
+                                                   current_release=i+1, total_releases=discovered, 
                                                    processed_releases=len(releases))
                             else:
                                 self.logger.warning(f"⚠️ Could not insert release: {release.title}")
                                 self._update_progress('processing', f'Error inserting release: {release.title}', 
-                                                   current_release=i+1, total_releases=len(torrent_links))
+                                                   current_release=i+1, total_releases=discovered)
                         else:
                             # Normal mode: add to list
                             releases.append(release)
                             self._update_progress('processing', f'Release {len(releases)}: {release.title}', 
-                                               current_release=i+1, total_releases=len(torrent_links), 
+                                               current_release=i+1, total_releases=discovered, 
                                                processed_releases=len(releases))
                     else:
                         if release:
                             self.logger.warning(f"⚠️ Release without magnet link: {release.title}")
                         else:
                             self.logger.warning(f"⚠️ Could not extract release from: {torrent_url}")
+                        self.last_rejected_urls.append(torrent_url)
                         self._update_progress('processing', f'Skipping torrent without complete data', 
-                                           current_release=i+1, total_releases=len(torrent_links))
-                    
-                    # Pause between requests
-                    time.sleep(1)
+                                           current_release=i+1, total_releases=discovered)
                     
                 except Exception as e:
+                    self.last_rejected_urls.append(torrent_url)
                     self._update_progress('processing', f'Error processing torrent: {str(e)}...', 
-                                       current_release=i+1, total_releases=len(torrent_links))
+                                       current_release=i+1, total_releases=discovered)
                     continue
             
+            SYNC_STAGE_SECONDS.observe(time.perf_counter() - details_started, stage='details')
             self._update_progress('completed', f'Processing completed: {len(releases)} releases obtained', 
                                processed_releases=len(releases))
             
         except Exception as e:
+            self.last_listing_complete = False
             self._update_progress('error', f'Error getting releases: {str(e)}')
             self.logger.error(f"❌ Error getting releases: {e}")
         
         finally:
             self._is_running = False
+            self._end_run_timings()
         
         return releases
     
-    def _get_torrent_links_from_torrents_page(self, max_pages: int) -> List[str]:
+    def _parse_listing_links(self, content: bytes, seen: Set[str]) -> List[str]:
         """
-        Gets torrent links from the torrents page with complete pagination
+        Extracts the torrent links of a listing page that were not seen before
         
         Args:
-            max_pages: Maximum number of pages
+            content: Listing page HTML
+            seen: URLs found on earlier pages (updated in place)
             
         Returns:
-            List[str]: List of torrent URLs
+            List[str]: New torrent URLs in page order
         """
-        torrent_links = []
+        soup = BeautifulSoup(content, 'html.parser')
+        page_links = []
         
-        try:
-            self._update_progress('scraping', f'Downloading pages 1 to {max_pages}...', current_page=0, total_pages=max_pages)
+        # Search for torrent links in the table
+        for row in soup.find_all('tr'):
+            torrent_link = row.find('a', href=lambda x: x and '/torrent/' in x)
+            if torrent_link:
+                full_url = self.base_url + torrent_link['href']
+                if full_url not in seen:
+                    seen.add(full_url)
+                    page_links.append(full_url)
+        
+        return page_links
+    
+    def _iter_listing_links(self, start_page: int, end_page: int, stop_when_empty: bool = False,
+                            skip_known: bool = False, stop_after_known_pages: int = 0,
+                            rejected_urls: Optional[Set[str]] = None) -> Iterator[str]:
+        """
+        Downloads listing pages newest first, yielding torrent URLs as each page is parsed
+        
+        Args:
+            start_page: Initial page (1-based)
+            end_page: Final page (inclusive)
+            stop_when_empty: Stop at the first page without new torrents
+            skip_known: Drop URLs for which url_check_callback returns True
+            stop_after_known_pages: With skip_known, stop after this many consecutive
+                                    pages made entirely of known URLs (0 disables)
+            rejected_urls: URLs that count as known for the early stop although they
+                           are still yielded (entries that earlier runs could not store)
             
-            for page in range(1, max_pages + 1):
-                page_url = f"{self.fitgirl_torrents_url}{page}/"
-                self._update_progress('scraping', f'Downloading page {page} of {max_pages}...', current_page=page, total_pages=max_pages)
+        Returns:
+            Iterator[str]: Torrent URLs in listing order; last_listing_complete is set
+            once every page up to end_page (or the last non-empty page) was read
+            
+        Raises:
+            requests.RequestException: If a listing page cannot be downloaded
+        """
+        seen: Set[str] = set()
+        known = 0
+        known_pages = 0
+        listing_started = time.perf_counter()
+        
+        try:
+            for page in range(start_page, end_page + 1):
+                if not self._is_running:
+                    break
                 
-                response = self.session.get(page_url, timeout=30)
-                response.raise_for_status()
+                page_url = f"{self.fitgirl_torrents_url}{page}/"
+                self._update_progress('scraping', f'Downloading page {page} of {end_page}...', 
+                                   current_page=page, total_pages=end_page)
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
+                SCRAPER_PAGES_FETCHED.inc(kind='listing')
+                # Listing pages change with every upload, a cached copy is always revalidated
+                response = self._fetch(page_url, revalidate=True)
+                page_links = self._parse_listing_links(response.content, seen)
                 
-                # Search for torrent links in the table
-                torrent_rows = soup.find_all('tr')
-                page_links = []
+                # If there are no torrents on this page, we probably reached the end
+                if stop_when_empty and not page_links:
+                    self._update_progress('scraping', f'No more torrents, ending on page {page}', 
+                                       current_page=page, total_pages=end_page)
+                    self.last_listing_complete = True
+                    break
                 
-                for row in torrent_rows:
-                    # Search for torrent link
-                    torrent_link = row.find('a', href=lambda x: x and '/torrent/' in x)
-                    if torrent_link:
-                        full_url = self.base_url + torrent_link['href']
-                        if full_url not in torrent_links:
-                            torrent_links.append(full_url)
-                            page_links.append(full_url)
+                new_links = page_links
+                if skip_known and self.url_check_callback:
+                    new_links = [url for url in page_links if not self.url_check_callback(url)]
+                    known += len(page_links) - len(new_links)
                 
                 self._update_progress('scraping', f'Page {page}: {len(page_links)} torrents found', 
-                                   current_page=page, total_pages=max_pages, total_torrents=len(torrent_links))
+                                   current_page=page, total_pages=end_page, total_torrents=len(seen),
+                                   known_torrents=known)
                 
-                # If there are no torrents on this page, we probably reached the end
-                if not page_links:
-                    self._update_progress('scraping', f'No more torrents, ending on page {page}', 
-                                       current_page=page, total_pages=max_pages)
-                    break
+                yield from new_links
                 
-                # Pause between pages
-                time.sleep(2)
-            
-            self._update_progress('scraping', f'Download completed: {len(torrent_links)} torrents found', 
-                               current_page=max_pages, total_pages=max_pages, total_torrents=len(torrent_links))
-            
-        except Exception as e:
-            self._update_progress('error', f'Error downloading pages: {str(e)}')
-            self.logger.error(f"❌ Error getting torrent links: {e}")
-        
-        return torrent_links
+                # Listings are newest first: once whole pages are known, the rest is known too.
+                # Entries that never store (no magnet) must not keep the scan going forever
+                unseen = [url for url in new_links if not rejected_urls or url not in rejected_urls]
+                known_pages = 0 if unseen else known_pages + 1
+                if skip_known and stop_after_known_pages and known_pages >= stop_after_known_pages:
+                    self.logger.info(f"⏹️ {known_pages} consecutive known listing pages, "
+                                     f"stopping incremental scan at page {page}")
+                    self._update_progress('scraping', f'Caught up with known releases on page {page}', 
+                                       current_page=page, total_pages=page, total_torrents=len(seen),
+                                       known_torrents=known)
+                    break
+            else:
+                self.last_listing_complete = True
+        finally:
+            SYNC_STAGE_SECONDS.observe(time.perf_counter() - listing_started, stage='listing')
     
     def _get_torrent_links_from_profile(self, max_pages: int) -> List[str]:
         """
@@ -391,6 +740,7 @@ class X1337Scraper:
             List[str]: List of torrent URLs
         """
         torrent_links = []
+        seen = set()
         
         try:
             for page in range(1, max_pages + 1):
@@ -400,23 +750,10 @@ class X1337Scraper:
                     page_url = f"{self.fitgirl_profile_url}{page}/"
                 self.logger.info(f"📄 Getting page {page}: {page_url}")
                 
-                response = self.session.get(page_url, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Search for torrent links in the table
-                torrent_rows = soup.find_all('tr')
-                page_links = []
-                
-                for row in torrent_rows:
-                    # Search for torrent link
-                    torrent_link = row.find('a', href=lambda x: x and '/torrent/' in x)
-                    if torrent_link:
-                        full_url = self.base_url + torrent_link['href']
-                        if full_url not in torrent_links:
-                            torrent_links.append(full_url)
-                            page_links.append(full_url)
+                SCRAPER_PAGES_FETCHED.inc(kind='listing')
+                response = self._fetch(page_url, revalidate=True)
+                page_links = self._parse_listing_links(response.content, seen)
+                torrent_links.extend(page_links)
                 
                 self.logger.info(f"📦 Found {len(page_links)} torrents on page {page}")
                 
@@ -424,9 +761,6 @@ class X1337Scraper:
                 if not page_links:
                     self.logger.info(f"📄 No more torrents, ending on page {page}")
                     break
-                
-                # Pause between pages
-                time.sleep(2)
             
             self.logger.info(f"📋 Total torrents found: {len(torrent_links)}")
             
@@ -435,22 +769,43 @@ class X1337Scraper:
         
         return torrent_links
     
-    def _extract_release_details(self, torrent_url: str) -> Optional[GameRelease]:
+    def _extract_release_details(self, torrent_url: str, revalidate: bool = False) -> Optional[GameRelease]:
         """
         Extracts complete details of a release from its individual page
         
         Args:
             torrent_url: Torrent URL
+            revalidate: Check a cached copy of the page with the server (resyncs)
             
         Returns:
             Optional[GameRelease]: GameRelease object with all details
         """
         try:
             # Try first with requests (faster)
-            response = self.session.get(torrent_url, timeout=15)
-            response.raise_for_status()
+            stage_started = time.perf_counter()
+            SCRAPER_PAGES_FETCHED.inc(kind='detail')
+            response = self._fetch(torrent_url, revalidate=revalidate)
+            self._record_stage('fetch', stage_started)
+        except Exception as e:
+            self.logger.error(f"❌ Error extracting details from {torrent_url}: {e}")
+            return None
+        
+        return self._parse_release_details(torrent_url, response.content)
+    
+    def _parse_release_details(self, torrent_url: str, content: bytes) -> Optional[GameRelease]:
+        """
+        Builds a release from the HTML of its individual page
+        
+        Args:
+            torrent_url: Torrent URL
+            content: Downloaded page HTML
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+        Returns:
+            Optional[GameRelease]: GameRelease object with all details
+        """
+        try:
+            stage_started = time.perf_counter()
+            soup = BeautifulSoup(content, 'html.parser')
             
             # Extract basic information - use title tag first to get complete title
             title_tag = soup.find('title')
@@ -471,7 +826,7 @@ class X1337Scraper:
             
             # Extract torrent size
             size = self._extract_size(soup)
-            self.logger.info(f"📦 Size extracted: {size}")
+            self.detail_logger.debug("📦 Size extracted: %s", size)
             
             # Extract magnet link
             magnet_link = self._extract_magnet_link(soup)
@@ -495,11 +850,13 @@ class X1337Scraper:
             for selector in description_selectors:
                 description_div = soup.select_one(selector)
                 if description_div:
-                    self.logger.info(f"✅ Description found with selector: {selector}")
+                    self.detail_logger.debug("✅ Description found with selector: %s", selector)
                     break
+            stage_started = self._record_stage('parse', stage_started)
             
             cover_image_url = ""
             screenshot_urls = []
+            images_pending = False
             
             if description_div:
                 # Extract complete game description
@@ -514,158 +871,65 @@ class X1337Scraper:
                 else:
                     short_description = description
                 
-                self.logger.info(f"📝 Complete description ({len(description)} chars): {description[:100]}...")
-                self.logger.info(f"📋 Technical info ({len(short_description)} chars): {short_description[:100]}...")
+                self.detail_logger.debug("📝 Complete description (%s chars): %s...", len(description), description[:100])
+                self.detail_logger.debug("📋 Technical info (%s chars): %s...", len(short_description), short_description[:100])
+                stage_started = self._record_stage('description', stage_started)
                 
-                # Try to extract images with requests first
+                # Try to extract images with requests first (lazy image attributes included)
                 cover_image_url = self._extract_game_cover_image(description_div)
                 screenshot_urls = self._extract_screenshots(description_div, cover_image_url)
+                static_images_found = bool(cover_image_url or screenshot_urls)
+                stage_started = self._record_stage('images', stage_started)
                 
-                # If we don't find images, use Selenium with improved timeout and retry
-                if not cover_image_url and not screenshot_urls and self.driver:
-                    # Use Selenium to load dynamic images with retry mechanism
-                    self.logger.info(f"🌐 Using Selenium to load dynamic images: {title}")
-                    
-                    driver = None
-                    max_retries = 2
-                    
-                    for attempt in range(max_retries):
-                        try:
-                            self.logger.info(f"🔄 Selenium attempt {attempt + 1}/{max_retries}")
-                            
-                            # Configure Chrome headless
-                            chrome_options = Options()
-                            chrome_options.add_argument('--headless')
-                            chrome_options.add_argument('--no-sandbox')
-                            chrome_options.add_argument('--disable-dev-shm-usage')
-                            chrome_options.add_argument('--disable-gpu')
-                            chrome_options.add_argument('--window-size=1920,1080')
-                            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-                            
-                            driver = webdriver.Chrome(options=chrome_options)
-                            driver.set_page_load_timeout(30)  # Increased timeout
-                            driver.get(torrent_url)
-                            
-                            # Wait for initial load with longer timeout
-                            WebDriverWait(driver, 20).until(
-                                EC.presence_of_element_located((By.TAG_NAME, "body"))
-                            )
-                            time.sleep(5)  # Increased initial wait
-                            
-                            # Enhanced lazy loading techniques with longer waits
-                            # 1. Gradual scroll down with longer pauses
-                            for i in range(8):  # More scroll steps
-                                driver.execute_script(f"window.scrollTo(0, {i * 400});")
-                                time.sleep(1)  # Longer pause between scrolls
-                            
-                            # 2. Scroll to the end and wait longer
-                            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                            time.sleep(4)  # Longer wait at bottom
-                            
-                            # 3. Scroll back up gradually
-                            for i in range(8, 0, -1):
-                                driver.execute_script(f"window.scrollTo(0, {i * 400});")
-                                time.sleep(1)
-                            
-                            # 4. Back to top
-                            driver.execute_script("window.scrollTo(0, 0);")
-                            time.sleep(3)
-                            
-                            # 5. Enhanced image triggering with more images
-                            try:
-                                image_containers = driver.find_elements(By.TAG_NAME, "img")
-                                self.logger.info(f"🔍 Found {len(image_containers)} total images on page")
-                                
-                                for i, container in enumerate(image_containers[:15]):  # More images
-                                    try:
-                                        driver.execute_script("arguments[0].scrollIntoView(true);", container)
-                                        time.sleep(0.5)  # Longer pause for each image
-                                    except:
-                                        pass
-                            except Exception as e:
-                                self.logger.warning(f"⚠️ Error triggering images: {e}")
-                            
-                            # 6. Final wait for any remaining lazy loading
-                            time.sleep(5)  # Longer final wait
-                            
-                            # Get processed HTML
-                            html = driver.page_source
-                            selenium_soup = BeautifulSoup(html, 'html.parser')
-                            selenium_description_div = selenium_soup.find('div', class_='torrent-detail-page')
-                            if not selenium_description_div:
-                                selenium_description_div = selenium_soup.find('div', class_='box-info-detail')
-                            
-                            if selenium_description_div:
-                                # Add detailed HTML logging for debugging
-                                all_images = selenium_description_div.find_all('img')
-                                self.logger.info(f"🔍 Selenium attempt {attempt + 1} found {len(all_images)} images in description")
-                                
-                                for i, img in enumerate(all_images[:10]):
-                                    src = img.get('src', '')
-                                    alt = img.get('alt', '')
-                                    self.logger.info(f"   Image {i+1}: {src} (alt: {alt[:50]})")
-                                
-                                # Extract images from HTML with executed JavaScript
-                                if not cover_image_url:
-                                    cover_image_url = self._extract_game_cover_image(selenium_description_div)
-                                if not screenshot_urls:
-                                    screenshot_urls = self._extract_screenshots(selenium_description_div, cover_image_url)
-                                
-                                # If we found images, break the retry loop
-                                if cover_image_url or screenshot_urls:
-                                    self.logger.info(f"✅ Found images on attempt {attempt + 1}")
-                                    break
-                                else:
-                                    self.logger.warning(f"⚠️ No images found on attempt {attempt + 1}")
-                            else:
-                                self.logger.warning(f"⚠️ No description div found on attempt {attempt + 1}")
-                                
-                        except Exception as e:
-                            self.logger.error(f"❌ Error with Selenium attempt {attempt + 1}: {e}")
-                        finally:
-                            if driver:
-                                driver.quit()
-                                driver = None
-                        
-                        # If we found images, no need for more attempts
-                        if cover_image_url or screenshot_urls:
-                            break
-                        
-                        # Wait between attempts
-                        if attempt < max_retries - 1:
-                            self.logger.info(f"⏳ Waiting 3 seconds before retry...")
-                            time.sleep(3)
+                # If we don't find images, load them with Selenium now or queue them for the backfill
+                if not static_images_found and self.driver_pool and self.driver_pool.available:
+                    if self.defer_image_fallback:
+                        images_pending = True
+                    else:
+                        cover_image_url, screenshot_urls = self.load_dynamic_images(torrent_url, title) or ("", [])
+                        stage_started = self._record_stage('selenium', stage_started)
+                
+                if static_images_found:
+                    SCRAPER_IMAGE_SOURCES.inc(source='static')
+                elif images_pending:
+                    SCRAPER_IMAGE_SOURCES.inc(source='deferred')
+                else:
+                    SCRAPER_IMAGE_SOURCES.inc(source='selenium' if cover_image_url or screenshot_urls else 'none')
                 
                 # Results logging
                 if cover_image_url:
-                    self.logger.info(f"🖼️ Cover found: {cover_image_url}")
+                    self.detail_logger.debug("🖼️ Cover found: %s", cover_image_url)
+                elif images_pending:
+                    self.detail_logger.debug("🕒 Images queued for the backfill: %s", title)
                 else:
                     self.logger.warning(f"⚠️ No cover found for: {title}")
                 
                 if screenshot_urls:
-                    self.logger.info(f"📸 Screenshots found: {len(screenshot_urls)} images")
+                    self.detail_logger.debug("📸 Screenshots found: %s images", len(screenshot_urls))
                     for i, screenshot in enumerate(screenshot_urls[:3]):  # Only show first 3
-                        self.logger.info(f"   {i+1}. {screenshot}")
-                else:
+                        self.detail_logger.debug("   %s. %s", i+1, screenshot)
+                elif not images_pending:
                     self.logger.warning(f"⚠️ No screenshots found for: {title}")
                 
                 # Extract game details
                 game_details = self._extract_game_details(description_div)
+                stage_started = self._record_stage('details', stage_started)
                 
                 # Detailed HTML logging for debugging
-                self.logger.debug(f"🔍 Description HTML for {title}:")
-                self.logger.debug(f"   - HTML length: {len(str(description_div))}")
-                self.logger.debug(f"   - Total images: {len(description_div.find_all('img'))}")
+                if self.detail_logger.isEnabledFor(logging.DEBUG):
+                    self.detail_logger.debug("🔍 Description HTML for %s:", title)
+                    self.detail_logger.debug("   - HTML length: %s", len(str(description_div)))
+                    self.detail_logger.debug("   - Total images: %s", len(description_div.find_all('img')))
                 
                 # Verify that images are assigned correctly
-                self.logger.info(f"📋 Extraction summary for {title}:")
-                self.logger.info(f"   - Cover: {cover_image_url or 'NOT FOUND'}")
-                self.logger.info(f"   - Screenshots: {len(screenshot_urls)} found")
-                self.logger.info(f"   - Magnet: {bool(magnet_link)}")
+                self.detail_logger.debug("📋 Extraction summary for %s:", title)
+                self.detail_logger.debug("   - Cover: %s", cover_image_url or 'NOT FOUND')
+                self.detail_logger.debug("   - Screenshots: %s found", len(screenshot_urls))
+                self.detail_logger.debug("   - Magnet: %s", bool(magnet_link))
                 
                 # Extract original game release date
                 game_release_date = self._extract_game_release_date(description_div)
-                self.logger.info(f"   - Game date: {game_release_date}")
+                self.detail_logger.debug("   - Game date: %s", game_release_date)
             else:
                 description = ""
                 short_description = ""
@@ -675,6 +939,7 @@ class X1337Scraper:
             
             # Extract torrent publication date on 1337x
             torrent_publish_date = self._extract_release_date(soup)
+            stage_started = self._record_stage('dates', stage_started)
             if not torrent_publish_date:
                 # If "Date uploaded" not found, use current date as last resort
                 self.logger.warning(f"⚠️ 'Date uploaded' not found for: {title}")
@@ -694,21 +959,21 @@ class X1337Scraper:
                 status=ReleaseStatus.NEW,
                 additional_data=game_details,
                 cover_image_url=cover_image_url or "",
-                screenshot_urls=screenshot_urls
+                screenshot_urls=screenshot_urls,
+                images_pending=images_pending
             )
             
             # Log of created object
-            self.logger.info(f"🎮 Release created:")
-            self.logger.info(f"   - Title: {release.title}")
-            self.logger.info(f"   - Description: {len(release.description)} chars")
-            self.logger.info(f"   - Short description: {len(release.short_description)} chars")
-            self.logger.info(f"   - Size: {release.size}")
-            self.logger.info(f"   - Publish date: {release.publish_date}")
-            self.logger.info(f"   - Game date: {release.game_release_date}")
-            self.logger.info(f"   - Magnet: {bool(release.magnet_link)}")
-            self.logger.info(f"   - Cover: {release.cover_image_url}")
-            self.logger.info(f"   - Screenshots: {len(release.screenshot_urls)}")
-            
+            self.logger.info("🎮 Release created: %s (%s, %s screenshots)",
+                             release.title, release.size, len(release.screenshot_urls))
+            self.detail_logger.debug("   - Description: %s chars", len(release.description))
+            self.detail_logger.debug("   - Short description: %s chars", len(release.short_description))
+            self.detail_logger.debug("   - Publish date: %s", release.publish_date)
+            self.detail_logger.debug("   - Game date: %s", release.game_release_date)
+            self.detail_logger.debug("   - Magnet: %s", bool(release.magnet_link))
+            self.detail_logger.debug("   - Cover: %s", release.cover_image_url)
+            
+            SCRAPER_DETAILS_PARSED.inc()
             return release
             
         except Exception as e:
@@ -729,7 +994,7 @@ class X1337Scraper:
             Optional[datetime]: Torrent publication date or None if not found
         """
         try:
-            self.logger.info("🔍 Searching for 'Date uploaded' element in specific format...")
+            self.detail_logger.debug("🔍 Searching for 'Date uploaded' element in specific format...")
             
             # Search specifically for <strong>Date uploaded</strong> element
             date_uploaded_element = soup.find('strong', string='Date uploaded')
@@ -738,7 +1003,7 @@ class X1337Scraper:
                 self.logger.warning("⚠️ <strong>Date uploaded</strong> element not found")
                 return None
             
-            self.logger.info("✅ Found <strong>Date uploaded</strong> element")
+            self.detail_logger.debug("✅ Found <strong>Date uploaded</strong> element")
             
             # Search for next <span> element that should contain the relative date
             parent_li = date_uploaded_element.parent
@@ -747,12 +1012,12 @@ class X1337Scraper:
                 span_element = parent_li.find('span')
                 if span_element:
                     date_text = span_element.get_text(strip=True)
-                    self.logger.info(f"🔍 Relative date found in span: '{date_text}'")
+                    self.detail_logger.debug("🔍 Relative date found in span: '%s'", date_text)
                     
                     # Process the relative date
                     parsed_date = self._parse_relative_date(date_text)
                     if parsed_date:
-                        self.logger.info(f"✅ Date processed successfully: {parsed_date}")
+                        self.detail_logger.debug("✅ Date processed successfully: %s", parsed_date)
                         return parsed_date
                     else:
                         self.logger.warning(f"⚠️ Could not process relative date: '{date_text}'")
@@ -782,7 +1047,7 @@ class X1337Scraper:
             return None
         
         try:
-            self.logger.debug(f"🔍 Processing relative date: '{date_text}'")
+            self.detail_logger.debug("🔍 Processing relative date: '%s'", date_text)
             
             # Clean the text
             date_text = date_text.strip().lower()
@@ -795,7 +1060,7 @@ class X1337Scraper:
                 amount = int(match.group(1))
                 unit = match.group(2).lower()
                 
-                self.logger.debug(f"🔍 Amount: {amount}, Unit: {unit}")
+                self.detail_logger.debug("🔍 Amount: %s, Unit: %s", amount, unit)
                 
                 return self._calculate_date_from_ago(amount, unit)
             
@@ -807,7 +1072,7 @@ class X1337Scraper:
                 amount = int(match.group(1))
                 unit = match.group(2).lower()
                 
-                self.logger.debug(f"🔍 Cantidad (formato corto): {amount}, Unidad: {unit}")
+                self.detail_logger.debug("🔍 Cantidad (formato corto): %s, Unidad: %s", amount, unit)
                 
                 # Mapear unidades cortas a largas
                 unit_mapping = {
@@ -824,7 +1089,7 @@ class X1337Scraper:
                 full_unit = unit_mapping.get(unit, unit)
                 return self._calculate_date_from_ago(amount, full_unit)
             
-            self.logger.debug(f"❌ Could not process relative date: '{date_text}'")
+            self.detail_logger.debug("❌ Could not process relative date: '%s'", date_text)
             
         except Exception as e:
             self.logger.error(f"❌ Error processing relative date: {e}")
@@ -905,13 +1170,13 @@ class X1337Scraper:
         """
         try:
             if not description_div:
-                self.logger.debug("🔍 No description_div para extraer fecha")
+                self.detail_logger.debug("🔍 No description_div para extraer fecha")
                 return None
             
             text = description_div.get_text()
             html_text = str(description_div)
             
-            self.logger.debug(f"🔍 Searching for release date in text: {text[:200]}...")
+            self.detail_logger.debug("🔍 Searching for release date in text: %s...", text[:200])
             
             # Specific patterns to search for game release date
             html_patterns = [
@@ -932,7 +1197,7 @@ class X1337Scraper:
                 date_match = re.search(pattern, html_text, re.IGNORECASE)
                 if date_match:
                     date_str = date_match.group(1).strip()
-                    self.logger.debug(f"🔍 Date found in HTML: '{date_str}'")
+                    self.detail_logger.debug("🔍 Date found in HTML: '%s'", date_str)
                     
                     # Clean extra text
                     date_str = re.sub(r'\s*\([^)]*\)', '', date_str)  # Remove parentheses
@@ -955,7 +1220,7 @@ class X1337Scraper:
                     for fmt in date_formats:
                         try:
                             parsed_date = datetime.strptime(date_str, fmt)
-                            self.logger.debug(f"✅ Date parsed successfully: {parsed_date}")
+                            self.detail_logger.debug("✅ Date parsed successfully: %s", parsed_date)
                             return parsed_date
                         except ValueError:
                             continue
@@ -965,7 +1230,7 @@ class X1337Scraper:
                 date_match = re.search(pattern, text, re.IGNORECASE)
                 if date_match:
                     date_str = date_match.group(1).strip()
-                    self.logger.debug(f"🔍 Date found in text: '{date_str}'")
+                    self.detail_logger.debug("🔍 Date found in text: '%s'", date_str)
                     
                     # Clean extra text
                     date_str = re.sub(r'\s*\([^)]*\)', '', date_str)  # Remove parentheses
@@ -989,15 +1254,15 @@ class X1337Scraper:
                     for fmt in date_formats:
                         try:
                             parsed_date = datetime.strptime(date_str, fmt)
-                            self.logger.debug(f"✅ Fecha parseada exitosamente: {parsed_date}")
+                            self.detail_logger.debug("✅ Fecha parseada exitosamente: %s", parsed_date)
                             return parsed_date
                         except ValueError:
                             continue
             
-            self.logger.debug("❌ No valid release date found")
+            self.detail_logger.debug("❌ No valid release date found")
             
         except Exception as e:
-            self.logger.debug(f"Error extracting game release date: {e}")
+            self.detail_logger.debug("Error extracting game release date: %s", e)
         
         return None
     
@@ -1016,7 +1281,7 @@ class X1337Scraper:
             if not description_div:
                 return ""
             
-            self.logger.info("📝 Searching for description between <strong>Description: </strong>...")
+            self.detail_logger.debug("📝 Searching for description between <strong>Description: </strong>...")
             
             # Search for the <strong> element that contains "Description:"
             description_strong = description_div.find('strong', string=re.compile(r'Description\s*:', re.IGNORECASE))
@@ -1025,7 +1290,7 @@ class X1337Scraper:
                 self.logger.warning("⚠️ <strong>Description: </strong> not found")
                 return ""
             
-            self.logger.info("✅ Found <strong>Description: </strong>")
+            self.detail_logger.debug("✅ Found <strong>Description: </strong>")
             
             # Get all elements after the strong until the next strong
             description_text = ""
@@ -1034,7 +1299,7 @@ class X1337Scraper:
             while current_element:
                 # If we find another <strong>, stop
                 if current_element.name == 'strong':
-                    self.logger.info(f"🛑 Found next <strong>, stopping extraction")
+                    self.detail_logger.debug("🛑 Found next <strong>, stopping extraction")
                     break
                 
                 # If it's text, add it
@@ -1052,13 +1317,13 @@ class X1337Scraper:
             
             # If the description is empty, search for the next <strong> and its content
             if not description_text:
-                self.logger.info("📝 Empty description, searching for next <strong>...")
+                self.detail_logger.debug("📝 Empty description, searching for next <strong>...")
                 
                 # Search for the next <strong> after "Description:"
                 next_strong = description_strong.find_next_sibling('strong')
                 
                 if next_strong:
-                    self.logger.info(f"✅ Found next <strong>: {next_strong.get_text()}")
+                    self.detail_logger.debug("✅ Found next <strong>: %s", next_strong.get_text())
                     
                     # Get content until the next <strong>
                     next_description_text = ""
@@ -1067,7 +1332,7 @@ class X1337Scraper:
                     while current_element:
                         # If we find another <strong>, stop
                         if current_element.name == 'strong':
-                            self.logger.info(f"🛑 Found next <strong>, stopping extraction")
+                            self.detail_logger.debug("🛑 Found next <strong>, stopping extraction")
                             break
                         
                         # If it's text, add it
@@ -1084,16 +1349,16 @@ class X1337Scraper:
                     next_description_text = re.sub(r'\s+', ' ', next_description_text)
                     
                     if next_description_text:
-                        self.logger.info(f"📝 Next <strong> description extracted: {len(next_description_text)} characters")
-                        self.logger.info(f"📝 Content: {next_description_text[:100]}...")
+                        self.detail_logger.debug("📝 Next <strong> description extracted: %s characters", len(next_description_text))
+                        self.detail_logger.debug("📝 Content: %s...", next_description_text[:100])
                         return next_description_text
                     else:
                         self.logger.warning("⚠️ The next <strong> also has empty content")
                 else:
                     self.logger.warning("⚠️ No next <strong> found")
             
-            self.logger.info(f"📝 Description extracted: {len(description_text)} characters")
-            self.logger.info(f"📝 Content: {description_text[:100]}...")
+            self.detail_logger.debug("📝 Description extracted: %s characters", len(description_text))
+            self.detail_logger.debug("📝 Content: %s...", description_text[:100])
             
             return description_text
             
@@ -1103,19 +1368,69 @@ class X1337Scraper:
     
 
     
+    @staticmethod
+    def _is_placeholder_image(src: str) -> bool:
+        """Whether an image URL is a lazy-loading placeholder rather than the real image"""
+        return not src or src.startswith('data:') or 'profile-load' in src
+    
+    def _resolve_image_url(self, img) -> str:
+        """
+        Get the real URL of an image, including lazily loaded ones
+        
+        Lazy loaders leave a placeholder in src and keep the real URL in a data
+        attribute or a srcset until the image scrolls into view.
+        
+        Args:
+            img: <img> tag
+            
+        Returns:
+            str: Absolute image URL (the placeholder src if nothing better is found)
+        """
+        for attribute in LAZY_IMAGE_ATTRIBUTES:
+            value = (img.get(attribute) or '').strip()
+            if not self._is_placeholder_image(value):
+                return urljoin(self.base_url, value)
+        
+        for attribute in LAZY_SRCSET_ATTRIBUTES:
+            # The first candidate matches src (thumbnails are upscaled in the frontend)
+            candidates = (img.get(attribute) or '').strip().split(',')
+            value = candidates[0].split()[0] if candidates[0].strip() else ''
+            if not self._is_placeholder_image(value):
+                return urljoin(self.base_url, value)
+        
+        src = (img.get('src') or '').strip()
+        return urljoin(self.base_url, src) if src else ''
+    
+    def _description_images(self, description_div) -> List:
+        """
+        Get the images of a description, including <noscript> fallbacks
+        
+        Args:
+            description_div: Description element
+            
+        Returns:
+            List: <img> tags in document order
+        """
+        images = description_div.find_all('img')
+        for noscript in description_div.find_all('noscript'):
+            # Parsers that keep <noscript> as raw text hide its images from find_all
+            if noscript.find('img') is None and '<img' in noscript.get_text():
+                images.extend(BeautifulSoup(noscript.get_text(), 'html.parser').find_all('img'))
+        return images
+    
     def _extract_game_cover_image(self, description_div):
         """Extract game cover image URL from the description"""
         try:
-            # Search for all images
-            all_images = description_div.find_all('img')
-            self.logger.info(f"🔍 Searching for cover among {len(all_images)} images")
+            # Search for all images, including lazily loaded ones
+            all_images = self._description_images(description_div)
+            self.image_logger.debug("🔍 Searching for cover among %s images", len(all_images))
             
             for i, img in enumerate(all_images):
-                src = img.get('src', '')
+                src = self._resolve_image_url(img)
                 alt = img.get('alt', '').lower()
                 
-                self.logger.info(f"   Evaluating image {i+1}: {src}")
-                self.logger.info(f"   Alt text: {alt}")
+                self.image_logger.debug("   Evaluating image %s: %s", i+1, src)
+                self.image_logger.debug("   Alt text: %s", alt)
                 
                 # Filter valid images for covers - only legitimate domains
                 if (src and 
@@ -1127,10 +1442,10 @@ class X1337Scraper:
                     'limeiptv.to' not in src and  # Skip advertising
                     any(domain in src for domain in ['imageban.ru', 'imgur.com', 'postimg.cc', 'imgbb.com', 'fastpic.ru'])):
                     
-                    self.logger.info(f"✅ Cover found: {src}")
+                    self.image_logger.debug("✅ Cover found: %s", src)
                     return src
                 else:
-                    self.logger.info(f"❌ Image rejected: {src}")
+                    self.image_logger.debug("❌ Image rejected: %s", src)
             
             self.logger.warning("⚠️ No valid cover found")
             return ""
@@ -1142,16 +1457,18 @@ class X1337Scraper:
     def _extract_screenshots(self, description_div, cover_image_url=""):
         """Extract screenshot URLs from the description"""
         try:
-            # Search for all images
-            all_images = description_div.find_all('img')
-            self.logger.info(f"🔍 Searching for screenshots among {len(all_images)} images")
+            # Search for all images, including lazily loaded ones
+            all_images = self._description_images(description_div)
+            self.image_logger.debug("🔍 Searching for screenshots among %s images", len(all_images))
             
             screenshots = []
             for i, img in enumerate(all_images):
-                src = img.get('src', '')
+                src = self._resolve_image_url(img)
+                if src in screenshots:
+                    continue
                 alt = img.get('alt', '').lower()
                 
-                self.logger.info(f"   Evaluating screenshot {i+1}: {src}")
+                self.image_logger.debug("   Evaluating screenshot %s: %s", i+1, src)
                 
                 # Filter valid images for screenshots - skip advertising
                 if (src and 
@@ -1163,12 +1480,12 @@ class X1337Scraper:
                     any(domain in src for domain in ['riotpixels.net', 'imgur.com', 'postimg.cc', 'imgbb.com', 'imageban.ru', 'fastpic.ru'])):
                     
                     # Save original URL in 240p - conversion to 720p will be done in frontend
-                    self.logger.info(f"✅ Screenshot found: {src}")
+                    self.image_logger.debug("✅ Screenshot found: %s", src)
                     screenshots.append(src)
                 else:
-                    self.logger.info(f"❌ Screenshot rejected: {src}")
+                    self.image_logger.debug("❌ Screenshot rejected: %s", src)
             
-            self.logger.info(f"📸 Total screenshots found: {len(screenshots)}")
+            self.image_logger.debug("📸 Total screenshots found: %s", len(screenshots))
             return screenshots
             
         except Exception as e:
@@ -1282,19 +1599,19 @@ class X1337Scraper:
             str: Torrent size (e.g: "8.0 GB")
         """
         try:
-            self.logger.info("🔍 Starting size extraction...")
+            self.detail_logger.debug("🔍 Starting size extraction...")
             
             # Method 1: Search in specific information table
             info_tables = soup.find_all(['table', 'ul', 'div'], class_=['torrent-info', 'list', 'info-table'])
             for table in info_tables:
                 text = table.get_text()
-                self.logger.info(f"🔍 Checking table: {text[:100]}...")
+                self.detail_logger.debug("🔍 Checking table: %s...", text[:100])
                 
                 # Search for "Total size", "Size", etc.
                 size_match = re.search(r'(?:Total\s+size|Size)\s*:?\s*([0-9.]+\s*[KMGT]B)', text, re.IGNORECASE)
                 if size_match:
                     size = size_match.group(1)
-                    self.logger.info(f"✅ Size found in table: {size}")
+                    self.detail_logger.debug("✅ Size found in table: %s", size)
                     return size
             
             # Method 2: Search in specific 1337x metadata
@@ -1305,12 +1622,12 @@ class X1337Scraper:
                 size_match = re.search(r'^(\d+(?:\.\d+)?\s*[KMGT]B)$', text, re.IGNORECASE)
                 if size_match:
                     size = size_match.group(1)
-                    self.logger.debug(f"✅ Size found in cell: {size}")
+                    self.detail_logger.debug("✅ Size found in cell: %s", size)
                     return size
             
             # Method 3: Search in entire page with more specific patterns
             page_text = soup.get_text()
-            self.logger.info(f"🔍 Searching in complete text ({len(page_text)} chars)...")
+            self.detail_logger.debug("🔍 Searching in complete text (%s chars)...", len(page_text))
             
             # Specific patterns for 1337x
             size_patterns = [
@@ -1322,7 +1639,7 @@ class X1337Scraper:
             
             for i, pattern in enumerate(size_patterns):
                 matches = re.findall(pattern, page_text, re.IGNORECASE)
-                self.logger.debug(f"🔍 Pattern {i+1}: found {len(matches)} matches")
+                self.detail_logger.debug("🔍 Pattern %s: found %s matches", i+1, len(matches))
                 
                 if matches:
                     for match in matches:
@@ -1334,25 +1651,25 @@ class X1337Scraper:
                                 size_value = float(size_match.group(1))
                                 unit = size_match.group(2).upper()
                                 
-                                self.logger.debug(f"🔍 Evaluating: {size_value} {unit}")
+                                self.detail_logger.debug("🔍 Evaluating: %s %s", size_value, unit)
                                 
                                 # Filter reasonable sizes for games
                                 if unit == 'GB' and 0.1 <= size_value <= 100:
                                     result = f"{size_value} {unit}"
-                                    self.logger.debug(f"✅ Valid size found: {result}")
+                                    self.detail_logger.debug("✅ Valid size found: %s", result)
                                     return result
                                 elif unit == 'MB' and 100 <= size_value <= 20000:
                                     result = f"{size_value} {unit}"
-                                    self.logger.debug(f"✅ Valid size found: {result}")
+                                    self.detail_logger.debug("✅ Valid size found: %s", result)
                                     return result
                                 elif unit == 'TB' and 0.5 <= size_value <= 10:
                                     result = f"{size_value} {unit}"
-                                    self.logger.debug(f"✅ Valid size found: {result}")
+                                    self.detail_logger.debug("✅ Valid size found: %s", result)
                                     return result
                                 else:
-                                    self.logger.debug(f"❌ Size out of range: {size_value} {unit}")
+                                    self.detail_logger.debug("❌ Size out of range: %s %s", size_value, unit)
                         except (ValueError, AttributeError) as e:
-                            self.logger.debug(f"❌ Error processing match: {e}")
+                            self.detail_logger.debug("❌ Error processing match: %s", e)
                             continue
             
             self.logger.warning("⚠️ No valid size found")
@@ -1369,20 +1686,17 @@ class X1337Scraper:
     def stop(self):
         """Stop the scraper"""
         self._is_running = False
-        if self.driver:
+        if self.driver_pool:
             try:
-                self.driver.quit()
+                self.driver_pool.close()
             except:
                 pass 
     
     def close(self):
-        """Close the Selenium driver and clean up resources"""
+        """Close the Selenium drivers and clean up resources (the pool starts new ones on demand)"""
         try:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
-                if hasattr(self, 'logger'):
-                    self.logger.info("🔒 Selenium driver closed")
+            if getattr(self, 'driver_pool', None):
+                self.driver_pool.close()
         except Exception as e:
             if hasattr(self, 'logger'):
                 self.logger.error(f"❌ Error closing Selenium: {e}")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Load test for FitGirl Downloader Web
+Keeps HTTP clients and Socket.IO connections busy against a running server
+and reports throughput, latency percentiles and errors
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+
+import requests
+
+try:
+    import socketio
+except ImportError:  # python-socketio[client] is only needed for --websockets
+    socketio = None
+
+ENDPOINTS = [
+    '/api/releases?page=1&limit=50',
+    '/api/statistics',
+    '/api/sync/status',
+    '/api/config',
+]
+
+
+def http_client(base_url: str, deadline: float, latencies: list, errors: list, lock: threading.Lock):
+    """Issue requests in a loop until the deadline"""
+    session = requests.Session()
+    session.headers['Accept-Encoding'] = 'gzip, br'
+    i = 0
+    while time.time() < deadline:
+        url = base_url + ENDPOINTS[i % len(ENDPOINTS)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            response = session.get(url, timeout=30)
+            elapsed = time.perf_counter() - start
+            with lock:
+                if response.status_code == 200:
+                    latencies.append(elapsed)
+                else:
+                    errors.append(response.status_code)
+        except requests.RequestException as e:
+            with lock:
+                errors.append(type(e).__name__)
+
+
+def websocket_client(base_url: str, deadline: float, connected: list, failed: list, lock: threading.Lock):
+    """Hold a Socket.IO connection open until the deadline"""
+    client = socketio.Client(reconnection=False)
+    try:
+        # The default 1s namespace handshake timeout is too short for a loaded server
+        client.connect(base_url, transports=['websocket'], wait_timeout=30)
+        with lock:
+            connected.append(client.sid)
+        while time.time() < deadline and client.connected:
+            client.emit('get_sync_status')
+            time.sleep(1)
+        if not client.connected:
+            with lock:
+                failed.append('dropped')
+    except Exception as e:
+        with lock:
+            failed.append(type(e).__name__)
+    finally:
+        if client.connected:
+            client.disconnect()
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test a running FitGirl Downloader server')
+    parser.add_argument('--url', default='http://localhost:2121', help='Server base URL')
+    parser.add_argument('--clients', type=int, default=50, help='Concurrent HTTP clients')
+    parser.add_argument('--websockets', type=int, default=0, help='Concurrent Socket.IO connections')
+    parser.add_argument('--duration', type=int, default=30, help='Test duration in seconds')
+    args = parser.parse_args()
+
+    if args.websockets and socketio is None:
+        print("❌ --websockets requires: pip install \"python-socketio[client]\"")
+        sys.exit(1)
+
+    latencies, errors, connected, ws_failed = [], [], [], []
+    lock = threading.Lock()
+    deadline = time.time() + args.duration
+
+    threads = [threading.Thread(target=websocket_client, args=(args.url, deadline, connected, ws_failed, lock), daemon=True)
+               for _ in range(args.websockets)]
+    threads += [threading.Thread(target=http_client, args=(args.url, deadline, latencies, errors, lock), daemon=True)
+                for _ in range(args.clients)]
+
+    print(f"🚀 {args.clients} HTTP clients, {args.websockets} WebSocket clients, {args.duration}s against {args.url}")
+    started = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=args.duration + 60)
+    elapsed = time.time() - started
+
+    print(f"📊 Requests:   {len(latencies)} ok, {len(errors)} errors")
+    print(f"📊 Throughput: {len(latencies) / elapsed:.1f} req/s")
+    if latencies:
+        print(f"📊 Latency:    mean {statistics.mean(latencies) * 1000:.1f} ms, "
+              f"p50 {percentile(latencies, 50) * 1000:.1f} ms, "
+              f"p95 {percentile(latencies, 95) * 1000:.1f} ms, "
+              f"p99 {percentile(latencies, 99) * 1000:.1f} ms")
+    if args.websockets:
+        print(f"📊 WebSockets: {len(connected)}/{args.websockets} connected, "
+              f"{len(connected) - ws_failed.count('dropped')} held to the end")
+        if ws_failed:
+            print(f"⚠️ WebSocket failure sample: {ws_failed[:5]}")
+    if errors:
+        print(f"⚠️ Error sample: {errors[:5]}")
+
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,24 +14,25 @@ if __name__ == '__main__':
     print("🚀 Starting FitGirl Downloader Web...")
     print("⏹️  Press Ctrl+C to stop the server")
     print()
-    
-    # Import and run the Flask application with SocketIO
-    from app import app, socketio
-    
-    # Configure for Docker environment
-    import os
-    debug_mode = os.getenv('FLASK_DEBUG', 'false').lower() == 'true'
-    
-    # Load configuration from config.yaml
+
+    # Load configuration from config.yaml before importing the application,
+    # cooperative servers need to patch the standard library first
     from backend.settings_manager import SettingsManager
+    from backend.server_runner import (resolve_async_mode, apply_monkey_patch, build_run_options,
+                                       configure_access_log)
     settings_manager = SettingsManager()
     settings_manager.load_settings()
-    
-    # Use configuration from settings
-    host = settings_manager.settings.web_host
-    port = settings_manager.settings.web_port
-    debug = settings_manager.settings.debug_mode
-    
-    print(f"📱 Open your browser at: http://localhost:{port}")
-    
-    socketio.run(app, host=host, port=port, debug=debug, allow_unsafe_werkzeug=True) 
\ No newline at end of file
+
+    async_mode = resolve_async_mode(settings_manager.settings)
+    apply_monkey_patch(async_mode)
+
+    # Import and run the Flask application with SocketIO
+    from app import app, socketio
+
+    options = build_run_options(settings_manager.settings, async_mode)
+    configure_access_log(settings_manager.settings)
+
+    print(f"⚙️  Server mode: {settings_manager.settings.server_mode} ({async_mode})")
+    print(f"📱 Open your browser at: http://localhost:{options['port']}")
+
+    socketio.run(app, **options)
@@ -17,6 +17,13 @@ class FitGirlDownloader {
         this.socket = null;
         this.syncInProgress = false;
         
+        // Background jobs started from this tab (job id -> release id)
+        this.pendingJobs = {};
+        // Finished jobs seen before their submit request returned
+        this.finishedJobs = {};
+        // Submit requests waiting for their job id
+        this.submittingJobs = 0;
+        
         // Screenshot navigation
         this.currentScreenshots = [];
         this.currentScreenshotIndex = 0;
@@ -32,7 +39,10 @@ class FitGirlDownloader {
      * Initialize WebSocket connection
      */
     initializeWebSocket() {
-        this.socket = io();
+        // Subscribe on (re)connect so the server only sends events this view uses
+        this.socket = io({
+            auth: (cb) => cb(this.getSubscription())
+        });
         
         this.socket.on('connect', () => {
             console.log('🔌 WebSocket connected');
@@ -49,11 +59,120 @@ class FitGirlDownloader {
         
         // Listen for new releases added in real-time
         this.socket.on('new_release_added', (data) => {
-            if (data.success && data.release) {
-                this.addNewReleaseToView(data.release);
-                console.log('🆕 New release added in real-time:', data.release.title);
+            if (data.success && data.releases && data.releases.length) {
+                this.addNewReleaseToView(data.releases, data.total_releases);
+                console.log(`🆕 ${data.releases.length} new releases added in real-time`);
             }
         });
+        
+        // Status changes made from other tabs or clients
+        this.socket.on('release_status_changed', (change) => {
+            this.handleReleaseStatusChanged(change);
+        });
+        
+        // Releases updated in place (e.g. images loaded by the backfill)
+        this.socket.on('release_updated', (data) => {
+            this.handleReleaseUpdated(data.release);
+        });
+        
+        // Background job progress and results (e.g. single release sync)
+        this.socket.on('job_update', (job) => {
+            this.handleJobUpdate(job);
+        });
+    }
+
+    /**
+     * Channels and status filter this view subscribes to
+     */
+    getSubscription() {
+        return {
+            channels: ['sync_progress', 'new_releases', 'release_status', 'release_updates', 'jobs'],
+            status: this.currentStatus || null
+        };
+    }
+
+    /**
+     * Update the server-side subscription after the status filter changes
+     */
+    updateSubscription() {
+        if (this.socket && this.socket.connected) {
+            this.socket.emit('subscribe', this.getSubscription());
+        }
+    }
+
+    /**
+     * Reflect a status change made elsewhere on the visible card
+     */
+    handleReleaseStatusChanged(change) {
+        const card = document.querySelector(`[data-release-id="${change.release_id}"]`);
+        
+        if (this.currentStatus && change.status !== this.currentStatus) {
+            // The release no longer matches the filter
+            if (card) {
+                card.remove();
+            }
+            return;
+        }
+        
+        if (card) {
+            const statusElement = card.querySelector('.release-status');
+            if (statusElement) {
+                statusElement.className = `release-status status-${change.status.toLowerCase()}`;
+                statusElement.textContent = this.getStatusText(change.status);
+            }
+        }
+    }
+
+    /**
+     * Replace the visible card of a release updated in place
+     */
+    handleReleaseUpdated(release) {
+        const card = release && document.querySelector(`[data-release-id="${release.id}"]`);
+        if (card) {
+            card.replaceWith(this.createReleaseCard(release));
+        }
+    }
+
+    /**
+     * Handle a background job state change
+     */
+    handleJobUpdate(job) {
+        if (job.type !== 'release_resync') {
+            return;
+        }
+        
+        if (!(job.id in this.pendingJobs)) {
+            // Only a job submitted by a request still in flight can be ours
+            if (this.submittingJobs > 0 && (job.status === 'completed' || job.status === 'error')) {
+                this.finishedJobs[job.id] = job;
+            }
+            return;
+        }
+        
+        const releaseId = this.pendingJobs[job.id];
+        
+        if (job.status === 'completed') {
+            delete this.pendingJobs[job.id];
+            this.showToast('✅ Release synced successfully', 'success');
+            
+            // Update the card with new data if provided
+            if (job.result && job.result.release) {
+                const card = document.querySelector(`[data-release-id="${releaseId}"]`);
+                if (card) {
+                    // Replace the card with updated data
+                    card.replaceWith(this.createReleaseCard(job.result.release));
+                } else {
+                    console.warn('⚠️ Card not found for release ID:', releaseId);
+                }
+            }
+            
+            // Update statistics
+            this.loadStatistics();
+        } else if (job.status === 'error') {
+            delete this.pendingJobs[job.id];
+            console.error('❌ Release sync failed:', job.error);
+            this.showToast('Error syncing release: ' + job.error, 'error');
+        }
     }
 
     /**
@@ -160,32 +279,34 @@ class FitGirlDownloader {
     /**
      * Add a new release to the view in real-time
      */
-    addNewReleaseToView(release) {
+    addNewReleaseToView(releases, totalReleases) {
         const releasesGrid = document.getElementById('releasesGrid');
         
-        // Create the new release card
-        const releaseCard = this.createReleaseCard(release);
+        // Build the whole batch off-DOM, keeping the batch order at the top of the list
+        const fragment = document.createDocumentFragment();
+        releases.forEach(release => fragment.appendChild(this.createReleaseCard(release)));
+        
+        // Add the new releases to the beginning of the list (most recent first)
+        releasesGrid.insertBefore(fragment, releasesGrid.firstChild);
         
-        // Add the new release to the beginning of the list (most recent first)
-        if (releasesGrid.firstChild) {
-            releasesGrid.insertBefore(releaseCard, releasesGrid.firstChild);
+        // Show a single toast notification per batch
+        if (releases.length === 1) {
+            this.showToast(`New release added: ${releases[0].title}`, 'success');
         } else {
-            releasesGrid.appendChild(releaseCard);
+            this.showToast(`${releases.length} new releases added`, 'success');
         }
         
-        // Show toast notification
-        this.showToast(`New release added: ${release.title}`, 'success');
-        
         // Update counters if they are visible
-        this.updateReleaseCounters();
+        this.updateReleaseCounters(totalReleases);
     }
 
     /**
      * Update release counters in the UI
      */
-    updateReleaseCounters() {
-        const releasesGrid = document.getElementById('releasesGrid');
-        const totalReleases = releasesGrid.children.length;
+    updateReleaseCounters(totalReleases) {
+        if (totalReleases === undefined) {
+            totalReleases = document.getElementById('releasesGrid').children.length;
+        }
         
         // Update counter in statistics if visible
         const totalReleasesElement = document.getElementById('totalReleases');
@@ -281,6 +402,7 @@ class FitGirlDownloader {
         // Filters
         document.getElementById('statusFilter').addEventListener('change', (e) => {
             this.currentStatus = e.target.value;
+            this.updateSubscription();
             this.resetAndReload();
         });
 
@@ -921,43 +1043,38 @@ class FitGirlDownloader {
             const url = `/api/releases/${releaseId}/sync`;
             console.log('🌐 Making request to:', url);
 
-            const response = await fetch(url, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                }
-            });
+            let data;
+            this.submittingJobs++;
+            try {
+                const response = await fetch(url, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    }
+                });
 
-            console.log('📥 Sync response received:', response.status, response.statusText);
-            
-            if (!response.ok) {
-                console.error('❌ HTTP Error:', response.status, response.statusText);
-                this.showToast(`HTTP Error: ${response.status}`, 'error');
-                return;
+                console.log('📥 Sync response received:', response.status, response.statusText);
+                
+                data = await response.json();
+                console.log('📋 Sync response data:', data);
+            } finally {
+                this.submittingJobs--;
+            }
+
+            const finishedJob = data.success ? this.finishedJobs[data.job_id] : null;
+            if (this.submittingJobs === 0) {
+                // Jobs seen meanwhile that no request claimed belong to other tabs
+                this.finishedJobs = {};
+            } else if (finishedJob) {
+                delete this.finishedJobs[data.job_id];
             }
-            
-            const data = await response.json();
-            console.log('📋 Sync response data:', data);
 
             if (data.success) {
-                this.showToast('✅ Release synced successfully', 'success');
-                
-                // Update the card with new data if provided
-                if (data.release) {
-                    const card = document.querySelector(`[data-release-id="${releaseId}"]`);
-                    console.log('🔍 Found card:', card);
-                    if (card) {
-                        // Replace the card with updated data
-                        const newCard = this.createReleaseCard(data.release);
-                        card.replaceWith(newCard);
-                        console.log('✅ Card updated successfully');
-                    } else {
-                        console.warn('⚠️ Card not found for release ID:', releaseId);
-                    }
+                // The result arrives through the 'job_update' WebSocket event
+                this.pendingJobs[data.job_id] = releaseId;
+                if (finishedJob) {
+                    this.handleJobUpdate(finishedJob);
                 }
-                
-                // Update statistics
-                this.loadStatistics();
             } else {
                 console.error('❌ API returned error:', data.error);
                 this.showToast('Error syncing release: ' + data.error, 'error');